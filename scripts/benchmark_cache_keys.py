@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the computation of the cache keys of chart data queries.
+
+Simulates loading a dashboard: the query context of each chart computes the cache
+key of its queries several times, eg. to look up the result of the query and of its
+time comparisons, and its result before post processing. Compares the memoized
+``QueryContextProcessor.query_cache_key`` against its previous implementation,
+which computed the RLS filters, the keys of the Jinja templates and the hash of the
+query object on every call, and checks that both return the same keys.
+
+Requires an initialized metadata database, for the RLS filters.
+
+    python scripts/benchmark_cache_keys.py --charts 60 --calls 4
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+
+X_AXIS = {
+    "label": "ds",
+    "sqlExpression": "ds",
+    "columnType": "BASE_AXIS",
+    "timeGrain": "P1D",
+}
+
+
+def generate_query_contexts(charts: int) -> list[QueryContext]:
+    # pylint: disable=import-outside-toplevel
+    from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+
+    database = Database(database_name="examples", sqlalchemy_uri="sqlite://")
+    query_contexts = []
+    for i in range(charts):
+        # a third of the datasets are virtual, with templates adding cache keys
+        datasource = SqlaTable(
+            id=i,
+            table_name=f"table_{i}",
+            sql=(
+                "SELECT * FROM sales WHERE owner = '{{ current_username() }}'"
+                if i % 3 == 0
+                else None
+            ),
+            columns=[
+                TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+                *[TableColumn(column_name=f"dim_{j}", type="TEXT") for j in range(20)],
+                TableColumn(column_name="amount", type="FLOAT"),
+            ],
+            metrics=[
+                SqlMetric(metric_name="count", expression="COUNT(*)"),
+                SqlMetric(metric_name="total", expression="SUM(amount)"),
+            ],
+            main_dttm_col="ds",
+            database=database,
+        )
+        query = QueryObject(
+            datasource=datasource,
+            columns=[X_AXIS, f"dim_{i % 20}", f"dim_{(i + 1) % 20}"],
+            metrics=["count", "total"],
+            filters=[
+                {"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last quarter"},
+                {"col": f"dim_{(i + 2) % 20}", "op": "IN", "val": ["a", "b", "c"]},
+            ],
+            extras={"where": "amount > 0"},
+            orderby=[("total", False)],
+            row_limit=10000,
+            time_offsets=["1 year ago"],
+            post_processing=[
+                {
+                    "operation": "pivot",
+                    "options": {
+                        "index": ["ds"],
+                        "columns": [f"dim_{i % 20}"],
+                        "aggregates": {"count": {"operator": "mean"}},
+                    },
+                },
+                {"operation": "flatten"},
+            ],
+        )
+        query_contexts.append(
+            QueryContext(
+                datasource=datasource,
+                queries=[query],
+                slice_=None,
+                form_data={},
+                result_type=ChartDataResultType.FULL,
+                result_format=ChartDataResultFormat.JSON,
+                cache_values={},
+            )
+        )
+    return query_contexts
+
+
+def legacy_query_cache_key(query_context: QueryContext, query_obj: QueryObject) -> str:
+    """The implementation computing the cache key on every call."""
+    # pylint: disable=import-outside-toplevel
+    from superset import security_manager
+
+    datasource = query_context.datasource
+    return query_obj.cache_key(
+        datasource=datasource.uid,
+        extra_cache_keys=datasource.get_extra_cache_keys(query_obj.to_dict()),
+        rls=security_manager.get_rls_cache_key(datasource),
+        changed_on=datasource.changed_on,
+    )
+
+
+def measure(
+    func: Callable[[QueryContext, QueryObject], str],
+    query_contexts: list[QueryContext],
+    calls: int,
+) -> tuple[float, list[str]]:
+    keys = []
+    start = time.perf_counter()
+    for query_context in query_contexts:
+        for query_obj in query_context.queries:
+            for _ in range(calls):
+                keys.append(func(query_context, query_obj))
+    return time.perf_counter() - start, keys
+
+
+@click.command()
+@click.option("--charts", default=60, help="Number of charts of the dashboard.")
+@click.option("--calls", default=4, help="Cache key computations per query.")
+@click.option("--loads", default=5, help="Number of times the dashboard is loaded.")
+def main(charts: int, calls: int, loads: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context(), app.test_request_context():
+        # pylint: disable=import-outside-toplevel
+        from flask_appbuilder.security.sqla.models import User
+
+        from superset.utils.core import override_user
+
+        with override_user(User(username="admin")):
+            print(f"Dashboard of {charts} charts, {calls} cache keys per query\n")
+            print(f"{'load':<8}{'legacy (ms)':>14}{'memoized (ms)':>16}{'speedup':>10}")
+            legacy_total = memoized_total = 0.0
+            for load in range(loads):
+                # each load builds new query contexts, like requests do
+                legacy_time, expected = measure(
+                    legacy_query_cache_key, generate_query_contexts(charts), calls
+                )
+                memoized_time, keys = measure(
+                    lambda query_context, query_obj: query_context.query_cache_key(
+                        query_obj
+                    ),
+                    generate_query_contexts(charts),
+                    calls,
+                )
+                assert keys == expected, "memoized cache keys differ"
+                legacy_total += legacy_time
+                memoized_total += memoized_time
+                print(
+                    f"{load + 1:<8}{legacy_time * 1000:>14.1f}"
+                    f"{memoized_time * 1000:>16.1f}"
+                    f"{legacy_time / memoized_time:>9.1f}x"
+                )
+            print(
+                f"\n{'total':<8}{legacy_total * 1000:>14.1f}"
+                f"{memoized_total * 1000:>16.1f}"
+                f"{legacy_total / memoized_total:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
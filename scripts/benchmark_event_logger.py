@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the latency added to requests by the event logger.
+
+Serves requests to an endpoint which logs an event, like the API endpoints do, with
+``DBEventLogger``, which commits the logs of each request, and with
+``AsyncDBEventLogger``, which writes them in batches from a background thread, and
+reports the percentiles of the latencies of the requests. Checks that all the logs
+were written, and deletes them afterwards.
+
+Requires an initialized metadata database, eg. SQLite.
+
+    python scripts/benchmark_event_logger.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+    from superset.utils.log import AbstractEventLogger
+
+ACTION = "benchmark_event_logger"
+
+
+def add_endpoint(app: Flask, event_loggers: dict[str, AbstractEventLogger]) -> None:
+    def view(name: str) -> str:
+        event_loggers[name].log_with_context(action=ACTION, log_to_statsd=False)
+        return "OK"
+
+    app.add_url_rule("/benchmark_event_logger/<name>", "benchmark_event_logger", view)
+
+
+def measure(app: Flask, name: str, requests: int) -> list[float]:
+    client = app.test_client()
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(f"/benchmark_event_logger/{name}")
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return latencies
+
+
+def percentile(latencies: list[float], percent: float) -> float:
+    latencies = sorted(latencies)
+    return latencies[min(int(len(latencies) * percent / 100), len(latencies) - 1)]
+
+
+def count_logs() -> int:
+    # pylint: disable=import-outside-toplevel
+    from superset import db
+    from superset.models.core import Log
+
+    return db.session.query(Log).filter_by(action=ACTION).count()
+
+
+def delete_logs() -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset import db
+    from superset.models.core import Log
+
+    db.session.query(Log).filter_by(action=ACTION).delete()
+    db.session.commit()
+
+
+@click.command()
+@click.option("--requests", default=2000, help="Number of requests per logger.")
+def main(requests: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.log import (
+            AbstractEventLogger,
+            AsyncDBEventLogger,
+            DBEventLogger,
+        )
+
+        delete_logs()
+        async_event_logger = AsyncDBEventLogger()
+        event_loggers: dict[str, AbstractEventLogger] = {
+            "DBEventLogger": DBEventLogger(),
+            "AsyncDBEventLogger": async_event_logger,
+        }
+        add_endpoint(app, event_loggers)
+        results = {name: measure(app, name, requests) for name in event_loggers}
+        async_event_logger.shutdown()
+        try:
+            assert count_logs() == 2 * requests, "logs are missing"
+        finally:
+            delete_logs()
+
+        print(f"{requests} requests logging an event\n")
+        print(f"{'logger':<20}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+        for name, latencies in results.items():
+            print(
+                f"{name:<20}{percentile(latencies, 50) * 1000:>10.2f}"
+                f"{percentile(latencies, 99) * 1000:>10.2f}"
+                f"{max(latencies) * 1000:>10.2f}"
+            )
+        print(f"\ndropped by AsyncDBEventLogger: {async_event_logger.dropped}")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
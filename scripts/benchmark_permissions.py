@@ -0,0 +1,215 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the permission checks of the security manager.
+
+Creates a synthetic catalog of datasets and roles, each role granting access to some
+of the datasets, and simulates loading a dashboard: each chart checks several
+permissions of the user, eg. the access to all datasources, to its database, schema
+and dataset. Compares the cached ``SupersetSecurityManager._has_view_access``
+against the FAB implementation, which queries the metadata database for every
+check, and checks that both return the same results. Each load is a new request,
+served from the cache configured by ``PERMISSIONS_CACHE_TIMEOUT``.
+
+Requires an initialized metadata database. The synthetic rows are deleted afterwards.
+
+    python scripts/benchmark_permissions.py --datasets 500 --roles 200 --charts 40
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+PREFIX = "bench_"
+
+
+def create_catalog(datasets: int, roles: int, user_roles: int) -> object:
+    # pylint: disable=import-outside-toplevel
+    from superset import db, security_manager
+
+    def permission_view(permission: object, view_name: str) -> object:
+        view_menu = security_manager.viewmenu_model(name=f"{PREFIX}{view_name}")
+        return security_manager.permissionview_model(
+            permission=permission, view_menu=view_menu
+        )
+
+    datasource_access = security_manager.add_permission("datasource_access")
+    schema_access = security_manager.add_permission("schema_access")
+    database_access = security_manager.add_permission("database_access")
+    dataset_pvms = [
+        permission_view(datasource_access, f"[db].[table_{i}](id:{i})")
+        for i in range(datasets)
+    ]
+    schema_pvms = [
+        permission_view(schema_access, f"[db].[schema_{i}]") for i in range(10)
+    ]
+    database_pvm = permission_view(database_access, "[db].(id:1)")
+
+    rng = random.Random(42)
+    role_models = [
+        security_manager.role_model(
+            name=f"{PREFIX}role_{i}",
+            permissions=[
+                *rng.sample(dataset_pvms, 20),
+                rng.choice(schema_pvms),
+                *([database_pvm] if i % 10 == 0 else []),
+            ],
+        )
+        for i in range(roles)
+    ]
+    user = security_manager.user_model(
+        username=f"{PREFIX}user",
+        first_name="bench",
+        last_name="user",
+        email="bench_user@example.com",
+        roles=rng.sample(role_models, user_roles),
+    )
+    db.session.add_all([*role_models, user])
+    db.session.commit()
+    return user
+
+
+def delete_catalog() -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset import db, security_manager
+
+    session = db.session
+    for model, column in (
+        (security_manager.user_model, security_manager.user_model.username),
+        (security_manager.role_model, security_manager.role_model.name),
+    ):
+        for row in session.query(model).filter(column.like(f"{PREFIX}%")):
+            session.delete(row)
+    session.flush()
+    view_menus = (
+        session.query(security_manager.viewmenu_model)
+        .filter(security_manager.viewmenu_model.name.like(f"{PREFIX}%"))
+        .all()
+    )
+    for view_menu in view_menus:
+        for pvm in session.query(security_manager.permissionview_model).filter_by(
+            view_menu=view_menu
+        ):
+            session.delete(pvm)
+        session.delete(view_menu)
+    session.commit()
+
+
+def generate_checks(datasets: int, charts: int) -> list[tuple[str, str]]:
+    rng = random.Random(0)
+    checks = []
+    for i in rng.sample(range(datasets), charts):
+        checks += [
+            ("all_datasource_access", "all_datasource_access"),
+            ("all_database_access", "all_database_access"),
+            ("database_access", f"{PREFIX}[db].(id:1)"),
+            ("schema_access", f"{PREFIX}[db].[schema_{i % 10}]"),
+            ("datasource_access", f"{PREFIX}[db].[table_{i}](id:{i})"),
+        ]
+    return checks
+
+
+def measure(
+    app: Flask,
+    func: Callable[[object, str, str], bool],
+    user: object,
+    checks: list[tuple[str, str]],
+) -> tuple[float, list[bool]]:
+    with app.test_request_context():
+        start = time.perf_counter()
+        results = [
+            func(user, permission_name, view_name)
+            for permission_name, view_name in checks
+        ]
+        return time.perf_counter() - start, results
+
+
+@click.command()
+@click.option("--datasets", default=500, help="Number of datasets of the catalog.")
+@click.option("--roles", default=200, help="Number of roles of the catalog.")
+@click.option("--user-roles", default=5, help="Number of roles of the user.")
+@click.option("--charts", default=40, help="Number of charts of the dashboard.")
+@click.option("--loads", default=5, help="Number of times the dashboard is loaded.")
+def main(datasets: int, roles: int, user_roles: int, charts: int, loads: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=import-outside-toplevel
+        from flask_appbuilder.security.sqla.manager import SecurityManager
+        from flask_caching import Cache
+
+        from superset import security_manager
+        from superset.extensions import cache_manager
+
+        app.config["PERMISSIONS_CACHE_TIMEOUT"] = 600
+        cache = Cache()
+        cache.init_app(app, {"CACHE_TYPE": "SimpleCache"})
+        cache_manager._cache = cache  # pylint: disable=protected-access
+
+        delete_catalog()
+        user = create_catalog(datasets, roles, user_roles)
+        checks = generate_checks(datasets, charts)
+        try:
+            print(
+                f"{datasets} datasets, {roles} roles, a dashboard of {charts} charts "
+                f"checking {len(checks)} permissions\n"
+            )
+            print(f"{'load':<8}{'FAB (ms)':>12}{'cached (ms)':>14}{'speedup':>10}")
+            fab_total = cached_total = 0.0
+            for load in range(loads):
+                fab_time, expected = measure(
+                    app,
+                    lambda *args: SecurityManager._has_view_access(
+                        security_manager, *args
+                    ),
+                    user,
+                    checks,
+                )
+                # pylint: disable=protected-access
+                cached_time, results = measure(
+                    app,
+                    security_manager._has_view_access,
+                    user,
+                    checks,
+                )
+                assert results == expected, "cached permission checks differ"
+                fab_total += fab_time
+                cached_total += cached_time
+                print(
+                    f"{load + 1:<8}{fab_time * 1000:>12.1f}{cached_time * 1000:>14.1f}"
+                    f"{fab_time / cached_time:>9.1f}x"
+                )
+            print(
+                f"\n{'total':<8}{fab_total * 1000:>12.1f}{cached_total * 1000:>14.1f}"
+                f"{fab_total / cached_total:>9.1f}x"
+            )
+        finally:
+            delete_catalog()
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
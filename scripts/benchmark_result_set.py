@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the construction of ``SupersetResultSet`` from DB-API rows.
+
+Compares the columnar construction path against the previous implementation,
+which went through a NumPy structured array of objects, and against handing over
+a ``pyarrow.Table`` as engines with ``supports_arrow_fetch`` do. Each mode runs
+in a fresh process so that peak RSS is measured independently.
+
+    python scripts/benchmark_result_set.py --rows 2000000
+"""
+
+import multiprocessing
+import resource
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import click
+import numpy as np
+import pyarrow as pa
+
+DESCRIPTION = [
+    ("id", "BIGINT", None, None, None, None, False),
+    ("name", "VARCHAR", None, None, None, None, True),
+    ("amount", "DOUBLE", None, None, None, None, True),
+    ("price", "DECIMAL", None, None, None, None, True),
+    ("ts", "TIMESTAMP", None, None, None, None, True),
+    ("flag", "BOOLEAN", None, None, None, None, True),
+]
+
+
+def generate_rows(rows: int) -> list[tuple[Any, ...]]:
+    start = datetime(2024, 1, 1)
+    return [
+        (
+            i,
+            f"name_{i % 1000}",
+            i * 0.5 if i % 10 else None,
+            Decimal(i) / 100,
+            start + timedelta(seconds=i),
+            bool(i % 2),
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_build(data: list[tuple[Any, ...]]) -> pa.Table:
+    """The row-oriented construction path used before the columnar one."""
+    column_names = [col[0] for col in DESCRIPTION]
+    numpy_dtype = [(column_name, "object") for column_name in column_names]
+    array = np.array(data, dtype=numpy_dtype)
+    pa_data = [pa.array(array[column].tolist()) for column in column_names]
+    return pa.Table.from_arrays(pa_data, names=column_names)
+
+
+def run(mode: str, rows: int, queue: "multiprocessing.Queue[Any]") -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data: Any = generate_rows(rows)
+    if mode == "arrow":
+        data = SupersetResultSet(data, DESCRIPTION, BaseEngineSpec).table
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        legacy_build(data)
+    else:
+        SupersetResultSet(data, DESCRIPTION, BaseEngineSpec)
+    duration = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((duration, baseline, peak))
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows to build.")
+def main(rows: int) -> None:
+    context = multiprocessing.get_context("spawn")
+    print(f"Building a result set of {rows} rows x {len(DESCRIPTION)} columns\n")
+    print(f"{'mode':<10}{'wall time (s)':>15}{'peak RSS (MB)':>15}{'delta (MB)':>12}")
+    for mode in ("legacy", "columnar", "arrow"):
+        queue = context.Queue()
+        process = context.Process(target=run, args=(mode, rows, queue))
+        process.start()
+        duration, baseline, peak = queue.get()
+        process.join()
+        # ru_maxrss is reported in kilobytes on Linux
+        print(
+            f"{mode:<10}{duration:>15.3f}{peak / 1024:>15.1f}"
+            f"{(peak - baseline) / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
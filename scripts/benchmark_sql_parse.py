@@ -0,0 +1,145 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the parse cache of ``SQLScript`` and ``SQLStatement``.
+
+Simulates loading dashboards whose charts share a few virtual datasets: the SQL of
+each dataset is parsed for every chart using it, to validate it, check for
+disallowed functions and apply RLS, and the generated query of the chart is parsed
+to apply its limit. Compares parsing with and without the cache, and checks that
+both produce the same SQL.
+
+    python scripts/benchmark_sql_parse.py --charts 30 --loads 10
+"""
+
+import time
+from typing import Callable
+
+import click
+from sqlglot import exp
+
+from superset.sql.parse import (
+    parse_cache,
+    PARSE_CACHE_MAX_LENGTH,
+    RLSMethod,
+    SQLScript,
+    SQLStatement,
+    Table,
+)
+
+ENGINE = "postgresql"
+
+DATASETS = [
+    """
+    SELECT o.id, o.customer_id, o.amount, o.status, o.created_at, c.country
+    FROM sales.orders o
+    JOIN crm.customers c ON o.customer_id = c.id
+    WHERE o.status IN ('paid', 'shipped')
+    """,
+    """
+    WITH sessions AS (
+      SELECT user_id, session_id, MIN(ts) AS started_at, MAX(ts) AS ended_at
+      FROM web.events
+      WHERE ts >= CURRENT_DATE - INTERVAL '90 days'
+      GROUP BY user_id, session_id
+    )
+    SELECT s.user_id, s.started_at, s.ended_at - s.started_at AS duration,
+      u.plan, u.signup_date
+    FROM sessions s
+    LEFT JOIN app.users u ON u.id = s.user_id
+    """,
+    """
+    SELECT date_trunc('day', i.ts) AS ds, i.sku, i.warehouse,
+      SUM(i.quantity) AS quantity,
+      SUM(i.quantity * p.unit_price) AS value
+    FROM inventory.movements i
+    JOIN catalog.prices p ON p.sku = i.sku AND i.ts BETWEEN p.valid_from AND p.valid_to
+    GROUP BY 1, 2, 3
+    """,
+]
+
+
+def chart_query(dataset: str, chart: int) -> str:
+    """The query of a chart on a virtual dataset, as generated by the dataset."""
+    return f"""
+    SELECT country, date_trunc('month', created_at) AS __timestamp,
+      SUM(amount) AS revenue, COUNT(DISTINCT customer_id) AS buyers
+    FROM ({dataset}) AS virtual_table
+    WHERE created_at >= '2024-01-01' AND amount > {chart}
+    GROUP BY country, date_trunc('month', created_at)
+    ORDER BY revenue DESC
+    """
+
+
+def load_dashboard(charts: int) -> list[str]:
+    """Parse the SQL of a dashboard like chart data requests do."""
+    predicates = {
+        Table("orders", "sales"): [exp.condition("tenant_id = 42")],
+    }
+    results = []
+    for chart in range(charts):
+        dataset = DATASETS[chart % len(DATASETS)]
+
+        # validation of the dataset SQL, and of the functions it uses
+        script = SQLScript(dataset, ENGINE)
+        script.has_mutation()
+        script.check_functions_present({"VERSION", "PG_READ_FILE"})
+
+        # RLS applied to the dataset SQL
+        statement = SQLStatement(dataset, ENGINE)
+        statement.apply_rls(None, "public", predicates, RLSMethod.AS_SUBQUERY)
+        results.append(statement.format())
+
+        # limit applied to the query of the chart
+        statement = SQLStatement(chart_query(dataset, chart % 5), ENGINE)
+        statement.set_limit_value(10000)
+        results.append(statement.format())
+    return results
+
+
+def measure(func: Callable[[], list[str]], loads: int) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    for _ in range(loads):
+        results = func()
+    return time.perf_counter() - start, results
+
+
+@click.command()
+@click.option("--charts", default=30, help="Number of charts of the dashboard.")
+@click.option("--loads", default=10, help="Number of times the dashboard is loaded.")
+def main(charts: int, loads: int) -> None:
+    print(f"Loading a dashboard of {charts} charts {loads} times\n")
+
+    parse_cache.max_length = -1
+    uncached_time, expected = measure(lambda: load_dashboard(charts), loads)
+
+    parse_cache.max_length = PARSE_CACHE_MAX_LENGTH
+    parse_cache.clear()
+    cached_time, results = measure(lambda: load_dashboard(charts), loads)
+    assert results == expected, "cached parsing produces different SQL"
+
+    print(f"{'uncached (s)':>14}{'cached (s)':>12}{'speedup':>10}")
+    print(
+        f"{uncached_time:>14.3f}{cached_time:>12.3f}"
+        f"{uncached_time / cached_time:>9.1f}x"
+    )
+    print(f"\nparse cache: {parse_cache.hits} hits, {parse_cache.misses} misses")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -19,9 +19,17 @@ from __future__ import annotations
 import contextlib
 import logging
 from datetime import datetime
-from typing import Any, Callable, TYPE_CHECKING
-
-from flask import current_app as app, g, make_response, request, Response
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+
+import pandas as pd
+from flask import (
+    current_app as app,
+    g,
+    make_response,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -55,6 +63,7 @@ from superset.utils.core import (
     create_zip,
     DatasourceType,
     get_user_id,
+    parse_boolean_string,
 )
 from superset.utils.decorators import logs_context
 from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
@@ -210,6 +219,14 @@ class ChartDataRestApi(ChartRestApi):
           description: >-
             Takes a query context constructed in the client and returns payload data
             response for the given query.
+          parameters:
+          - in: query
+            name: stream
+            description: >-
+              Encode JSON results incrementally and stream them in the response,
+              instead of building the whole payload in memory
+            schema:
+              type: boolean
           requestBody:
             description: >-
               A query context consists of a datasource from which to fetch data
@@ -264,6 +281,13 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
+        if (
+            parse_boolean_string(request.args.get("stream"))
+            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_type != ChartDataResultType.POST_PROCESSED
+        ):
+            query_context.stream_data = True
+
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
@@ -436,6 +460,8 @@ class ChartDataRestApi(ChartRestApi):
             if security_manager.is_guest_user():
                 for query in queries:
                     query.pop("query", None)
+            if any(isinstance(query.get("data"), pd.DataFrame) for query in queries):
+                return self._create_streaming_json_response(queries)
             with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
                 response_data = json.dumps(
                     {"result": queries},
@@ -642,3 +668,50 @@ class ChartDataRestApi(ChartRestApi):
         response.implicit_sequence_conversion = False
 
         return response
+
+    def _create_streaming_json_response(
+        self,
+        queries: list[dict[str, Any]],
+    ) -> Response:
+        """
+        Create a JSON response encoding the results incrementally.
+
+        The payload is the same as the regular JSON response, but the records of
+        each query are converted and encoded one batch of rows at a time, and
+        written to the response as they are produced.
+        """
+        batch_size = app.config["CHART_DATA_STREAMING_BATCH_SIZE"]
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(obj, default=json.json_int_dttm_ser, ignore_nan=True)
+
+        def generate() -> Iterator[str]:
+            yield '{"result": ['
+            for idx, query in enumerate(queries):
+                df = query.pop("data") if "data" in query else None
+                # the query payload without its closing brace
+                payload = dumps(query)[:-1]
+                separator = ", " if query else ""
+                yield ("," if idx else "") + payload
+                if isinstance(df, pd.DataFrame):
+                    yield f'{separator}"data": ['
+                    for start in range(0, len(df.index), batch_size):
+                        # converted like the records of the regular JSON response
+                        records = df.iloc[start : start + batch_size].to_dict(
+                            orient="records"
+                        )
+                        yield ("," if start else "") + dumps(records)[1:-1]
+                    yield "]"
+                elif df is not None:
+                    yield f'{separator}"data": {dumps(df)}'
+                yield "}"
+            yield "]}"
+
+        response = Response(
+            stream_with_context(generate()),
+            mimetype="application/json; charset=utf-8",
+            headers={"X-Accel-Buffering": "no"},  # Disable nginx buffering
+            direct_passthrough=False,
+        )
+        response.implicit_sequence_conversion = False
+        return response
@@ -1481,6 +1481,13 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the cached result past its cache timeout, and being "
+            "refreshed"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={
             "description": "The executed query statement. May be absent when "
@@ -20,7 +20,10 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
-from superset.commands.streaming_export.base import BaseStreamingCSVExportCommand
+from superset.commands.streaming_export.base import (
+    BaseStreamingCSVExportCommand,
+    StreamingExportFormat,
+)
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
@@ -40,6 +43,7 @@ class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
         self,
         query_context: QueryContext,
         chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
     ):
         """
         Initialize the chart streaming export command.
@@ -47,8 +51,9 @@ class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
         Args:
             query_context: The query context containing datasource and query details
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Output format of the export (default: CSV)
         """
-        super().__init__(chunk_size)
+        super().__init__(chunk_size, export_format)
         self._query_context = query_context
 
     def validate(self) -> None:
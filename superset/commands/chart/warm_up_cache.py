@@ -27,6 +27,7 @@ from superset.commands.chart.exceptions import (
     WarmUpCacheChartNotFoundError,
 )
 from superset.common.db_query_status import QueryStatus
+from superset.common.query_context import QueryContext
 from superset.extensions import db
 from superset.models.slice import Slice
 from superset.utils import json
@@ -77,8 +78,8 @@ class ChartWarmUpCacheCommand(BaseCommand):
 
         return payload["errors"] or None, payload["status"]
 
-    def _warm_up_non_legacy_cache(self, chart: Slice) -> tuple[Any, Any]:
-        """Warm up cache for non-legacy visualizations."""
+    def get_query_context(self, chart: Slice) -> QueryContext:
+        """Get the query context warming up the cache of a non-legacy visualization."""
         query_context = chart.get_query_context()
 
         if not query_context:
@@ -92,6 +93,15 @@ class ChartWarmUpCacheCommand(BaseCommand):
                 )
 
         query_context.force = True
+        return query_context
+
+    def _warm_up_non_legacy_cache(
+        self,
+        chart: Slice,
+        query_context: Optional[QueryContext] = None,
+    ) -> tuple[Any, Any]:
+        """Warm up cache for non-legacy visualizations."""
+        query_context = query_context or self.get_query_context(chart)
         command = ChartDataCommand(query_context)
         command.validate()
         payload = command.run()
@@ -105,7 +115,13 @@ class ChartWarmUpCacheCommand(BaseCommand):
 
         return None, QueryStatus.SUCCESS
 
-    def run(self) -> dict[str, Any]:
+    def run(self, query_context: Optional[QueryContext] = None) -> dict[str, Any]:
+        """
+        Warm up the cache of the chart.
+
+        :param query_context: The query context of the chart, if it was already built
+            with `get_query_context`
+        """
         self.validate()
         chart = cast(Slice, self._chart_or_id)
 
@@ -115,7 +131,7 @@ class ChartWarmUpCacheCommand(BaseCommand):
             if form_data.get("viz_type") in viz_types:
                 error, status = self._warm_up_legacy_cache(chart, form_data)
             else:
-                error, status = self._warm_up_non_legacy_cache(chart)
+                error, status = self._warm_up_non_legacy_cache(chart, query_context)
         except Exception as ex:  # pylint: disable=broad-except
             error = error_msg_from_exception(ex)
             status = None
@@ -30,6 +30,7 @@ from superset.exceptions import SupersetErrorException, SupersetSecurityExceptio
 from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
 from superset.sqllab.limiting_factor import LimitingFactor
+from superset.sqllab.utils import is_results_payload_v2
 from superset.utils import core as utils, csv
 from superset.views.utils import _deserialize_results_payload
 
@@ -93,9 +94,12 @@ class SqlResultExportCommand(BaseCommand):
             blob = results_backend.get(self._query.results_key)
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
+            if is_results_payload_v2(blob):
+                payload = blob
+            else:
+                payload = utils.zlib_decompress(
+                    blob, decode=not results_backend_use_msgpack
+                )
             obj = _deserialize_results_payload(
                 payload, self._query, cast(bool, results_backend_use_msgpack)
             )
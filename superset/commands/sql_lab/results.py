@@ -19,6 +19,8 @@ from __future__ import annotations
 import logging
 from typing import Any, cast
 
+import msgpack
+import pyarrow as pa
 from flask import current_app as app
 from flask_babel import gettext as __
 
@@ -27,7 +29,13 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
-from superset.sqllab.utils import apply_display_max_row_configuration_if_require
+from superset.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    is_results_payload_v2,
+    read_results_payload,
+    ResultsPayload,
+    write_ipc_buffer,
+)
 from superset.utils import core as utils
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
@@ -38,6 +46,8 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
+    _limit: int | None
     _blob: Any
     _query: Query
 
@@ -45,9 +55,13 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
+        self._limit = limit
 
     def validate(self) -> None:
         if not results_backend:
@@ -125,28 +139,87 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
-            self._blob, decode=not results_backend_use_msgpack
-        )
+        if is_results_payload_v2(self._blob):
+            payload = self._blob
+        else:
+            payload = utils.zlib_decompress(
+                self._blob, decode=not results_backend_use_msgpack
+            )
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                *self._get_range(),
             )
         except SerializationError as ex:
-            raise SupersetErrorException(
-                SupersetError(
-                    message=__(
-                        "Data could not be deserialized from the results backend. The "
-                        "storage format might have changed, rendering the old data "
-                        "stake. You need to re-run the original query."
-                    ),
-                    error_type=SupersetErrorType.RESULTS_BACKEND_ERROR,
-                    level=ErrorLevel.ERROR,
-                ),
-                status=404,
-            ) from ex
+            raise self._deserialization_error() from ex
 
         if self._rows:
             obj = apply_display_max_row_configuration_if_require(obj, self._rows)
 
         return obj
+
+    def run_arrow(self) -> bytes | None:
+        """
+        Returns the data as an Arrow IPC stream, or ``None`` if the results weren't
+        stored as Arrow data.
+
+        The stream of version 2 payloads is returned as-is when all its rows are
+        requested, its buffers are compressed.
+        """
+        self.validate()
+        offset, limit = self._get_range()
+        try:
+            if is_results_payload_v2(self._blob):
+                results_payload = read_results_payload(self._blob)
+            elif results_backend_use_msgpack:
+                metadata = msgpack.loads(
+                    utils.zlib_decompress(self._blob, decode=False), raw=False
+                )
+                # version 1 streams have no index, they're read in full
+                results_payload = ResultsPayload(
+                    metadata=metadata,
+                    stream=memoryview(metadata.pop("data")),
+                    batches=[],
+                )
+            else:
+                return None
+
+            num_rows = results_payload.num_rows
+            if offset == 0 and (
+                limit is None or (num_rows is not None and limit >= num_rows)
+            ):
+                return bytes(results_payload.stream)
+
+            table = results_payload.read_table(offset, limit)
+        except (SerializationError, pa.ArrowException, ValueError, KeyError) as ex:
+            raise self._deserialization_error() from ex
+
+        return write_ipc_buffer(table).to_pybytes()
+
+    def _get_range(self) -> tuple[int, int | None]:
+        """
+        Returns the offset and the maximum number of rows to read, within the
+        display limit.
+        """
+        limit = self._limit
+        if self._rows:
+            remaining = max(self._rows - self._offset, 0)
+            limit = remaining if limit is None else min(limit, remaining)
+        return self._offset, limit
+
+    @staticmethod
+    def _deserialization_error() -> SupersetErrorException:
+        return SupersetErrorException(
+            SupersetError(
+                message=__(
+                    "Data could not be deserialized from the results backend. The "
+                    "storage format might have changed, rendering the old data "
+                    "stake. You need to re-run the original query."
+                ),
+                error_type=SupersetErrorType.RESULTS_BACKEND_ERROR,
+                level=ErrorLevel.ERROR,
+            ),
+            status=404,
+        )
@@ -23,7 +23,10 @@ from typing import Any
 from flask_babel import gettext as __
 
 from superset import db
-from superset.commands.streaming_export.base import BaseStreamingCSVExportCommand
+from superset.commands.streaming_export.base import (
+    BaseStreamingCSVExportCommand,
+    StreamingExportFormat,
+)
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
@@ -45,6 +48,7 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         self,
         client_id: str,
         chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
     ):
         """
         Initialize the SQL Lab streaming export command.
@@ -52,8 +56,9 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         Args:
             client_id: The SQL Lab query client ID
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Output format of the export (default: CSV)
         """
-        super().__init__(chunk_size)
+        super().__init__(chunk_size, export_format)
         self._client_id = client_id
         self._query: Query | None = None
 
@@ -23,16 +23,109 @@ import io
 import logging
 import time
 from abc import abstractmethod
-from typing import Any, Callable, Generator
+from operator import itemgetter
+from typing import Any, Callable, Generator, Iterator, Sequence
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from flask import current_app as app
 from sqlalchemy import text
 
 from superset import db
 from superset.commands.base import BaseCommand
+from superset.utils.backports import StrEnum
+from superset.utils.csv import escape_column, escape_value, problematic_chars_pattern
 
 logger = logging.getLogger(__name__)
 
+# Size of the CSV data buffered before it's sent
+CSV_FLUSH_THRESHOLD = 64 * 1024
+
+# Number of rows buffered into each row group of streamed Parquet files
+PARQUET_ROW_GROUP_SIZE = 64 * 1024
+
+
+class StreamingExportFormat(StrEnum):
+    """
+    Streaming export output format
+    """
+
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+    @property
+    def mimetype(self) -> str:
+        return {
+            StreamingExportFormat.CSV: "text/csv",
+            StreamingExportFormat.PARQUET: "application/vnd.apache.parquet",
+            StreamingExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+        }[self]
+
+
+def _to_columns(rows: Sequence[Any], column_count: int) -> list[list[Any]]:
+    """Transpose a batch of rows into a list of column values."""
+    return [list(map(itemgetter(i), rows)) for i in range(column_count)]
+
+
+def _escape_rows(rows: Sequence[Any], column_count: int) -> Sequence[Any]:
+    """Escape the string values of a batch of rows, like ``df_to_escaped_csv``."""
+    columns: list[list[Any]] | None = None
+    for i in range(column_count):
+        column = pd.Series(list(map(itemgetter(i), rows)), dtype=object)
+        escaped = escape_column(column, escape_value, problematic_chars_pattern)
+        if escaped is not column:
+            columns = columns or _to_columns(rows, column_count)
+            columns[i] = escaped.tolist()
+
+    return rows if columns is None else list(zip(*columns))
+
+
+def _count_bytes(data: str) -> int:
+    """Count the bytes of UTF-8 encoded data, without encoding ASCII data."""
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
+def _to_record_batch(
+    rows: Sequence[Any],
+    columns: list[str],
+    schema: pa.Schema | None,
+) -> pa.RecordBatch:
+    """
+    Convert a batch of rows into an Arrow record batch.
+
+    Column types are inferred from the first batch, columns whose type can't be
+    inferred from it are exported as strings. The values of later batches are cast to
+    the types of the first batch, raising an error when they can't be cast safely.
+    """
+    arrays = []
+    for i, values in enumerate(_to_columns(rows, len(columns))):
+        type_ = schema.field(i).type if schema is not None else None
+        try:
+            array = pa.array(values, type_)
+        except (
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+            OverflowError,
+        ):
+            if type_ is not None and not pa.types.is_string(type_):
+                array = pa.array(values).cast(type_)
+            else:
+                array = pa.array(
+                    [None if value is None else str(value) for value in values],
+                    pa.string(),
+                )
+        if schema is None and pa.types.is_null(array.type):
+            array = array.cast(pa.string())
+        elif schema is None and pa.types.is_decimal(array.type):
+            # the precision of decimals is inferred from the values of the batch
+            array = array.cast(pa.decimal128(38, array.type.scale))
+        arrays.append(array)
+
+    return pa.RecordBatch.from_arrays(arrays, names=columns)
+
 
 class BaseStreamingCSVExportCommand(BaseCommand):
     """
@@ -40,6 +133,7 @@ class BaseStreamingCSVExportCommand(BaseCommand):
 
     Provides shared functionality for:
     - Generating CSV data in chunks
+    - Generating Parquet and Arrow IPC stream data in chunks
     - Managing database connections
     - Buffering data for efficient streaming
     - Error handling with user-friendly messages
@@ -49,14 +143,20 @@ class BaseStreamingCSVExportCommand(BaseCommand):
     - _get_row_limit(): Return optional row limit for the export
     """
 
-    def __init__(self, chunk_size: int = 1000):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
+    ):
         """
         Initialize the streaming export command.
 
         Args:
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Output format of the export (default: CSV)
         """
         self._chunk_size = chunk_size
+        self._export_format = StreamingExportFormat(export_format)
         self._current_app = app._get_current_object()
 
     @abstractmethod
@@ -81,13 +181,27 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         self, columns: list[str], csv_writer: Any, buffer: io.StringIO
     ) -> tuple[str, int]:
         """Write CSV header and return header data with byte count."""
-        csv_writer.writerow(columns)
+        csv_writer.writerow([escape_value(column) for column in columns])
         header_data = buffer.getvalue()
-        total_bytes = len(header_data.encode("utf-8"))
+        total_bytes = _count_bytes(header_data)
         buffer.seek(0)
         buffer.truncate()
         return header_data, total_bytes
 
+    def _fetch_batches(
+        self, result_proxy: Any, limit: int | None
+    ) -> Iterator[Sequence[Any]]:
+        """Fetch rows from the database in batches, up to the row limit."""
+        row_count = 0
+        while rows := result_proxy.fetchmany(self._chunk_size):
+            if limit is not None:
+                rows = rows[: limit - row_count]
+            if rows:
+                row_count += len(rows)
+                yield rows
+            if limit is not None and row_count >= limit:
+                break
+
     def _process_rows(
         self,
         result_proxy: Any,
@@ -101,39 +215,93 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         Yields tuples of (data_chunk, row_count, byte_count).
         """
         row_count = 0
-        flush_threshold = 65536  # 64KB
 
-        while rows := result_proxy.fetchmany(self._chunk_size):
-            for row in rows:
-                # Apply limit if specified
-                if limit is not None and row_count >= limit:
-                    break
-
-                csv_writer.writerow(row)
-                row_count += 1
-
-                # Check buffer size and flush if needed
-                current_size = buffer.tell()
-                if current_size >= flush_threshold:
-                    data = buffer.getvalue()
-                    data_bytes = len(data.encode("utf-8"))
-                    yield data, row_count, data_bytes
-                    buffer.seek(0)
-                    buffer.truncate()
-
-            # Break outer loop if limit reached
-            if limit is not None and row_count >= limit:
-                break
+        for rows in self._fetch_batches(result_proxy, limit):
+            csv_writer.writerows(_escape_rows(rows, len(rows[0])))
+            row_count += len(rows)
+
+            # Check buffer size and flush if needed
+            if buffer.tell() >= CSV_FLUSH_THRESHOLD:
+                data = buffer.getvalue()
+                yield data, row_count, _count_bytes(data)
+                buffer.seek(0)
+                buffer.truncate()
 
         # Flush remaining buffer
         if remaining_data := buffer.getvalue():
-            data_bytes = len(remaining_data.encode("utf-8"))
-            yield remaining_data, row_count, data_bytes
+            yield remaining_data, row_count, _count_bytes(remaining_data)
+
+    def _open_arrow_writer(self, sink: io.BytesIO, schema: pa.Schema) -> Any:
+        """Open a Parquet or Arrow IPC stream writer for the export format."""
+        if self._export_format == StreamingExportFormat.PARQUET:
+            return pq.ParquetWriter(sink, schema)
+        return pa.ipc.new_stream(sink, schema)
+
+    def _process_rows_as_arrow(
+        self,
+        result_proxy: Any,
+        columns: list[str],
+        limit: int | None,
+    ) -> Generator[tuple[bytes, int, int], None, None]:
+        """
+        Process database rows and yield Parquet or Arrow IPC stream data chunks.
+
+        Arrow IPC chunks hold one record batch per fetched batch, while fetched
+        batches are buffered into row groups of ``PARQUET_ROW_GROUP_SIZE`` rows
+        for Parquet.
+
+        Yields tuples of (data_chunk, row_count, byte_count).
+        """
+        is_parquet = self._export_format == StreamingExportFormat.PARQUET
+        sink = io.BytesIO()
+        writer = None
+        schema: pa.Schema | None = None
+        row_group: list[pa.RecordBatch] = []
+        row_group_size = 0
+        row_count = 0
+
+        for rows in self._fetch_batches(result_proxy, limit):
+            batch = _to_record_batch(rows, columns, schema)
+            row_count += len(rows)
+            if writer is None:
+                schema = batch.schema
+                writer = self._open_arrow_writer(sink, schema)
+
+            if is_parquet:
+                row_group.append(batch)
+                row_group_size += len(batch)
+                if row_group_size < PARQUET_ROW_GROUP_SIZE:
+                    continue
+                writer.write_table(
+                    pa.Table.from_batches(row_group), PARQUET_ROW_GROUP_SIZE
+                )
+                row_group, row_group_size = [], 0
+            else:
+                writer.write_batch(batch)
+
+            # the writers keep track of the position in the output themselves, so
+            # the sink can be emptied once its content is sent
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            yield data, row_count, len(data)
+
+        if writer is None:
+            schema = pa.schema([(column, pa.string()) for column in columns])
+            writer = self._open_arrow_writer(sink, schema)
+        if row_group:
+            writer.write_table(
+                pa.Table.from_batches(row_group), PARQUET_ROW_GROUP_SIZE
+            )
+        writer.close()
+
+        data = sink.getvalue()
+        yield data, row_count, len(data)
 
     def _execute_query_and_stream(
         self, sql: str, database: Any, limit: int | None
-    ) -> Generator[str, None, None]:
-        """Execute query with streaming and yield CSV chunks."""
+    ) -> Generator[str | bytes, None, None]:
+        """Execute query with streaming and yield CSV, Parquet or Arrow chunks."""
         start_time = time.time()
         total_bytes = 0
 
@@ -150,22 +318,29 @@ class BaseStreamingCSVExportCommand(BaseCommand):
 
                     columns = list(result_proxy.keys())
 
-                    # Use StringIO with csv.writer for proper escaping
-                    buffer = io.StringIO()
-                    csv_writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
-
-                    # Write CSV header
-                    header_data, header_bytes = self._write_csv_header(
-                        columns, csv_writer, buffer
-                    )
-                    total_bytes += header_bytes
-                    yield header_data
-
                     # Process rows and yield chunks
+                    chunks: Iterator[tuple[str | bytes, int, int]]
+                    if self._export_format == StreamingExportFormat.CSV:
+                        # Use StringIO with csv.writer for proper escaping
+                        buffer = io.StringIO()
+                        csv_writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+
+                        # Write CSV header
+                        header_data, header_bytes = self._write_csv_header(
+                            columns, csv_writer, buffer
+                        )
+                        total_bytes += header_bytes
+                        yield header_data
+                        chunks = self._process_rows(
+                            result_proxy, csv_writer, buffer, limit
+                        )
+                    else:
+                        chunks = self._process_rows_as_arrow(
+                            result_proxy, columns, limit
+                        )
+
                     row_count = 0
-                    for data_chunk, rows_processed, chunk_bytes in self._process_rows(
-                        result_proxy, csv_writer, buffer, limit
-                    ):
+                    for data_chunk, rows_processed, chunk_bytes in chunks:
                         total_bytes += chunk_bytes
                         row_count = rows_processed
                         yield data_chunk
@@ -174,18 +349,20 @@ class BaseStreamingCSVExportCommand(BaseCommand):
                     total_time = time.time() - start_time
                     total_mb = total_bytes / (1024 * 1024)
                     logger.info(
-                        "Streaming CSV completed: %s rows, %.1fMB in %.2fs",
+                        "Streaming %s completed: %s rows, %.1fMB in %.2fs",
+                        self._export_format.upper(),
                         f"{row_count:,}",
                         total_mb,
                         total_time,
                     )
 
-    def run(self) -> Callable[[], Generator[str, None, None]]:
+    def run(self) -> Callable[[], Generator[str | bytes, None, None]]:
         """
-        Execute the streaming CSV export.
+        Execute the streaming export.
 
         Returns:
-            A callable that returns a generator yielding CSV data chunks as strings.
+            A callable that returns a generator yielding CSV data chunks as strings,
+            or Parquet and Arrow IPC stream data chunks as bytes.
             The callable is needed to maintain Flask app context during streaming.
         """
         # Load all needed data while session is still active
@@ -193,8 +370,8 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         sql, database = self._get_sql_and_database()
         limit = self._get_row_limit()
 
-        def csv_generator() -> Generator[str, None, None]:
-            """Generator that yields CSV data chunks."""
+        def csv_generator() -> Generator[str | bytes, None, None]:
+            """Generator that yields export data chunks."""
             with self._current_app.app_context():
                 try:
                     yield from self._execute_query_and_stream(sql, database, limit)
@@ -204,6 +381,11 @@ class BaseStreamingCSVExportCommand(BaseCommand):
 
                     logger.error("Traceback: %s", traceback.format_exc())
 
+                    # the marker can't be appended to binary formats, their response
+                    # is aborted instead
+                    if self._export_format != StreamingExportFormat.CSV:
+                        raise
+
                     # Send error marker for frontend to detect
                     error_marker = (
                         "__STREAM_ERROR__:Export failed. "
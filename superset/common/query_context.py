@@ -55,6 +55,10 @@ class QueryContext:
 
     cache_values: dict[str, Any]
 
+    # when set, JSON results are returned as DataFrames, for the API to encode them
+    # incrementally instead of building all the records in memory
+    stream_data: bool = False
+
     _processor: QueryContextProcessor
 
     # TODO: Type datasource and query_object dictionary with TypedDict when it becomes
@@ -87,7 +91,7 @@ class QueryContext:
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | pd.DataFrame:
         return self._processor.get_data(df, coltypes)
 
     def get_payload(
@@ -118,6 +122,23 @@ class QueryContext:
             return self.slice_.cache_timeout
         return self.datasource.cache_timeout
 
+    def get_stale_cache_timeout(self) -> int | None:
+        """
+        Get how long query results are served past their cache timeout while they're
+        refreshed in the background.
+
+        Priority order:
+        1. Chart-level ``stale_cache_timeout`` param (if querying from a saved chart)
+        2. Datasource-level timeout, falling back to the database one
+        3. System default (None)
+        """
+        if self.slice_:
+            stale_cache_timeout = self.slice_.params_dict.get("stale_cache_timeout")
+            if stale_cache_timeout is not None:
+                return stale_cache_timeout
+        # not all explorables support it
+        return getattr(self.datasource, "stale_cache_timeout", None)
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
@@ -16,23 +16,40 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import logging
 import re
+from datetime import timedelta
+from functools import partial
 from typing import Any, cast, ClassVar, Sequence, TYPE_CHECKING
 
 import pandas as pd
 from flask import current_app
 from flask_babel import gettext as _
+from flask_caching.backends import NullCache
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
+from superset.common.utils.concurrency import (
+    get_database_concurrency,
+    run_concurrently,
+)
+from superset.common.utils.incremental_cache import (
+    get_time_label,
+    IncrementalRefresh,
+    plan_refresh,
+    splice,
+    with_time_range,
+)
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.single_flight import single_flight
 from superset.common.utils.time_range_utils import get_since_until_from_time_range
 from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
 from superset.exceptions import (
+    InvalidPostProcessingError,
     QueryObjectValidationError,
     SupersetException,
 )
@@ -49,9 +66,12 @@ from superset.utils.core import (
     GenericDataType,
     get_column_names_from_columns,
     get_column_names_from_metrics,
+    get_user_id,
     is_adhoc_column,
     is_adhoc_metric,
 )
+from superset.utils.dates import now_as_float
+from superset.utils.decorators import stats_timing
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -97,39 +117,27 @@ class QueryContextProcessor:
             force_query=force_query,
             force_cached=force_cached,
         )
+        if cache.is_stale:
+            self.refresh_stale_cache()
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
+            coalescing_timeout = current_app.config["CHART_DATA_COALESCING_TIMEOUT"]
+            if (
+                coalescing_timeout
+                and not force_query
+                and self._is_data_cache_enabled(timeout)
+            ):
+                cache = single_flight(
+                    cache_key,
+                    load=partial(self._get_cached_query_result, cache_key),
+                    compute=partial(
+                        self._load_query_result, query_obj, cache, cache_key, False
+                    ),
+                    timeout=coalescing_timeout,
+                    distributed=current_app.config["CHART_DATA_COALESCING_DISTRIBUTED"],
                 )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            else:
+                self._load_query_result(query_obj, cache, cache_key, force_query)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -189,35 +197,284 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
-            "rowcount": len(cache.df.index),
+            "rowcount": cache.rowcount,
             "sql_rowcount": cache.sql_rowcount,
             "from_dttm": query_obj.from_dttm,
             "to_dttm": query_obj.to_dttm,
             "label_map": label_map,
         }
 
+    @staticmethod
+    def _is_data_cache_enabled(timeout: int) -> bool:
+        """
+        Whether query results are cached, so that coalesced requests can read the
+        result of the request running the query from the cache.
+        """
+        return timeout != CACHE_DISABLED_TIMEOUT and not isinstance(
+            cache_manager.data_cache.cache, NullCache
+        )
+
+    @staticmethod
+    def _get_cached_query_result(cache_key: str) -> QueryCacheManager | None:
+        """Load a query result from the data cache, if it's there"""
+        cache = QueryCacheManager.get(key=cache_key, region=CacheRegion.DATA)
+        return cache if cache.is_loaded else None
+
+    def _load_query_result(
+        self,
+        query_obj: QueryObject,
+        cache: QueryCacheManager,
+        cache_key: str,
+        force_query: bool,
+    ) -> QueryCacheManager:
+        """Run the query of a query object, and cache its result"""
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if (
+                    col not in self._qc_datasource.column_names
+                    and col != DTTM_ALIAS
+                )
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            annotation_data = self.get_annotation_data(query_obj)
+            if time_label := get_time_label(query_obj, self._qc_datasource):
+                query_result = self._get_incremental_query_result(
+                    query_obj, time_label
+                )
+            elif (
+                query_obj.post_processing
+                and current_app.config["CHART_DATA_CACHE_RAW_RESULTS"]
+            ):
+                query_result = self._get_post_processed_query_result(
+                    query_obj, annotation_data, force_query
+                )
+            else:
+                query_result = self.get_query_result(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+                stale_timeout=self.get_stale_cache_timeout(),
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
+        return cache
+
+    def _get_post_processed_query_result(
+        self,
+        query_obj: QueryObject,
+        annotation_data: dict[str, Any],
+        force_query: bool,
+    ) -> QueryResult:
+        """
+        Get the result of a query object before its post processing, from the data
+        cache if it's there, or else by running its query and caching it, and then
+        post process it.
+
+        The result before post processing is cached under the cache key of the query
+        object without post processing, so that query objects only differing by
+        their post processing share it.
+        """
+        raw_query_obj = copy.copy(query_obj)
+        raw_query_obj.post_processing = []
+        raw_cache_key = self.query_cache_key(raw_query_obj)
+        raw_cache = QueryCacheManager.get(
+            key=raw_cache_key,
+            region=CacheRegion.DATA,
+            force_query=force_query,
+        )
+
+        if raw_cache.is_loaded and not raw_cache.is_stale:
+            current_app.config["STATS_LOGGER"].incr("loaded_raw_from_cache")
+            query_result = QueryResult(
+                df=raw_cache.df,
+                query=raw_cache.query,
+                duration=timedelta(0),
+                applied_template_filters=raw_cache.applied_template_filters,
+                applied_filter_columns=raw_cache.applied_filter_columns,
+                rejected_filter_columns=raw_cache.rejected_filter_columns,
+                from_dttm=query_obj.from_dttm,
+                to_dttm=query_obj.to_dttm,
+            )
+            if raw_cache.sql_rowcount is not None:
+                query_result.sql_rowcount = raw_cache.sql_rowcount
+        else:
+            query_result = self.get_query_result(raw_query_obj)
+            raw_cache.set_query_result(
+                key=raw_cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+                stale_timeout=self.get_stale_cache_timeout(),
+            )
+
+        return self._post_process_query_result(query_obj, query_result)
+
+    def _get_incremental_query_result(
+        self,
+        query_obj: QueryObject,
+        time_label: str,
+    ) -> QueryResult:
+        """
+        Get the result of a time series query object by refreshing its previous
+        result incrementally, when it's in the data cache, or else by running its
+        query, and then post process it.
+
+        See `superset.common.utils.incremental_cache`.
+        """
+        stats_logger = current_app.config["STATS_LOGGER"]
+        raw_query_obj = copy.copy(query_obj)
+        raw_query_obj.post_processing = []
+        key = f"incremental_{self.query_cache_key(raw_query_obj)}"
+
+        query_result = None
+        if (previous := cache_manager.data_cache.get(key)) and (
+            refresh := plan_refresh(
+                previous["df"],
+                time_label,
+                previous["from_dttm"],
+                previous["to_dttm"],
+                query_obj.from_dttm,
+                query_obj.to_dttm,
+            )
+        ):
+            query_result = self._refresh_query_result(
+                raw_query_obj, time_label, refresh
+            )
+
+        if query_result is None:
+            stats_logger.incr("incremental_cache.full_refresh")
+            query_result = self.get_query_result(raw_query_obj)
+            stats_logger.gauge(
+                "incremental_cache.rows_refetched", len(query_result.df.index)
+            )
+
+        if query_result.status != QueryStatus.FAILED:
+            set_and_log_cache(
+                cache_manager.data_cache,
+                key,
+                {
+                    "df": query_result.df,
+                    "from_dttm": query_obj.from_dttm,
+                    "to_dttm": query_obj.to_dttm,
+                },
+                current_app.config["CHART_DATA_INCREMENTAL_CACHE_TIMEOUT"],
+                self._qc_datasource.uid,
+            )
+
+        return self._post_process_query_result(query_obj, query_result)
+
+    def _refresh_query_result(
+        self,
+        query_obj: QueryObject,
+        time_label: str,
+        refresh: IncrementalRefresh,
+    ) -> QueryResult | None:
+        """
+        Query the time ranges of an incremental refresh, and splice their rows with
+        the reused rows of the previous result.
+
+        Returns None when the rows of the time ranges can't be spliced, because a
+        query failed or the row limit was reached.
+        """
+        stats_logger = current_app.config["STATS_LOGGER"]
+        row_limit = query_obj.row_limit
+        query_results = [
+            self.get_query_result(with_time_range(query_obj, from_dttm, to_dttm))
+            for from_dttm, to_dttm in refresh.windows
+        ]
+        if any(
+            query_result.status == QueryStatus.FAILED
+            or (row_limit and len(query_result.df.index) >= row_limit)
+            for query_result in query_results
+        ):
+            return None
+
+        df = splice(
+            refresh.reused,
+            [query_result.df for query_result in query_results],
+            time_label,
+            query_obj.orderby,
+        )
+        if df is None or (row_limit and len(df.index) >= row_limit):
+            return None
+
+        stats_logger.incr("incremental_cache.incremental_refresh")
+        stats_logger.gauge(
+            "incremental_cache.rows_refetched",
+            sum(len(query_result.df.index) for query_result in query_results),
+        )
+        stats_logger.gauge("incremental_cache.rows_reused", len(refresh.reused.index))
+
+        return QueryResult(
+            df=df,
+            query=";\n\n".join(query_result.query for query_result in query_results),
+            duration=sum(
+                (query_result.duration for query_result in query_results),
+                timedelta(0),
+            ),
+            applied_template_filters=query_results[-1].applied_template_filters,
+            applied_filter_columns=query_results[-1].applied_filter_columns,
+            rejected_filter_columns=query_results[-1].rejected_filter_columns,
+            from_dttm=query_obj.from_dttm,
+            to_dttm=query_obj.to_dttm,
+        )
+
+    @staticmethod
+    def _post_process_query_result(
+        query_obj: QueryObject,
+        query_result: QueryResult,
+    ) -> QueryResult:
+        """Apply the post processing of a query object to its query result"""
+        if not query_result.df.empty:
+            try:
+                query_result.df = query_obj.exec_post_processing(query_result.df)
+            except InvalidPostProcessingError as ex:
+                raise QueryObjectValidationError(ex.message) from ex
+        return query_result
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
+        if not query_obj:
+            return None
+
         datasource = self._qc_datasource
-        extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
-
-        cache_key = (
-            query_obj.cache_key(
-                datasource=datasource.uid,
-                extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
-                **kwargs,
-            )
-            if query_obj
-            else None
-        )
-        return cache_key
+
+        def get_extra() -> dict[str, Any]:
+            return {
+                "datasource": datasource.uid,
+                "extra_cache_keys": datasource.get_extra_cache_keys(
+                    query_obj.to_dict()
+                ),
+                "rls": security_manager.get_rls_cache_key(datasource),
+                "changed_on": datasource.changed_on,
+            }
+
+        return query_obj.memoized_cache_key(get_extra, **kwargs)
 
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """
@@ -231,7 +488,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | pd.DataFrame:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -249,6 +506,9 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.stream_data:
+            return df
+
         return df.to_dict(orient="records")
 
     def _prepare_contribution_totals(self) -> tuple[list[int], int | None]:
@@ -335,15 +595,7 @@ class QueryContextProcessor:
                 )
             ]
 
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        query_results = self._get_query_results(force_cached)
 
         return_value = {"queries": query_results}
 
@@ -367,6 +619,64 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _get_query_results(self, force_cached: bool) -> list[dict[str, Any]]:
+        """
+        Get the results of the queries of the query context, running them
+        concurrently when enabled.
+        """
+        stats_logger = current_app.config["STATS_LOGGER"]
+        durations: list[float] = []
+
+        def get_results(query_obj: QueryObject) -> dict[str, Any]:
+            start = now_as_float()
+            try:
+                return get_query_results(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+            finally:
+                durations.append(now_as_float() - start)
+
+        concurrency = self.get_query_concurrency()
+        if concurrency > 1:
+            # load the relationships of the datasource used by the queries, since
+            # the session they're lazily loaded with can't be shared across threads
+            for relationship in ("database", "columns", "metrics"):
+                getattr(self._qc_datasource, relationship, None)
+
+        with stats_timing("chart_data.queries.wall_time", stats_logger) as start:
+            query_results = run_concurrently(
+                [
+                    partial(get_results, query_obj)
+                    for query_obj in self._query_context.queries
+                ],
+                concurrency,
+            )
+        if concurrency > 1:
+            # the time saved compared to running the queries one after another
+            stats_logger.timing(
+                "chart_data.queries.concurrency_saving",
+                sum(durations) - (now_as_float() - start),
+            )
+
+        return query_results
+
+    def get_query_concurrency(self) -> int:
+        """
+        Get how many queries of the query context can run at the same time: at most
+        ``CHART_DATA_QUERY_CONCURRENCY``, and no more than the connection pool of the
+        database allows.
+        """
+        concurrency = current_app.config["CHART_DATA_QUERY_CONCURRENCY"]
+        if concurrency <= 1 or len(self._query_context.queries) <= 1:
+            return 1
+
+        return get_database_concurrency(
+            getattr(self._qc_datasource, "database", None), concurrency
+        )
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
@@ -378,6 +688,44 @@ class QueryContextProcessor:
             return data_cache_timeout
         return current_app.config["CACHE_DEFAULT_TIMEOUT"]
 
+    def get_stale_cache_timeout(self) -> int:
+        stale_cache_timeout = self._query_context.get_stale_cache_timeout()
+        if stale_cache_timeout is not None:
+            return stale_cache_timeout
+        return current_app.config["DATA_CACHE_STALE_TIMEOUT"]
+
+    def refresh_stale_cache(self) -> None:
+        """
+        Queue a Celery task refreshing the cached query results of the query context,
+        unless one is already queued.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        refresh_key = self.cache_key(refresh=True)
+        if not cache_manager.data_cache.add(
+            refresh_key,
+            True,
+            timeout=current_app.config["SQLLAB_ASYNC_TIME_LIMIT_SEC"],
+        ):
+            return
+
+        job_metadata: dict[str, Any] = {"user_id": get_user_id()}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+        form_data = {
+            "form_data": self._query_context.form_data,
+            **self._query_context.cache_values,
+            "force": True,
+        }
+        try:
+            refresh_chart_data_cache.delay(job_metadata, form_data, refresh_key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not queue the refresh of stale data", exc_info=True)
+            cache_manager.data_cache.delete(refresh_key)
+        else:
+            current_app.config["STATS_LOGGER"].incr("stale_cache_refresh_queued")
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
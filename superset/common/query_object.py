@@ -20,7 +20,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from pprint import pformat
-from typing import Any, NamedTuple, TYPE_CHECKING
+from typing import Any, Callable, NamedTuple, TYPE_CHECKING
 
 from flask import g
 from flask_babel import gettext as _
@@ -30,14 +30,13 @@ from pandas import DataFrame
 from superset import feature_flag_manager
 from superset.common.chart_data import ChartDataResultType
 from superset.exceptions import (
-    InvalidPostProcessingError,
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
 from superset.extensions import event_logger
 from superset.sql.parse import sanitize_clause, transpile_to_dialect
 from superset.superset_typing import Column, Metric, OrderBy, QueryObjectDict
-from superset.utils import json, pandas_postprocessing
+from superset.utils import json
 from superset.utils.core import (
     DTTM_ALIAS,
     find_duplicates,
@@ -48,6 +47,10 @@ from superset.utils.core import (
 )
 from superset.utils.hashing import hash_from_dict
 from superset.utils.json import json_int_dttm_ser
+from superset.utils.pandas_postprocessing.planner import (
+    execute_post_processing,
+    plan_post_processing,
+)
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -166,6 +169,8 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         self.inner_to_dttm = kwargs.get("inner_to_dttm")
         self._rename_deprecated_fields(kwargs)
         self._move_deprecated_extra_fields(kwargs)
+        # the cache keys computed for the query object, by its serialized form
+        self._cache_keys: dict[str, str] = {}
 
     def _set_annotation_layers(
         self, annotation_layers: list[dict[str, Any]] | None
@@ -473,9 +478,28 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         if annotation_layers:
             cache_dict["annotation_layers"] = annotation_layers
 
-        # Add an impersonation key to cache if impersonation is enabled on the db
-        # or if the CACHE_QUERY_BY_USER flag is on or per_user_caching is enabled on
-        #  the database
+        if key := self._get_impersonation_key():
+            logger.debug("Adding impersonation key to QueryObject cache dict: %s", key)
+            cache_dict["impersonation_key"] = key
+
+        cache_key = hash_from_dict(
+            cache_dict, default=json_int_dttm_ser, ignore_nan=True
+        )
+        # Log QueryObject cache key generation for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "QueryObject CACHE KEY generated: %s from dict with keys: %s",
+                cache_key,
+                sorted(cache_dict.keys()),
+            )
+        return cache_key
+
+    def _get_impersonation_key(self) -> Any:
+        """
+        Get the impersonation key added to the cache key if impersonation is enabled
+        on the db or if the CACHE_QUERY_BY_USER flag is on or per_user_caching is
+        enabled on the database
+        """
         try:
             database = self.datasource.database  # type: ignore
             extra = json.loads(database.extra or "{}")
@@ -487,28 +511,61 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                 or feature_flag_manager.is_feature_enabled("CACHE_QUERY_BY_USER")
                 or extra.get("per_user_caching", False)
             ):
-                if key := database.db_engine_spec.get_impersonation_key(
+                return database.db_engine_spec.get_impersonation_key(
                     getattr(g, "user", None)
-                ):
-                    logger.debug(
-                        "Adding impersonation key to QueryObject cache dict: %s", key
-                    )
-
-                    cache_dict["impersonation_key"] = key
+                )
         except AttributeError:
             # datasource or database do not exist
             pass
+        return None
 
-        cache_key = hash_from_dict(
-            cache_dict, default=json_int_dttm_ser, ignore_nan=True
+    def _get_cache_key_form(self, extra: dict[str, Any]) -> str:
+        """
+        Serialize everything the cache key is made of, apart from the values computed
+        from the datasource, in a canonical form. It changes whenever the query object
+        is mutated, including in place, eg. when a filter is appended.
+        """
+        return json.dumps(
+            {
+                **self.to_dict(),
+                "annotation_layers": self.annotation_layers,
+                "datasource": self.datasource.uid if self.datasource else None,
+                "extra": extra,
+                "impersonation_key": self._get_impersonation_key(),
+                "post_processing": self.post_processing,
+                "result_type": self.result_type,
+                "time_offsets": self.time_offsets,
+                "time_range": self.time_range,
+            },
+            default=json_int_dttm_ser,
+            allow_nan=True,
+            ignore_nan=False,
+            sort_keys=True,
         )
-        # Log QueryObject cache key generation for debugging
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "QueryObject CACHE KEY generated: %s from dict with keys: %s",
-                cache_key,
-                sorted(cache_dict.keys()),
-            )
+
+    def memoized_cache_key(
+        self,
+        get_extra: Callable[[], dict[str, Any]],
+        **extra: Any,
+    ) -> str:
+        """
+        The cache key, computed once for each state of the query object.
+
+        The cache key of a query is requested many times while processing it, and
+        the values it adds about the datasource, such as its RLS filters and the
+        keys of its Jinja templates, are expensive to compute. They are returned by
+        `get_extra`, which is only called when the query object, or `extra`, changed
+        since the cache key was last computed. These values must not change during
+        the lifetime of the query object, which is a single request.
+
+        :param get_extra: Get the values added to the cache key about the datasource
+        :param extra: Other values added to the cache key
+        :returns: The cache key
+        """
+        form = self._get_cache_key_form(extra)
+        if (cache_key := self._cache_keys.get(form)) is None:
+            cache_key = self.cache_key(**get_extra(), **extra)
+            self._cache_keys[form] = cache_key
         return cache_key
 
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
@@ -522,20 +579,10 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
-            for post_process in self.post_processing:
-                operation = post_process.get("operation")
-                if not operation:
-                    raise InvalidPostProcessingError(
-                        _("`operation` property of post processing object undefined")
-                    )
-                if not hasattr(pandas_postprocessing, operation):
-                    raise InvalidPostProcessingError(
-                        _(
-                            "Unsupported post processing operation: %(operation)s",
-                            type=operation,
-                        )
-                    )
-                options = post_process.get("options", {})
-                df = getattr(pandas_postprocessing, operation)(df, **options)
+        steps = plan_post_processing(self.post_processing)
+        with event_logger.log_context(
+            f"{self.__class__.__name__}.post_processing"
+        ) as log:
+            df, durations = execute_post_processing(df, steps)
+            log(post_processing=durations)
             return df
@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the values stored by ``QueryCacheManager``.
+
+A cache value is a dict holding the query result dataframe under ``df`` plus some
+metadata (query, applied filters, annotation data, ...). The pickle codec stores
+it as-is, leaving the serialization of the dataframe to the cache backend. The
+Arrow IPC and Parquet codecs replace ``df`` with a compressed binary payload and
+keep the metadata, including the row count and column names, next to it, so that
+the dataframe only needs to be deserialized when it's actually used.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# keys used by the binary codecs in the cache value, in place of ``df``
+CODEC_KEY = "df_codec"
+PAYLOAD_KEY = "df_payload"
+DTYPES_KEY = "df_dtypes"
+ROWCOUNT_KEY = "rowcount"
+COLNAMES_KEY = "colnames"
+
+
+class QueryCacheCodec(ABC):
+    """
+    Serializes the dataframe of a query cache value.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the value to be stored in the cache.
+        """
+
+    @abstractmethod
+    def decode_df(self, value: dict[str, Any]) -> pd.DataFrame:
+        """
+        Deserialize the dataframe of a value returned by ``encode``.
+        """
+
+
+class PickleQueryCacheCodec(QueryCacheCodec):
+    """
+    Store the dataframe as-is, to be pickled by the cache backend.
+    """
+
+    name = "pickle"
+
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]:
+        return value
+
+    def decode_df(self, value: dict[str, Any]) -> pd.DataFrame:
+        return value["df"]
+
+
+class BinaryQueryCacheCodec(QueryCacheCodec):
+    """
+    Base class for codecs storing the dataframe as an Arrow-based binary payload.
+
+    Dataframes that can't be round-tripped through Arrow (mixed-type object
+    columns, non-string or duplicate column names) are stored as-is instead.
+    """
+
+    def __init__(self, compression: str | None = "zstd") -> None:
+        self.compression = compression
+
+    @abstractmethod
+    def serialize(self, table: pa.Table) -> bytes: ...
+
+    @abstractmethod
+    def deserialize(self, payload: bytes) -> pa.Table: ...
+
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]:
+        df: pd.DataFrame = value["df"]
+        if not all(isinstance(column, str) for column in df.columns) or (
+            df.columns.has_duplicates
+        ):
+            return value
+
+        try:
+            payload = self.serialize(pa.Table.from_pandas(df))
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,
+        ) as ex:
+            logger.debug("Storing the dataframe as-is in the cache: %s", ex)
+            return value
+
+        encoded = {key: val for key, val in value.items() if key != "df"}
+        encoded.update(
+            {
+                CODEC_KEY: self.name,
+                PAYLOAD_KEY: payload,
+                DTYPES_KEY: {column: str(df[column].dtype) for column in df.columns},
+                ROWCOUNT_KEY: len(df.index),
+                COLNAMES_KEY: list(df.columns),
+            }
+        )
+        return encoded
+
+    def decode_df(self, value: dict[str, Any]) -> pd.DataFrame:
+        table = self.deserialize(value[PAYLOAD_KEY])
+        df = table.to_pandas(integer_object_nulls=True)
+
+        # Arrow infers a concrete type for object columns holding a single type of
+        # values, restore the original dtypes so that hits match the query result
+        for column, dtype in value.get(DTYPES_KEY, {}).items():
+            if column in df.columns and str(df[column].dtype) != dtype:
+                df[column] = df[column].astype(dtype)
+
+        return df
+
+
+class ArrowQueryCacheCodec(BinaryQueryCacheCodec):
+    """
+    Store the dataframe as a compressed Arrow IPC stream.
+    """
+
+    name = "arrow"
+
+    def serialize(self, table: pa.Table) -> bytes:
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def deserialize(self, payload: bytes) -> pa.Table:
+        return pa.ipc.open_stream(payload).read_all()
+
+
+class ParquetQueryCacheCodec(BinaryQueryCacheCodec):
+    """
+    Store the dataframe as a compressed Parquet file.
+    """
+
+    name = "parquet"
+
+    def serialize(self, table: pa.Table) -> bytes:
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink, compression=self.compression or "none")
+        return sink.getvalue().to_pybytes()
+
+    def deserialize(self, payload: bytes) -> pa.Table:
+        return pq.read_table(pa.BufferReader(payload))
+
+
+_codecs: dict[str, QueryCacheCodec] = {
+    codec.name: codec
+    for codec in (
+        PickleQueryCacheCodec(),
+        ArrowQueryCacheCodec(),
+        ParquetQueryCacheCodec(),
+    )
+}
+
+
+def get_df_loader(value: dict[str, Any]) -> Callable[[], pd.DataFrame]:
+    """
+    Return a function deserializing the dataframe of a cache value, written by any
+    of the codecs. Values written before codecs were introduced hold ``df`` as-is.
+    """
+    if CODEC_KEY not in value:
+        df = value["df"]
+        return lambda: df
+
+    if PAYLOAD_KEY not in value:
+        raise KeyError(PAYLOAD_KEY)
+    codec = _codecs[value[CODEC_KEY]]
+    return lambda: codec.decode_df(value)
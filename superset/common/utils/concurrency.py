@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TYPE_CHECKING, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    Flask,
+    g,
+    has_request_context,
+)
+
+from superset import db
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+T = TypeVar("T")
+
+
+def _in_current_context(func: Callable[[], T]) -> Callable[[], T]:
+    """
+    Wrap a function to run it in another thread within copies of the Flask contexts
+    of the current one.
+    """
+    app: Flask = current_app._get_current_object()  # pylint: disable=protected-access
+    g_vars: dict[str, Any] = dict(g.__dict__)
+
+    def run() -> T:
+        # Flask contexts are local to the thread that handles the request, so the
+        # app context and the g object are copied to the worker thread
+        with app.app_context():
+            for key, value in g_vars.items():
+                setattr(g, key, value)
+            try:
+                return func()
+            finally:
+                # the metadata database session is scoped to the thread
+                db.session.remove()
+
+    if has_request_context():
+        return copy_current_request_context(run)
+    return run
+
+
+def run_concurrently(funcs: Sequence[Callable[[], T]], max_workers: int) -> list[T]:
+    """
+    Run functions concurrently in a thread pool, within the current Flask context.
+
+    The results are returned in the order of the functions. All the functions are
+    run even if some of them fail, and then the error of the first one that failed
+    is raised.
+
+    :param funcs: The functions to run
+    :param max_workers: The maximum number of functions run at the same time
+    :returns: The results of the functions
+    """
+    if max_workers <= 1 or len(funcs) <= 1:
+        return [func() for func in funcs]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(funcs)),
+        thread_name_prefix="superset-query",
+    ) as executor:
+        futures: list[Future[T]] = [
+            executor.submit(_in_current_context(func)) for func in funcs
+        ]
+
+    return [future.result() for future in futures]
+
+
+def get_database_concurrency(database: Database | None, concurrency: int) -> int:
+    """
+    Bound the number of queries run at the same time on a database by its connection
+    pool, when the ``pool_size`` engine parameter is set.
+
+    :param database: The database the queries run on
+    :param concurrency: The maximum number of queries run at the same time
+    :returns: The number of queries that can run at the same time
+    """
+    if database and concurrency > 1:
+        engine_params = database.get_extra().get("engine_params", {})
+        pool_size = engine_params.get("pool_size")
+        if isinstance(pool_size, int):
+            # the default overflow of the SQLAlchemy QueuePool
+            max_overflow = engine_params.get("max_overflow", 10)
+            concurrency = min(concurrency, pool_size + max(max_overflow, 0))
+
+    return max(concurrency, 1)
@@ -0,0 +1,222 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Incremental refresh of the results of time series queries.
+
+The results of queries on datasets with ``incremental_cache`` enabled in their
+extra, grouped by time buckets of the main datetime column, are kept in the data
+cache along with the time range they cover. When such a query is refreshed, only
+the time buckets that may have changed are queried again: from the last time bucket
+of the kept result, which may have been partial, to the end of the new time range,
+and the bucket straddling the start of the new time range, when it moved. The other
+time buckets are reused, and those that fell outside of the time range are dropped.
+
+This assumes the tables are append-only: rows in past time buckets are never
+inserted, updated or deleted.
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import datetime
+from typing import Any, NamedTuple, TYPE_CHECKING
+
+import pandas as pd
+
+from superset.utils.core import (
+    DTTM_ALIAS,
+    FilterOperator,
+    get_base_axis_columns,
+    get_column_name,
+    get_metric_name,
+    is_adhoc_metric,
+)
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+
+
+class IncrementalRefresh(NamedTuple):
+    # the rows of the previous result that are still valid
+    reused: pd.DataFrame
+    # the time ranges to query again
+    windows: list[tuple[datetime, datetime]]
+
+
+def get_time_label(query_obj: QueryObject, datasource: Any) -> str | None:
+    """
+    Get the label of the time bucket column of a query object, when its result can
+    be refreshed incrementally.
+
+    :param query_obj: The query object
+    :param datasource: The datasource of the query object
+    :return: The label of the time bucket column, or None
+    """
+    main_dttm_col = getattr(datasource, "main_dttm_col", None)
+    if (
+        not getattr(datasource, "incremental_cache", False)
+        or not main_dttm_col
+        or getattr(datasource, "offset", 0)
+        or not query_obj.from_dttm
+        or not query_obj.to_dttm
+        or query_obj.time_offsets
+        or query_obj.time_shift
+        or query_obj.series_limit
+        or query_obj.row_offset
+        or query_obj.is_rowcount
+    ):
+        return None
+
+    # all the time filters must be on the main datetime column
+    if any(
+        flt.get("op") == FilterOperator.TEMPORAL_RANGE
+        and flt.get("col") != main_dttm_col
+        for flt in query_obj.filter
+    ):
+        return None
+
+    time_grain = query_obj.extras.get("time_grain_sqla")
+    if query_obj.is_timeseries:
+        if query_obj.granularity != main_dttm_col:
+            return None
+        label = DTTM_ALIAS
+    else:
+        base_axis_columns = get_base_axis_columns(query_obj.columns)
+        if len(base_axis_columns) != 1:
+            return None
+        column = base_axis_columns[0]
+        if column["sqlExpression"] != main_dttm_col:
+            return None
+        time_grain = column.get("timeGrain") or time_grain
+        label = get_column_name(column)
+
+    # time buckets must start at their label, unlike eg. weeks ending on Saturday
+    if time_grain and time_grain.startswith("P") and "/" in time_grain:
+        return None
+
+    return label
+
+
+def plan_refresh(  # pylint: disable=too-many-arguments
+    df: pd.DataFrame,
+    label: str,
+    previous_from_dttm: datetime,
+    previous_to_dttm: datetime,
+    from_dttm: datetime,
+    to_dttm: datetime,
+) -> IncrementalRefresh | None:
+    """
+    Plan the incremental refresh of the previous result of a query.
+
+    :param df: The previous result
+    :param label: The label of the time bucket column
+    :param previous_from_dttm: The start of the time range of the previous result
+    :param previous_to_dttm: The end of the time range of the previous result
+    :param from_dttm: The start of the new time range
+    :param to_dttm: The end of the new time range
+    :return: The rows to reuse and the time ranges to query, or None when the result
+        must be queried again as a whole
+    """
+    if (
+        df.empty
+        or label not in df.columns
+        or not pd.api.types.is_datetime64_dtype(df[label])
+        or from_dttm < previous_from_dttm
+        or to_dttm < previous_to_dttm
+    ):
+        return None
+
+    buckets = df[label]
+    last_bucket = buckets.max()
+    if last_bucket >= to_dttm:
+        return None
+
+    reused = buckets < last_bucket
+    if from_dttm > previous_from_dttm:
+        reused &= buckets >= from_dttm
+    if not reused.any():
+        return None
+
+    windows = []
+    first_bucket = buckets[reused].min()
+    if from_dttm > previous_from_dttm and from_dttm < first_bucket:
+        # the bucket straddling the start of the time range
+        windows.append((from_dttm, first_bucket.to_pydatetime()))
+    windows.append((last_bucket.to_pydatetime(), to_dttm))
+
+    return IncrementalRefresh(df[reused], windows)
+
+
+def with_time_range(
+    query_obj: QueryObject,
+    from_dttm: datetime,
+    to_dttm: datetime,
+) -> QueryObject:
+    """
+    Copy a query object, restricted to a time range and without post processing.
+    """
+    query_obj = copy.copy(query_obj)
+    query_obj.from_dttm = query_obj.inner_from_dttm = from_dttm
+    query_obj.to_dttm = query_obj.inner_to_dttm = to_dttm
+    query_obj.filter = [
+        (
+            {**flt, "val": f"{from_dttm} : {to_dttm}"}
+            if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+            else flt
+        )
+        for flt in query_obj.filter
+    ]
+    query_obj.post_processing = []
+    return query_obj
+
+
+def splice(
+    reused: pd.DataFrame,
+    dfs: list[pd.DataFrame],
+    label: str,
+    orderby: list[tuple[Any, bool]],
+) -> pd.DataFrame | None:
+    """
+    Splice the reused rows of a previous result with the rows queried again, in the
+    order of the query.
+
+    :param reused: The reused rows
+    :param dfs: The rows queried again
+    :param label: The label of the time bucket column
+    :param orderby: The order by clauses of the query
+    :return: The result, or None when it can't be ordered like the query
+    """
+    df = pd.concat([reused, *(df for df in dfs if not df.empty)], ignore_index=True)
+    df = df.sort_values(label, kind="stable", ignore_index=True)
+    if orderby:
+        by = [
+            (
+                get_metric_name(column)
+                if is_adhoc_metric(column)
+                else get_column_name(column)
+            )
+            for column, _ in orderby
+        ]
+        if not set(by).issubset(df.columns):
+            return None
+        df = df.sort_values(
+            by,
+            ascending=[ascending for _, ascending in orderby],
+            kind="stable",
+            ignore_index=True,
+        )
+    return df
@@ -17,13 +17,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Callable
 
 from flask import current_app
 from flask_caching import Cache
 from pandas import DataFrame
 
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.cache_codecs import (
+    COLNAMES_KEY,
+    get_df_loader,
+    PickleQueryCacheCodec,
+    QueryCacheCodec,
+    ROWCOUNT_KEY,
+)
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -67,7 +75,9 @@ class QueryCacheManager:
         cache_dttm: str | None = None,
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
+        is_stale: bool = False,
     ) -> None:
+        self._df_loader: Callable[[], DataFrame] | None = None
         self.df = df
         self.query = query
         self.annotation_data = {} if annotation_data is None else annotation_data
@@ -83,6 +93,45 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        self.is_stale = is_stale
+
+    @property
+    def df(self) -> DataFrame:
+        """
+        The query result, deserialized from the cache value on first access.
+        """
+        if self._df_loader is not None:
+            self._df = self._df_loader()
+            self._df_loader = None
+        return self._df
+
+    @df.setter
+    def df(self, df: DataFrame) -> None:
+        self._df = df
+        self._df_loader = None
+
+    @property
+    def rowcount(self) -> int:
+        if self._df_loader is not None and self.cache_value:
+            if (rowcount := self.cache_value.get(ROWCOUNT_KEY)) is not None:
+                return rowcount
+        return len(self.df.index)
+
+    @property
+    def colnames(self) -> list[str]:
+        if self._df_loader is not None and self.cache_value:
+            if (colnames := self.cache_value.get(COLNAMES_KEY)) is not None:
+                return colnames
+        return list(self.df.columns)
+
+    @staticmethod
+    def get_codec(region: CacheRegion) -> QueryCacheCodec:
+        """
+        Return the codec used to serialize query results in a cache region
+        """
+        return current_app.config["QUERY_CACHE_CODECS"].get(
+            region, PickleQueryCacheCodec()
+        )
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -94,6 +143,7 @@ class QueryCacheManager:
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: int | None = None,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
@@ -129,10 +179,11 @@ class QueryCacheManager:
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
-                    value=value,
+                    value=self.get_codec(region).encode(value),
                     timeout=timeout,
                     datasource_uid=datasource_uid,
                     region=region,
+                    stale_timeout=stale_timeout,
                 )
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
@@ -162,7 +213,8 @@ class QueryCacheManager:
             logger.debug("CACHE GET - Key: %s, Region: %s", key, region)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                # pylint: disable=protected-access
+                query_cache._df_loader = get_df_loader(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -182,6 +234,15 @@ class QueryCacheManager:
                     cache_value["dttm"] if cache_value is not None else None
                 )
                 query_cache.cache_value = cache_value
+                # values kept past their timeout to be served while refreshed
+                if stale_after := cache_value.get("stale_after"):
+                    query_cache.is_stale = (
+                        datetime.fromisoformat(stale_after) <= datetime.utcnow()
+                    )
+                    if query_cache.is_stale:
+                        current_app.config["STATS_LOGGER"].incr(
+                            "loaded_stale_from_cache"
+                        )
                 current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
             except KeyError as ex:
                 logger.exception(ex)
@@ -206,12 +267,15 @@ class QueryCacheManager:
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: int | None = None,
     ) -> None:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+            set_and_log_cache(
+                _cache[region], key, value, timeout, datasource_uid, stale_timeout
+            )
 
     @staticmethod
     def delete(
@@ -0,0 +1,471 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Reuse of cached query results to answer narrower queries.
+
+Dashboards often run the same aggregation with different group by columns, time
+grains or filters. When ``CHART_DATA_SEMANTIC_CACHE`` is enabled, the results of
+queries are kept in the data cache, indexed by the parts of the query that must be
+the same to reuse them: the datasource, time range, row level security and extras.
+A query can then be answered in pandas from a cached result of a wider query with:
+
+- filters on its group by columns, in addition to its own filters
+- group by columns dropped, when the metrics can be aggregated again: ``SUM``,
+  ``COUNT``, ``MIN`` and ``MAX``
+- a coarser time grain, with the same constraint on metrics
+
+Queries using Jinja templates, which may depend on the filters of the query, as
+well as queries with a ``HAVING`` clause, a series limit or an offset, are always
+run on the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Callable, TYPE_CHECKING
+
+import pandas as pd
+from flask import current_app, g
+
+from superset import feature_flag_manager
+from superset.constants import TimeGrain
+from superset.extensions import cache_manager, security_manager
+from superset.superset_typing import Column, Metric, QueryObjectDict
+from superset.utils import json
+from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.core import (
+    DatasourceType,
+    DTTM_ALIAS,
+    FilterOperator,
+    get_column_name,
+    get_metric_name,
+    is_adhoc_metric,
+    is_base_axis,
+)
+
+if TYPE_CHECKING:
+    from superset.models.helpers import ExploreMixin
+
+logger = logging.getLogger(__name__)
+
+# the number of results kept for the same datasource, time range and extras
+MAX_RESULTS = 10
+
+# the parts of a query that must be the same to reuse its result
+EXACT_FIELDS = (
+    "apply_fetch_values_predicate",
+    "from_dttm",
+    "granularity",
+    "inner_from_dttm",
+    "inner_to_dttm",
+    "is_timeseries",
+    "time_shift",
+    "to_dttm",
+)
+
+# aggregates whose results can be aggregated again, and how
+AGGREGATES = {"SUM": "sum", "COUNT": "sum", "MIN": "min", "MAX": "max"}
+AGGREGATE_REGEX = re.compile(
+    r"^\s*(SUM|COUNT|MIN|MAX)\s*\((?!\s*DISTINCT\b)[^()]*\)\s*$",
+    re.IGNORECASE,
+)
+
+# time grains truncated by pandas like databases do, from the finest to the coarsest
+TIME_GRAINS: dict[str | None, Callable[[pd.Series], pd.Series]] = {
+    None: lambda series: series,
+    TimeGrain.MINUTE: lambda series: series.dt.floor("min"),
+    TimeGrain.HOUR: lambda series: series.dt.floor("h"),
+    TimeGrain.DAY: lambda series: series.dt.floor("D"),
+    TimeGrain.MONTH: lambda series: series.dt.to_period("M").dt.to_timestamp(),
+    TimeGrain.QUARTER: lambda series: series.dt.to_period("Q").dt.to_timestamp(),
+    TimeGrain.YEAR: lambda series: series.dt.to_period("Y").dt.to_timestamp(),
+}
+
+FILTER_OPERATORS = {
+    FilterOperator.EQUALS,
+    FilterOperator.NOT_EQUALS,
+    FilterOperator.GREATER_THAN,
+    FilterOperator.LESS_THAN,
+    FilterOperator.GREATER_THAN_OR_EQUALS,
+    FilterOperator.LESS_THAN_OR_EQUALS,
+    FilterOperator.IN,
+    FilterOperator.NOT_IN,
+    FilterOperator.IS_NULL,
+    FilterOperator.IS_NOT_NULL,
+}
+
+
+def _has_template(value: Any) -> bool:
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return "{{" in text or "{%" in text
+
+
+def _is_reusable(datasource: ExploreMixin, query_obj: QueryObjectDict) -> bool:
+    """
+    Whether the result of a query can be reused, or derived from another one.
+    """
+    extras = query_obj.get("extras") or {}
+    return bool(
+        getattr(datasource, "type", None) == DatasourceType.TABLE
+        and not query_obj.get("is_rowcount")
+        and not query_obj.get("row_offset")
+        and not query_obj.get("series_limit")
+        and not extras.get("having")
+        and not _has_template(query_obj)
+        and not _has_template(datasource.sql or "")
+        and not any(
+            _has_template(column.expression or "") for column in datasource.columns
+        )
+        and not any(
+            _has_template(metric.expression or "") for metric in datasource.metrics
+        )
+    )
+
+
+def _get_impersonation_key(datasource: ExploreMixin) -> Any:
+    database = datasource.database
+    if (
+        database.impersonate_user
+        or feature_flag_manager.is_feature_enabled("CACHE_QUERY_BY_USER")
+        or database.get_extra().get("per_user_caching", False)
+    ):
+        return database.db_engine_spec.get_impersonation_key(getattr(g, "user", None))
+    return None
+
+
+def _get_family_key(datasource: ExploreMixin, query_obj: QueryObjectDict) -> str:
+    """
+    Get the key of the results that can be reused for a query.
+    """
+    extras = {
+        key: value
+        for key, value in (query_obj.get("extras") or {}).items()
+        if key != "time_grain_sqla"
+    }
+    return generate_cache_key(
+        {
+            "datasource": datasource.uid,
+            "changed_on": datasource.changed_on,
+            "rls": security_manager.get_rls_cache_key(datasource),
+            "impersonation_key": _get_impersonation_key(datasource),
+            "extras": extras,
+            **{field: query_obj.get(field) for field in EXACT_FIELDS},
+        },
+        "semantic_family_",
+    )
+
+
+def _get_results(family_key: str) -> list[dict[str, Any]]:
+    """
+    Get the descriptions of the cached results of a family, the latest last.
+    """
+    value = cache_manager.data_cache.get(family_key) or {}
+    return value.get("results", [])
+
+
+def _describe(query_obj: QueryObjectDict) -> dict[str, Any]:
+    """
+    Describe the parts of a query that may differ from a reused result.
+    """
+    columns = query_obj.get("columns") or []
+    axis = next((column for column in columns if is_base_axis(column)), None)
+    time_grain = (query_obj.get("extras") or {}).get("time_grain_sqla")
+    if axis:
+        axis = dict(axis)
+        time_grain = axis.pop("timeGrain", None) or time_grain
+    elif not query_obj.get("is_timeseries"):
+        time_grain = None
+
+    return {
+        "axis": axis,
+        "columns": [column for column in columns if not is_base_axis(column)],
+        "metrics": query_obj.get("metrics") or [],
+        "filter": query_obj.get("filter") or [],
+        "time_grain": time_grain,
+    }
+
+
+def _get_aggregate(datasource: ExploreMixin, metric: Metric) -> str | None:
+    """
+    Get how to aggregate the values of a metric again, if possible.
+    """
+    if is_adhoc_metric(metric):
+        if metric.get("expressionType") == "SIMPLE":
+            aggregate = str(metric.get("aggregate") or "").upper()
+            return AGGREGATES.get(aggregate)
+        expression = metric.get("sqlExpression") or ""
+    else:
+        expression = next(
+            (
+                saved_metric.expression
+                for saved_metric in datasource.metrics
+                if saved_metric.metric_name == metric
+            ),
+            "",
+        )
+    if match := AGGREGATE_REGEX.match(expression):
+        return AGGREGATES[match.group(1).upper()]
+    return None
+
+
+def _filter_mask(series: pd.Series, flt: dict[str, Any]) -> pd.Series | None:
+    """
+    Get the mask of the rows matching a filter like a database would, if possible.
+    """
+    operator = flt.get("op")
+    if operator == FilterOperator.IS_NULL:
+        return series.isna()
+    if operator == FilterOperator.IS_NOT_NULL:
+        return series.notna()
+
+    value = flt.get("val")
+    values = value if isinstance(value, (list, tuple)) else [value]
+    if not values:
+        return None
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+        series
+    ):
+        if not all(
+            isinstance(val, (int, float)) and not isinstance(val, bool)
+            for val in values
+        ):
+            return None
+    elif pd.api.types.is_object_dtype(series):
+        # strings are only compared for equality, when it doesn't depend on the
+        # case sensitivity of the collation of the database
+        if operator not in {
+            FilterOperator.EQUALS,
+            FilterOperator.NOT_EQUALS,
+            FilterOperator.IN,
+            FilterOperator.NOT_IN,
+        } or not all(isinstance(val, str) for val in values):
+            return None
+        strings = series.dropna().astype(str)
+        folded = [val.casefold() for val in values]
+        if not strings.isin(values).equals(strings.str.casefold().isin(folded)):
+            return None
+    else:
+        return None
+
+    if operator in {FilterOperator.IN, FilterOperator.NOT_IN}:
+        mask = series.isin(values)
+        return mask if operator == FilterOperator.IN else series.notna() & ~mask
+    if isinstance(value, (list, tuple)):
+        return None
+    if operator == FilterOperator.EQUALS:
+        return series == value
+    if operator == FilterOperator.NOT_EQUALS:
+        return series.notna() & (series != value)
+    if operator == FilterOperator.GREATER_THAN:
+        return series > value
+    if operator == FilterOperator.LESS_THAN:
+        return series < value
+    if operator == FilterOperator.GREATER_THAN_OR_EQUALS:
+        return series >= value
+    return series <= value
+
+
+def _derive(  # pylint: disable=too-many-return-statements,too-many-locals
+    datasource: ExploreMixin,
+    cached: dict[str, Any],
+    df: pd.DataFrame,
+    query_obj: QueryObjectDict,
+    labels_expected: list[str],
+) -> pd.DataFrame | None:
+    """
+    Derive the result of a query from the cached result of another one, if possible.
+    """
+    wanted = _describe(query_obj)
+    if (
+        any(column not in cached["columns"] for column in wanted["columns"])
+        or any(metric not in cached["metrics"] for metric in wanted["metrics"])
+        or any(flt not in wanted["filter"] for flt in cached["filter"])
+        or wanted["axis"] != cached["axis"]
+    ):
+        return None
+
+    time_grains = list(TIME_GRAINS)
+    regrain = wanted["time_grain"] != cached["time_grain"]
+    if regrain and (
+        wanted["time_grain"] not in TIME_GRAINS
+        or cached["time_grain"] not in TIME_GRAINS
+        or time_grains.index(wanted["time_grain"])
+        < time_grains.index(cached["time_grain"])
+    ):
+        return None
+
+    # apply the additional filters on the group by columns of the cached result
+    for flt in wanted["filter"]:
+        if flt in cached["filter"]:
+            continue
+        column = flt.get("col")
+        if (
+            not isinstance(column, str)
+            or column not in cached["columns"]
+            or flt.get("op") not in FILTER_OPERATORS
+            or (mask := _filter_mask(df[column], flt)) is None
+        ):
+            return None
+        df = df[mask]
+
+    # aggregate the metrics again when group by columns or time buckets are merged
+    groupby = [get_column_name(column) for column in wanted["columns"]]
+    time_label = None
+    if wanted["axis"]:
+        time_label = get_column_name(wanted["axis"])
+    elif query_obj.get("is_timeseries"):
+        time_label = DTTM_ALIAS
+    if time_label:
+        groupby.insert(0, time_label)
+
+    if regrain or len(wanted["columns"]) < len(cached["columns"]):
+        aggregates = {
+            get_metric_name(metric): _get_aggregate(datasource, metric)
+            for metric in wanted["metrics"]
+        }
+        if None in aggregates.values() or (not groupby and df.empty):
+            return None
+
+        if regrain:
+            if not time_label or not pd.api.types.is_datetime64_dtype(
+                df[time_label]
+            ):
+                return None
+            df = df.assign(
+                **{time_label: TIME_GRAINS[wanted["time_grain"]](df[time_label])}
+            )
+        if groupby:
+            grouped = df.groupby(groupby, dropna=False, sort=False)
+            df = pd.DataFrame(
+                {
+                    label: (
+                        grouped[label].sum(min_count=1)
+                        if aggregate == "sum"
+                        else grouped[label].agg(aggregate)
+                    )
+                    for label, aggregate in aggregates.items()
+                }
+            ).reset_index()
+        else:
+            df = pd.DataFrame(
+                {
+                    label: [
+                        df[label].sum(min_count=1)
+                        if aggregate == "sum"
+                        else df[label].agg(aggregate)
+                    ]
+                    for label, aggregate in aggregates.items()
+                }
+            )
+
+    if not set(labels_expected).issubset(df.columns):
+        return None
+
+    if orderby := query_obj.get("orderby"):
+        by = [
+            (
+                get_metric_name(column)
+                if is_adhoc_metric(column)
+                else get_column_name(column)
+            )
+            for column, _ in orderby
+        ]
+        if not set(by).issubset(df.columns):
+            return None
+        df = df.sort_values(
+            by, ascending=[ascending for _, ascending in orderby], kind="stable"
+        )
+
+    if row_limit := query_obj.get("row_limit"):
+        df = df.head(row_limit)
+
+    return df[labels_expected].reset_index(drop=True)
+
+
+def get_derived_df(
+    datasource: ExploreMixin,
+    query_obj: QueryObjectDict,
+    labels_expected: list[str],
+) -> pd.DataFrame | None:
+    """
+    Get the result of a query from a cached result it can be derived from.
+
+    :param datasource: The datasource of the query
+    :param query_obj: The query
+    :param labels_expected: The labels of the columns of the result
+    :return: The result, or None if it can't be derived from a cached result
+    """
+    stats_logger = current_app.config["STATS_LOGGER"]
+    if not _is_reusable(datasource, query_obj):
+        return None
+
+    data_cache = cache_manager.data_cache
+    for cached in reversed(_get_results(_get_family_key(datasource, query_obj))):
+        if (value := data_cache.get(cached["key"])) is None:
+            continue
+        try:
+            df = _derive(datasource, cached, value["df"], query_obj, labels_expected)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not derive query result", exc_info=True)
+            continue
+        if df is not None:
+            stats_logger.incr("semantic_cache.hit")
+            return df
+
+    stats_logger.incr("semantic_cache.miss")
+    return None
+
+
+def set_df(
+    datasource: ExploreMixin,
+    query_obj: QueryObjectDict,
+    df: pd.DataFrame,
+) -> None:
+    """
+    Cache the result of a query, to derive the results of narrower queries from it.
+
+    :param datasource: The datasource of the query
+    :param query_obj: The query
+    :param df: The result of the query
+    """
+    row_limit = query_obj.get("row_limit")
+    if (row_limit and len(df.index) >= row_limit) or not _is_reusable(
+        datasource, query_obj
+    ):
+        # a truncated result can't answer other queries
+        return
+
+    timeout = current_app.config["CHART_DATA_SEMANTIC_CACHE_TIMEOUT"]
+    family_key = _get_family_key(datasource, query_obj)
+    cached = _describe(query_obj)
+    cached["key"] = generate_cache_key(
+        {"family": family_key, **cached}, "semantic_result_"
+    )
+    set_and_log_cache(
+        cache_manager.data_cache, cached["key"], {"df": df}, timeout, datasource.uid
+    )
+
+    results = [
+        result
+        for result in _get_results(family_key)
+        if result["key"] != cached["key"]
+    ]
+    results = [*results, cached][-MAX_RESULTS:]
+    set_and_log_cache(
+        cache_manager.data_cache, family_key, {"results": results}, timeout
+    )
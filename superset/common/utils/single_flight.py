@@ -0,0 +1,158 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Coalescing of concurrent computations of the same cached value.
+
+When a cache entry is missing, every concurrent request for it would otherwise
+compute it. With ``single_flight`` only one of them, the leader, computes and caches
+the value, while the others wait for it and read it back from the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, TypeVar
+
+from flask import current_app
+
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import CreateKeyValueDistributedLockFailedException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOCK_NAMESPACE = "single_flight"
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+# the in-flight computations of this process, by key
+_flights: dict[str, threading.Event] = {}
+_flights_lock = threading.Lock()
+
+
+def _incr(key: str) -> None:
+    current_app.config["STATS_LOGGER"].incr(f"single_flight.{key}")
+
+
+def _wait_for_worker(
+    key: str,
+    load: Callable[[], T | None],
+    deadline: float,
+) -> T | None:
+    """
+    Poll the cache while another worker holds the lock of the key.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.distributed_lock.get import GetDistributedLock
+
+    interval = POLL_INTERVAL
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+        if (value := load()) is not None:
+            return value
+        if not GetDistributedLock(namespace=LOCK_NAMESPACE, params={"key": key}).run():
+            # the other worker is done, but didn't cache the value
+            return load()
+    return None
+
+
+def _lead(
+    key: str,
+    load: Callable[[], T | None],
+    compute: Callable[[], T],
+    timeout: float,
+    distributed: bool,
+) -> T:
+    if not distributed:
+        _incr("leader")
+        return compute()
+
+    try:
+        with KeyValueDistributedLock(LOCK_NAMESPACE, key=key):
+            # the value may have been cached while the lock was being acquired
+            if (value := load()) is not None:
+                _incr("coalesced")
+                return value
+            _incr("leader")
+            # errors are raised outside of the lock, so that it is released
+            try:
+                return compute()
+            except Exception as ex:  # pylint: disable=broad-except
+                error = ex
+        raise error
+    except CreateKeyValueDistributedLockFailedException:
+        pass
+
+    _incr("waiting")
+    if (value := _wait_for_worker(key, load, time.monotonic() + timeout)) is not None:
+        _incr("coalesced")
+        return value
+
+    _incr("fallback")
+    return compute()
+
+
+def single_flight(
+    key: str,
+    load: Callable[[], T | None],
+    compute: Callable[[], T],
+    timeout: float,
+    distributed: bool = False,
+) -> T:
+    """
+    Compute a cached value once for concurrent callers sharing the same key.
+
+    The first caller of a key computes the value, other callers of the same process
+    wait for it to finish, for at most ``timeout`` seconds, and then load the value
+    from the cache. Callers that can't load it, because it wasn't cached or the
+    computation timed out, compute it themselves.
+
+    With ``distributed``, callers of other processes are coalesced too, using a
+    ``KeyValueDistributedLock``: the process holding the lock computes the value
+    while the others poll the cache until it's set or the lock is released.
+
+    :param key: The cache key of the value
+    :param load: Load the value from the cache, returning ``None`` if it's missing
+    :param compute: Compute the value, and cache it
+    :param timeout: The maximum number of seconds to wait for another caller
+    :param distributed: Whether to coalesce callers of other processes
+    :returns: The value
+    """
+    with _flights_lock:
+        if leader := key not in _flights:
+            _flights[key] = threading.Event()
+        flight = _flights[key]
+
+    if leader:
+        try:
+            return _lead(key, load, compute, timeout, distributed)
+        finally:
+            with _flights_lock:
+                del _flights[key]
+            flight.set()
+
+    _incr("waiting")
+    if flight.wait(timeout) and (value := load()) is not None:
+        _incr("coalesced")
+        return value
+
+    _incr("fallback")
+    return compute()
@@ -70,6 +70,7 @@ if TYPE_CHECKING:
     from flask_appbuilder.security.sqla import models
     from sqlglot import Dialect, Dialects  # pylint: disable=disallowed-sql-import
 
+    from superset.common.utils.cache_codecs import QueryCacheCodec
     from superset.connectors.sqla.models import SqlaTable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
@@ -81,6 +82,8 @@ if TYPE_CHECKING:
 STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
+# Note that you can use `AsyncDBEventLogger` to write the events to the metadata
+# database in batches from a background thread, instead of with each request
 # Note that you can use `StdOutEventLogger` for debugging
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
@@ -197,6 +200,15 @@ SUPERSET_DASHBOARD_PERIODICAL_REFRESH_LIMIT = 0
 SUPERSET_DASHBOARD_PERIODICAL_REFRESH_WARNING_MESSAGE = None
 
 SUPERSET_DASHBOARD_POSITION_DATA_LIMIT = 65535
+
+# The library backing `superset.utils.json`, one of "simplejson" or "orjson". orjson
+# (`pip install apache-superset[orjson]`) is considerably faster and produces the same
+# values, but its output is compact: there's no whitespace after separators and
+# non-ASCII characters aren't escaped. Calls orjson can't serve identically (custom
+# encoder classes, NaN values kept or rejected, integers exceeding 64 bits, non-string
+# keys, ...) are still handled by simplejson. When parsing, orjson reads integers
+# exceeding 64 bits as floats.
+JSON_BACKEND: Literal["simplejson", "orjson"] = "simplejson"
 CUSTOM_SECURITY_MANAGER = None
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
@@ -863,6 +875,16 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# Whether the cache warm-up task warms up the charts in the Celery worker, running
+# their queries directly as the executor, instead of requesting the web servers to
+# warm up each chart. Charts with the same cache keys are only warmed up once. The
+# result of the task then lists the warmed up charts as `results`, instead of the
+# `scheduled` requests.
+CACHE_WARMUP_IN_PROCESS = False
+# How many charts of a database are warmed up at the same time in the worker. It's
+# further bounded by the `pool_size` engine parameter of the database.
+CACHE_WARMUP_CONCURRENCY = 4
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -957,6 +979,84 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How chart data query results are serialized in the caches above, per cache region
+# ("default" for CACHE_CONFIG, "data" for DATA_CACHE_CONFIG). By default the
+# dataframe is pickled along with its metadata by the cache backend. The Arrow IPC
+# and Parquet codecs store it compressed instead, which is cheaper to (de)serialize
+# and smaller for large results, eg:
+#
+# from superset.common.utils.cache_codecs import ArrowQueryCacheCodec
+# QUERY_CACHE_CODECS = {"data": ArrowQueryCacheCodec(compression="zstd")}
+#
+# Values written with any codec can be read regardless of this setting.
+QUERY_CACHE_CODECS: dict[str, QueryCacheCodec] = {}
+
+# Identical chart data queries missing the data cache at the same time can be
+# coalesced: one request runs the query while the others wait, for at most this many
+# seconds, for its result to be cached, instead of all running it. Requires a data
+# cache (see DATA_CACHE_CONFIG), disabled when set to 0.
+CHART_DATA_COALESCING_TIMEOUT = 0
+# Whether to coalesce the queries of all the web server processes, using a lock in
+# the key-value table of the metastore, instead of only those of each process.
+CHART_DATA_COALESCING_DISTRIBUTED = False
+
+# Maximum number of queries of a chart data request, eg. the main and totals queries
+# of a table, run concurrently in a thread pool. It's also bounded by the
+# `pool_size` and `max_overflow` engine parameters of the database when set. Set to
+# 1 to run them one after another.
+CHART_DATA_QUERY_CONCURRENCY = 1
+
+# How the queries of the time comparisons (time offsets) of a chart missing the
+# cache are run:
+# - "sequential": one after another
+# - "concurrent": in a thread pool, bounded by `CHART_DATA_QUERY_CONCURRENCY`
+# - "fused": as a single query, the `UNION ALL` of the queries, when the database
+#   supports subqueries, falling back to "concurrent" otherwise
+# Each time offset is still cached under its own cache key.
+TIME_OFFSETS_EXECUTION_MODE: Literal["sequential", "concurrent", "fused"] = (
+    "sequential"
+)
+
+# How many seconds chart data query results are kept in the data cache past their
+# cache timeout. During that time they are still served, marked as `is_stale`, while
+# a Celery worker refreshes them in the background (stale-while-revalidate). It can
+# be overridden with `stale_cache_timeout` in the params of a chart, or the extra of
+# a dataset or database. Set to 0 to disable.
+DATA_CACHE_STALE_TIMEOUT = 0
+
+# Whether to also cache the results of chart data queries before their post
+# processing, eg. a pivot, under the cache key of the query without it. Queries only
+# differing by their post processing, eg. when changing the rolling window of a
+# chart, then post process the cached result instead of querying the database again.
+CHART_DATA_CACHE_RAW_RESULTS = False
+
+# How many seconds the results of time series queries on datasets with
+# `incremental_cache` enabled in their extra are kept to be refreshed incrementally:
+# only the time buckets from the last one of the previous result are queried again.
+# This must only be enabled on append-only tables.
+CHART_DATA_INCREMENTAL_CACHE_TIMEOUT = int(timedelta(days=7).total_seconds())
+
+# Whether to answer queries from the cached results of wider queries on the same
+# dataset, time range and extras, eg. a chart filtering or dropping a group by column
+# of another chart, or using a coarser time grain. The results are derived in pandas,
+# and only for metrics that can be aggregated again (SUM, COUNT, MIN and MAX).
+CHART_DATA_SEMANTIC_CACHE = False
+# How many seconds the results of queries are kept to answer other queries
+CHART_DATA_SEMANTIC_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# How many seconds the row level security filters of tables are kept in the cache
+# configured by CACHE_CONFIG, for the roles of users, so that the charts of a dashboard
+# don't query them again. They are invalidated when row level security filters, or
+# roles, are changed in Superset. 0 disables the cache.
+RLS_FILTERS_CACHE_TIMEOUT = 0
+
+# How many seconds the permissions of roles are kept in the cache configured by
+# CACHE_CONFIG, so that permission checks don't query the metadata database for every
+# dataset, chart or dashboard. Within a request the permissions are always kept.
+# They are invalidated when roles, permissions or view menus are changed in Superset.
+# 0 disables the cache across requests.
+PERMISSIONS_CACHE_TIMEOUT = 0
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1046,6 +1146,11 @@ CSV_EXPORT = {"encoding": "utf-8-sig"}
 # large datasets efficiently.
 CSV_STREAMING_ROW_THRESHOLD = 100000
 
+# Chart data JSON streaming: number of rows converted and encoded at a time when
+# the chart data API is called with `?stream=true`. Only one batch of records is
+# held in memory while the response is being written.
+CHART_DATA_STREAMING_BATCH_SIZE = 10000
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1361,6 +1466,19 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Format of the SQL Lab results stored in the results backend when
+# RESULTS_BACKEND_USE_MSGPACK is enabled. Version 1 stores a zlib compressed
+# msgpack document embedding an Arrow IPC stream, version 2 stores a compressed
+# Arrow IPC stream as-is, after a small header holding the metadata of the results.
+# Version 2 results are decompressed lazily and can be sent as-is to clients
+# accepting `application/vnd.apache.arrow.stream`. Both versions can be read
+# regardless of this setting.
+RESULTS_BACKEND_PAYLOAD_VERSION: Literal[1, 2] = 1
+
+# Number of rows of the record batches of version 2 results payloads. Pages of
+# results requested with `offset` and `limit` only read the batches holding them.
+RESULTS_BACKEND_PAYLOAD_BATCH_SIZE = 10000
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1558,6 +1676,25 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Keep pooled SQLAlchemy engines of databases across queries, instead of connecting
+# to the database for every query. The engines are kept per database, catalog,
+# schema and connection parameters, eg. the impersonated user or OAuth2 token.
+# The pool arguments of `create_engine` can be overridden per database, in the
+# `engine_params` of its extra. SQL Lab queries, and databases connected through SSH
+# tunnels, always connect again. None disables the pools.
+# Example:
+#   DATABASE_ENGINE_POOL = {
+#       "pool_size": 5,
+#       "max_overflow": 5,
+#       "pool_recycle": 3600,
+#       "pool_pre_ping": True,
+#   }
+DATABASE_ENGINE_POOL: dict[str, Any] | None = None
+# The maximum number of engines kept per process, and how many seconds unused
+# engines are kept before their connections are closed
+DATABASE_ENGINE_POOL_MAX_ENGINES = 100
+DATABASE_ENGINE_POOL_IDLE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
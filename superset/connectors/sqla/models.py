@@ -58,6 +58,7 @@ from sqlalchemy.orm import (
     reconstructor,
     relationship,
     RelationshipProperty,
+    Session,
 )
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
@@ -1465,6 +1466,30 @@ class SqlaTable(
         except (TypeError, json.JSONDecodeError):
             return {}
 
+    @property
+    def stale_cache_timeout(self) -> int | None:
+        """
+        Get how long query results are served past the cache timeout while they're
+        refreshed, from the dataset extra or else the database extra.
+        """
+        stale_cache_timeout = self.extra_dict.get("stale_cache_timeout")
+        if stale_cache_timeout is not None:
+            return stale_cache_timeout
+
+        if self.database:
+            return self.database.stale_cache_timeout
+
+        return None
+
+    @property
+    def incremental_cache(self) -> bool:
+        """
+        Whether the results of time series queries on the main datetime column are
+        refreshed incrementally, only querying the time buckets that may have
+        changed. The table must be append-only.
+        """
+        return bool(self.extra_dict.get("incremental_cache", False))
+
     def get_fetch_values_predicate(
         self,
         template_processor: BaseTemplateProcessor | None = None,
@@ -2095,3 +2120,24 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+for event in ("after_insert", "after_update", "after_delete"):
+    sa.event.listen(
+        RowLevelSecurityFilter, event, security_manager.rls_filters_after_change
+    )
+    sa.event.listen(
+        security_manager.role_model, event, security_manager.rls_filters_after_change
+    )
+    for model in (
+        security_manager.role_model,
+        security_manager.permission_model,
+        security_manager.viewmenu_model,
+        security_manager.permissionview_model,
+    ):
+        sa.event.listen(model, event, security_manager.permissions_after_change)
+    # the permissions of datasets are renamed, or deleted, with them
+    if event != "after_insert":
+        sa.event.listen(SqlaTable, event, security_manager.permissions_after_change)
+sa.event.listen(Session, "after_commit", security_manager.security_after_commit)
+sa.event.listen(Session, "after_rollback", security_manager.security_after_rollback)
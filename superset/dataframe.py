@@ -19,6 +19,7 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from superset.utils.core import JS_MAX_INTEGER
@@ -37,6 +38,40 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+def _big_integer_positions(dframe: pd.DataFrame) -> dict[Any, np.ndarray]:
+    """
+    Find the cells holding integers larger than ``JS_MAX_INTEGER``, per column.
+
+    Integer columns are checked with a vectorized comparison. Object columns are
+    first narrowed down to numeric values out of range, so that only those cells
+    need to be inspected individually.
+
+    :param dframe: the DataFrame to inspect
+    :returns: a mapping of column names to the row positions of big integers
+    """
+    positions: dict[Any, np.ndarray] = {}
+    for name, column in dframe.items():
+        if column.dtype.kind in "iu":
+            candidates = (column > JS_MAX_INTEGER) | (column < -JS_MAX_INTEGER)
+            mask = candidates.fillna(False).to_numpy(dtype=bool)
+            if mask.any():
+                positions[name] = np.flatnonzero(mask)
+        elif column.dtype == object:
+            numbers = pd.to_numeric(column, errors="coerce")
+            mask = (numbers.abs() > JS_MAX_INTEGER).to_numpy(dtype=bool)
+            if mask.any():
+                values = column.to_numpy()
+                positions[name] = np.array(
+                    [
+                        position
+                        for position in np.flatnonzero(mask)
+                        if isinstance(values[position], int)
+                    ],
+                    dtype=np.intp,
+                )
+    return positions
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -50,8 +85,10 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         )
     records = dframe.to_dict(orient="records")
 
-    for record in records:
-        for key in record:
+    for key, positions in _big_integer_positions(dframe).items():
+        for position in positions:
+            record = records[position]
             record[key] = _convert_big_integers(record[key])
 
     return records
+
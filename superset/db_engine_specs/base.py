@@ -86,6 +86,8 @@ from superset.utils.network import is_hostname_valid, is_port_open
 from superset.utils.oauth2 import encode_oauth2_state
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.connectors.sqla.models import TableColumn
     from superset.databases.schemas import TableMetadataResponse
     from superset.models.core import Database
@@ -441,6 +443,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # the `cancel_query` value in the `extra` field of the `query` object
     has_query_id_before_execute = True
 
+    # Can the DB-API cursor return results as a ``pyarrow.Table``? When this is True
+    # ``fetch_data_as_arrow`` is used instead of ``fetch_data`` in SQL Lab, and the
+    # table is handed to ``SupersetResultSet`` without boxing every cell in Python.
+    supports_arrow_fetch = False
+
     @classmethod
     def get_rls_method(cls) -> RLSMethod:
         """
@@ -1010,6 +1017,24 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_as_arrow(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | list[tuple[Any, ...]]:
+        """
+        Fetch the results as an Arrow table, when ``supports_arrow_fetch`` is True.
+
+        Drivers that can't produce Arrow for a given result (or that return nothing)
+        may fall back to returning rows, as ``fetch_data`` does.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query
+        """
+        return cls.fetch_data(cursor, limit)
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -39,6 +39,8 @@ from superset.utils.core import get_user_agent, QuerySource
 from superset.utils.network import is_hostname_valid, is_port_open
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 
@@ -261,6 +263,24 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
         "port": "port",
     }
 
+    # the Databricks SQL connector fetches results as Arrow batches
+    supports_arrow_fetch = True
+
+    @classmethod
+    def fetch_data_as_arrow(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | list[tuple[Any, ...]]:
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        try:
+            if limit:
+                return cursor.fetchmany_arrow(limit)
+            return cursor.fetchall_arrow()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
@@ -44,6 +44,8 @@ from superset.utils import json
 from superset.utils.core import get_user_agent, QuerySource
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.models.core import Database
 
 # Regular expressions to catch custom errors
@@ -92,6 +94,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
+    supports_arrow_fetch = True
 
     # pylint: disable=invalid-name
     encrypted_extra_sensitive_fields = {
@@ -216,6 +219,38 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
             )
         }
 
+    @classmethod
+    def fetch_data_as_arrow(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | list[tuple[Any, ...]]:
+        """
+        Fetch the results as the Arrow batches returned by the Snowflake connector.
+
+        The connector returns ``None`` for empty results, and only supports Arrow
+        when the result was sent in the Arrow format; in both cases we fall back to
+        fetching rows.
+        """
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        if not cursor.description:
+            return []
+
+        try:
+            table = cursor.fetch_arrow_all()
+        except NotSupportedError:
+            return cls.fetch_data(cursor, limit)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        if table is None:
+            return []
+        if limit is not None and table.num_rows > limit:
+            table = table.slice(0, limit)
+        return table
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "DATEADD(S, {col}, '1970-01-01')"
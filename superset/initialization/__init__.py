@@ -62,6 +62,7 @@ from superset.extensions import (
 from superset.security import SupersetSecurityManager
 from superset.sql.parse import SQLGLOT_DIALECTS
 from superset.superset_typing import FlaskResponse
+from superset.utils import json
 from superset.utils.core import is_test, pessimistic_connection_handling
 from superset.utils.decorators import transaction
 from superset.utils.log import DBEventLogger, get_event_logger_from_cfg_value
@@ -666,7 +667,6 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         @self.superset_app.context_processor
         def get_common_bootstrap_data() -> dict[str, Any]:
             # Import here to avoid circular imports
-            from superset.utils import json
             from superset.views.base import common_bootstrap_payload
 
             def serialize_bootstrap_data() -> str:
@@ -704,6 +704,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         # Configuration of feature_flags must be done first to allow init features
         # conditionally
         self.configure_feature_flags()
+        self.configure_json_backend()
         self.configure_db_encrypt()
         self.setup_db()
 
@@ -778,6 +779,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_feature_flags(self) -> None:
         feature_flag_manager.init_app(self.superset_app)
 
+    def configure_json_backend(self) -> None:
+        json.set_backend(self.config["JSON_BACKEND"])
+
     def configure_sqlglot_dialects(self) -> None:
         extensions = self.config["SQLGLOT_DIALECTS_EXTENSIONS"]
 
@@ -20,15 +20,25 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
-from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
+from typing import (
+    Any,
+    Callable,
+    cast,
+    MutableMapping,
+    TYPE_CHECKING,
+    TypedDict,
+    Union,
+)
 
 import dateutil
-from flask import current_app, g, has_request_context, request
+from flask import current_app, g, has_app_context, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError
+from jinja2 import DebugUndefined, Environment, nodes, Template, TemplateSyntaxError
 from jinja2.exceptions import SecurityError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
@@ -82,6 +92,13 @@ ALLOWED_TYPES = (
 )
 COLLECTION_TYPES = ("list", "dict", "tuple", "set")
 
+# the number of compiled templates kept per environment, and the length of the
+# longest template kept
+TEMPLATE_CACHE_SIZE = 512
+TEMPLATE_CACHE_MAX_LENGTH = 100_000
+# the delimiters of Jinja expressions, statements and comments
+TEMPLATE_DELIMITERS = ("{{", "{%", "{#")
+
 
 @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
 def context_addons() -> dict[str, Any]:
@@ -625,6 +642,85 @@ class WhereInMacro:  # pylint: disable=too-few-public-methods
         return result
 
 
+class CachingSandboxedEnvironment(SandboxedEnvironment):
+    """
+    A sandboxed environment keeping the templates it compiled from strings.
+
+    Compiling a template is much slower than rendering it, and the same SQL, eg. of a
+    virtual dataset or a metric, is rendered for every query using it. The compiled
+    templates don't depend on the context they are rendered with, so they are shared
+    by all the template processors using the environment.
+    """
+
+    def __init__(self, cache_size: int, max_length: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cache_size = cache_size
+        self.max_length = max_length
+        self._templates: OrderedDict[str, Template] = OrderedDict()
+        self._templates_lock = threading.Lock()
+
+    @staticmethod
+    def _incr(key: str) -> None:
+        if has_app_context():
+            current_app.config["STATS_LOGGER"].incr(f"jinja_template_cache.{key}")
+
+    def from_string(  # pylint: disable=redefined-builtin
+        self,
+        source: str | nodes.Template,
+        globals: MutableMapping[str, Any] | None = None,
+        template_class: type[Template] | None = None,
+    ) -> Template:
+        if (
+            globals is not None
+            or template_class is not None
+            or not isinstance(source, str)
+            or len(source) > self.max_length
+        ):
+            return super().from_string(source, globals, template_class)
+
+        with self._templates_lock:
+            if (template := self._templates.get(source)) is not None:
+                self._templates.move_to_end(source)
+        if template is not None:
+            self._incr("hit")
+            return template
+
+        template = super().from_string(source)
+        with self._templates_lock:
+            self._templates[source] = template
+            while len(self._templates) > self.cache_size:
+                self._templates.popitem(last=False)
+        self._incr("miss")
+        return template
+
+    def clear(self) -> None:
+        with self._templates_lock:
+            self._templates.clear()
+
+
+# the environments shared by the template processors, by class and SQL dialect
+_environments: dict[tuple[type, type], Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def render_static_template(sql: str) -> str | None:
+    """
+    Render SQL without Jinja syntax, skipping Jinja, or return None if it has any.
+
+    Jinja only normalizes the newlines of such SQL and removes its trailing newline.
+
+        >>> render_static_template("SELECT 1\\n")
+        'SELECT 1'
+        >>> render_static_template("SELECT {{ 1 }}") is None
+        True
+    """
+    if "\r" in sql or any(delimiter in sql for delimiter in TEMPLATE_DELIMITERS):
+        return None
+    if has_app_context():
+        current_app.config["STATS_LOGGER"].incr("jinja_template_cache.skip")
+    return sql[:-1] if sql.endswith("\n") else sql
+
+
 def to_datetime(
     value: str | None, format: str = "%Y-%m-%d %H:%M:%S"
 ) -> datetime | None:
@@ -673,12 +769,31 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self.env: Environment = SandboxedEnvironment(undefined=DebugUndefined)
+        self.env: Environment = self.get_environment(database.get_dialect())
         self.set_context(**kwargs)
 
-        # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
-        self.env.filters["to_datetime"] = to_datetime
+    @classmethod
+    def get_environment(cls, dialect: Dialect) -> Environment:
+        """
+        Get the environment shared by the template processors of the class for a SQL
+        dialect, with the templates compiled by it. Only the context of the templates
+        varies between processors.
+        """
+        key = (cls, type(dialect))
+        with _environments_lock:
+            if (env := _environments.get(key)) is None:
+                env = CachingSandboxedEnvironment(
+                    TEMPLATE_CACHE_SIZE,
+                    TEMPLATE_CACHE_MAX_LENGTH,
+                    undefined=DebugUndefined,
+                )
+
+                # custom filters
+                env.filters["where_in"] = WhereInMacro(dialect)
+                env.filters["to_datetime"] = to_datetime
+
+                _environments[key] = env
+        return env
 
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
@@ -697,6 +812,9 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
+        if (static_sql := render_static_template(sql)) is not None:
+            return static_sql
+
         try:
             template = self.env.from_string(sql)
         except (
@@ -926,6 +1044,9 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if (static_sql := render_static_template(sql)) is not None:
+            return static_sql
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
@@ -939,6 +1060,9 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if (static_sql := render_static_template(sql)) is not None:
+            return static_sql
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
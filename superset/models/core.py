@@ -57,6 +57,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
@@ -85,6 +86,8 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.engine_registry import engine_registry
+from superset.utils.hashing import hash_from_dict
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -94,6 +97,15 @@ from superset.utils.oauth2 import (
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 
+# arguments of `create_engine` configuring a pool, which a NullPool doesn't accept
+POOL_ARGUMENTS = {
+    "max_overflow",
+    "pool_pre_ping",
+    "pool_recycle",
+    "pool_size",
+    "pool_timeout",
+}
+
 if TYPE_CHECKING:
     from superset_core.api.types import AsyncQueryHandle, QueryOptions, QueryResult
 
@@ -343,6 +355,10 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
     def metadata_cache_timeout(self) -> dict[str, Any]:
         return self.get_extra().get("metadata_cache_timeout", {})
 
+    @property
+    def stale_cache_timeout(self) -> int | None:
+        return self.get_extra().get("stale_cache_timeout")
+
     @property
     def catalog_cache_enabled(self) -> bool:
         return "catalog_cache_timeout" in self.metadata_cache_timeout
@@ -490,7 +506,26 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        pool_config = app.config["DATABASE_ENGINE_POOL"]
+        # SQL Lab queries can change the state of their connections, eg. with SET
+        # statements, and the connections of SSH tunnels are closed with the tunnels
+        pooled = bool(
+            nullpool
+            and pool_config
+            and self.id is not None
+            and not self.ssh_tunnel
+            and (source or get_query_source_from_request())
+            != utils.QuerySource.SQL_LAB
+        )
+        if pooled:
+            for key, value in pool_config.items():
+                engine_kwargs.setdefault(key, value)
+        elif nullpool:
+            engine_kwargs = {
+                key: value
+                for key, value in engine_kwargs.items()
+                if key not in POOL_ARGUMENTS
+            }
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -543,10 +578,71 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 security_manager,
                 source,
             )
-        try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        def create() -> Engine:
+            try:
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if not pooled:
+            return create()
+
+        # the URL and parameters include the catalog, schema, impersonated user and
+        # OAuth2 token, when they apply to the connections
+        key = hash_from_dict(
+            {
+                "url": sqlalchemy_url.render_as_string(hide_password=False),
+                "engine_kwargs": engine_kwargs,
+                "catalog": catalog,
+                "schema": schema,
+            },
+            default=str,
+        )
+        return engine_registry.get(
+            self.id,
+            key,
+            create,
+            max_engines=app.config["DATABASE_ENGINE_POOL_MAX_ENGINES"],
+            idle_timeout=app.config["DATABASE_ENGINE_POOL_IDLE_TIMEOUT"],
+        )
+
+    def get_dialect_engine(self) -> Engine:
+        """
+        Get an engine of the database which is only used for its dialect, eg. to
+        compile queries, and never connects to it.
+
+        Unlike `get_sqla_engine` it doesn't need an SSH tunnel, OAuth2 token or the
+        connection parameters of the user, so the engine is shared.
+        """
+        engine_kwargs = {
+            key: value
+            for key, value in self.get_extra().get("engine_params", {}).items()
+            if key != "connect_args" and key not in POOL_ARGUMENTS
+        }
+        engine_kwargs["poolclass"] = NullPool
+        sqlalchemy_uri = self.sqlalchemy_uri_decrypted
+
+        def create() -> Engine:
+            try:
+                return create_engine(make_url_safe(sqlalchemy_uri), **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if self.id is None:
+            return create()
+
+        key = hash_from_dict(
+            {"url": sqlalchemy_uri, "engine_kwargs": engine_kwargs, "dialect": True},
+            default=str,
+        )
+        return engine_registry.get(
+            self.id,
+            key,
+            create,
+            max_engines=app.config["DATABASE_ENGINE_POOL_MAX_ENGINES"],
+            idle_timeout=app.config["DATABASE_ENGINE_POOL_IDLE_TIMEOUT"],
+        )
 
     def add_database_to_signature(
         self,
@@ -799,19 +895,19 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
         )
         return result_set.to_pandas_df()
 
-    def compile_sqla_query(
+    def compile_sqla_query(  # pylint: disable=unused-argument
         self,
         qry: Select,
         catalog: str | None = None,
         schema: str | None = None,
         is_virtual: bool = False,
     ) -> str:
-        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
-            sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
+        engine = self.get_dialect_engine()
+        sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
 
-            # pylint: disable=protected-access
-            if engine.dialect.identifier_preparer._double_percents:  # noqa
-                sql = sql.replace("%%", "%")
+        # pylint: disable=protected-access
+        if engine.dialect.identifier_preparer._double_percents:  # noqa
+            sql = sql.replace("%%", "%")
 
         # for nwo we only optimize queries on virtual datasources, since the only
         # optimization available is predicate pushdown
@@ -1314,6 +1410,21 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", security_manager.permissions_after_change)
+sqla.event.listen(Database, "after_delete", security_manager.permissions_after_change)
+
+
+def invalidate_engines(
+    mapper: Mapper,
+    connection: Connection,
+    target: Database,
+) -> None:
+    """Dispose the pooled engines of a database when it's changed or deleted."""
+    engine_registry.invalidate(target.id)
+
+
+sqla.event.listen(Database, "after_update", invalidate_engines)
+sqla.event.listen(Database, "after_delete", invalidate_engines)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
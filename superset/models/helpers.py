@@ -27,6 +27,7 @@ import re
 import uuid
 from collections.abc import Hashable
 from datetime import datetime, timedelta
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -66,7 +67,11 @@ from sqlalchemy_utils import UUIDType
 from superset import db, is_feature_enabled
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
-from superset.common.utils import dataframe_utils
+from superset.common.utils import dataframe_utils, semantic_cache
+from superset.common.utils.concurrency import (
+    get_database_concurrency,
+    run_concurrently,
+)
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -1155,6 +1160,22 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         errors = None
         error_message = None
 
+        use_semantic_cache = app.config["CHART_DATA_SEMANTIC_CACHE"]
+        if use_semantic_cache and (
+            derived_df := semantic_cache.get_derived_df(
+                self, query_obj, query_str_ext.labels_expected
+            )
+        ) is not None:
+            return QueryResult(
+                applied_template_filters=query_str_ext.applied_template_filters,
+                applied_filter_columns=query_str_ext.applied_filter_columns,
+                rejected_filter_columns=query_str_ext.rejected_filter_columns,
+                status=status,
+                df=derived_df,
+                duration=datetime.now() - qry_start_dttm,
+                query=sql,
+            )
+
         def assign_column_label(df: pd.DataFrame) -> Optional[pd.DataFrame]:
             """
             Some engines change the case or generate bespoke column names, either by
@@ -1204,6 +1225,9 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             ]
             error_message = utils.error_msg_from_exception(ex)
 
+        if use_semantic_cache and status == QueryStatus.SUCCESS:
+            semantic_cache.set_df(self, query_obj, df)
+
         return QueryResult(
             applied_template_filters=query_str_ext.applied_template_filters,
             applied_filter_columns=query_str_ext.applied_filter_columns,
@@ -1223,6 +1247,126 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         """
         return self.query(qry)
 
+    def query_time_offsets(
+        self, query_objs: list[QueryObjectDict]
+    ) -> list[QueryResult]:
+        """
+        Executes the queries of time offsets, according to the
+        ``TIME_OFFSETS_EXECUTION_MODE`` config: one after another, concurrently or
+        fused into a single query.
+
+        :param query_objs: The query objects of the time offsets
+        :return: The results of the queries, in the same order
+        """
+        mode = app.config["TIME_OFFSETS_EXECUTION_MODE"]
+        if len(query_objs) > 1 and mode == "fused":
+            if (results := self.query_fused(query_objs)) is not None:
+                return results
+            mode = "concurrent"
+
+        concurrency = 1
+        if len(query_objs) > 1 and mode == "concurrent":
+            concurrency = get_database_concurrency(
+                self.database, app.config["CHART_DATA_QUERY_CONCURRENCY"]
+            )
+        if concurrency > 1:
+            # load the relationships used by the queries, since the session they're
+            # lazily loaded with can't be shared across threads
+            for relationship in ("columns", "metrics"):
+                getattr(self, relationship, None)
+
+        return run_concurrently(
+            [partial(self.query, query_obj) for query_obj in query_objs],
+            concurrency,
+        )
+
+    def query_fused(
+        self, query_objs: list[QueryObjectDict]
+    ) -> Optional[list[QueryResult]]:
+        """
+        Executes several queries as a single one, the union of their results tagged
+        with the index of their query, and splits the dataframe back by query.
+
+        The queries are only fused when the database supports subqueries, and they
+        have no prequeries and share the same CTE, if any.
+
+        :param query_objs: The query objects to execute
+        :return: The results of the queries, in the same order, or None when they
+            can't be fused, or the fused query failed
+        """
+        db_engine_spec = self.db_engine_spec
+        if not db_engine_spec.allows_subqueries:
+            return None
+
+        qry_start_dttm = datetime.now()
+        try:
+            sqlaqs = [
+                self.get_sqla_query(
+                    **cast(
+                        Any,
+                        {k: v for k, v in query_obj.items() if k in SQLA_QUERY_KEYS},
+                    )
+                )
+                for query_obj in query_objs
+            ]
+        except Exception:  # pylint: disable=broad-except
+            # the error is raised again when executing the queries one by one
+            return None
+
+        ctes = {sqlaq.cte for sqlaq in sqlaqs}
+        cte = next(iter(ctes))
+        if (
+            any(sqlaq.prequeries for sqlaq in sqlaqs)
+            or len(ctes) > 1
+            or (cte and not db_engine_spec.allows_cte_in_subquery)
+        ):
+            return None
+
+        selects = []
+        for i, sqlaq in enumerate(sqlaqs):
+            subquery = sqlaq.sqla_query.subquery(f"query_{i}")
+            selects.append(sa.select(*subquery.c, sa.literal(i).label("__query_index")))
+
+        try:
+            sql = self.database.compile_sqla_query(
+                sa.union_all(*selects),
+                catalog=self.catalog,
+                schema=self.schema,
+                is_virtual=bool(self.sql),
+            )
+            sql = self._apply_cte(sql, cte)
+            sql = self.database.mutate_sql_based_on_config(sql)
+            df = self.database.get_df(sql, self.catalog, self.schema)
+        except (SupersetErrorException, SupersetErrorsException):
+            raise
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Fused query failed", exc_info=True)
+            return None
+
+        # some engines change the case of column names, so columns are positional
+        if len(df.columns) <= max(len(sqlaq.labels_expected) for sqlaq in sqlaqs):
+            return None
+        query_index = df.iloc[:, -1].astype(str)
+        duration = datetime.now() - qry_start_dttm
+
+        results = []
+        for i, sqlaq in enumerate(sqlaqs):
+            labels_expected = sqlaq.labels_expected
+            query_df = df[query_index == str(i)].iloc[:, 0 : len(labels_expected)]
+            query_df = query_df.reset_index(drop=True)
+            query_df.columns = labels_expected
+            results.append(
+                QueryResult(
+                    applied_template_filters=sqlaq.applied_template_filters,
+                    applied_filter_columns=sqlaq.applied_filter_columns,
+                    rejected_filter_columns=sqlaq.rejected_filter_columns,
+                    df=query_df,
+                    duration=duration,
+                    query=sql,
+                )
+            )
+        return results
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         """
         Normalize the dataframe by converting datetime columns and ensuring
@@ -1376,7 +1520,19 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         query_object_clone = copy.copy(query_object)
         queries: list[str] = []
         cache_keys: list[str | None] = []
+        offsets: list[str] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        pending: list[
+            tuple[
+                int,
+                str,
+                dict[str, str],
+                QueryObject,
+                QueryObjectDict,
+                str | None,
+                QueryCacheManager,
+            ]
+        ] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -1565,6 +1721,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 )
 
             cache = QueryCacheManager.get(cache_key, CacheRegion.DATA, force_cache)
+            offsets.append(offset)
 
             if cache.is_loaded:
                 offset_dfs[offset] = cache.df
@@ -1587,12 +1744,34 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 query_object_clone_dct["row_limit"] = app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            # Call the unified query method on the datasource
-            result = self.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            # the queries missing the cache are run together once all the offsets
+            # are processed, see `query_time_offsets`
+            pending.append(
+                (
+                    len(queries),
+                    offset,
+                    metrics_mapping,
+                    copy.copy(query_object_clone),
+                    query_object_clone_dct,
+                    cache_key,
+                    cache,
+                )
+            )
+            queries.append("")
             cache_keys.append(None)
 
+        results = self.query_time_offsets([item[4] for item in pending])
+        for (
+            idx,
+            offset,
+            metrics_mapping,
+            query_object_clone,
+            _,
+            cache_key,
+            cache,
+        ), result in zip(pending, results, strict=True):
+            queries[idx] = result.query
+
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
@@ -1625,6 +1804,8 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 )
             offset_dfs[offset] = offset_metrics_df
 
+        # join the dataframes in the order of the offsets
+        offset_dfs = {offset: offset_dfs[offset] for offset in offsets}
         if offset_dfs:
             df = self.join_offset_dfs(
                 df,
@@ -18,6 +18,8 @@
 
 import datetime
 import logging
+from collections.abc import Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -82,6 +84,14 @@ def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
     return result
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a 1-D object array from a column of values, without letting NumPy
+    broadcast sequence-like cells (lists, tuples) into extra dimensions.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
 def destringify(obj: str) -> Any:
     return json.loads(obj)
 
@@ -102,17 +112,15 @@ def convert_to_string(value: Any) -> str:
 class SupersetResultSet:
     def __init__(  # pylint: disable=too-many-locals  # noqa: C901
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
+        data = data if data is not None else []
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -128,55 +136,15 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-
-        for column in column_names:
-            try:
-                pa_data.append(pa.array(array[column].tolist()))
-            except (
-                pa.lib.ArrowInvalid,
-                pa.lib.ArrowTypeError,
-                pa.lib.ArrowNotImplementedError,
-                ValueError,
-                TypeError,  # this is super hackey,
-                # https://issues.apache.org/jira/browse/ARROW-7855
-            ):
-                # attempt serialization of values as strings
-                stringified_arr = stringify_values(array[column])
-                pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series, utc=True)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            # the driver returned Arrow natively, reuse its buffers as-is
+            if len(column_names) != data.num_columns:
+                column_names = dedup([str(name) for name in data.column_names])
+            pa_data = [
+                self._stringify_nested(column) for column in data.itercolumns()
+            ]
+        else:
+            pa_data = self._build_arrays(data, column_names)
 
         if not pa_data:
             column_names = []
@@ -193,6 +161,88 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def _build_arrays(
+        cls,
+        data: DbapiResult,
+        column_names: list[str],
+    ) -> list[pa.Array]:
+        """
+        Build one Arrow array per column straight from the fetched rows.
+
+        Each column is gathered into a list of references to the row values and
+        handed to Arrow's type inference; only columns Arrow can't infer fall back
+        to the slower per-cell stringification.
+        """
+        if not column_names:
+            return []
+
+        # only do expensive recasting if datatype is not standard list of tuples
+        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+            data = [tuple(row) for row in data]
+
+        if data and set(map(len, data)) != {len(column_names)}:
+            raise ValueError(
+                "Rows don't match the number of columns in the cursor description"
+            )
+
+        columns = [list(map(itemgetter(i), data)) for i in range(len(column_names))]
+
+        return [cls._build_array(values) for values in columns]
+
+    @classmethod
+    def _build_array(cls, values: Sequence[Any]) -> pa.Array:
+        try:
+            pa_array = pa.array(values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_nested(pa_array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_temporal(pa_array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = cls.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(to_object_array(values))
+                        series = pd.to_datetime(series, utc=True)
+                        return pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return pa_array
+
+    @staticmethod
+    def _stringify_nested(column: pa.ChunkedArray) -> pa.ChunkedArray | pa.Array:
+        """
+        Serialize nested columns of a natively fetched Arrow table as strings, the
+        same way rows fetched through DB-API are; other columns are kept zero-copy.
+        """
+        if not pa.types.is_nested(column.type):
+            return column
+        return pa.array(
+            stringify_values(to_object_array(column.to_pylist())).tolist()
+        )
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -215,7 +265,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
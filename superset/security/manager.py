@@ -22,8 +22,9 @@ import re
 import time
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
+from uuid import uuid4
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.filters import BaseFilter
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
@@ -50,7 +51,7 @@ from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
 from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, object_session, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
 from sqlalchemy.sql import exists
@@ -102,6 +103,27 @@ def get_conf() -> Any:
     return current_app.config
 
 
+# the cache keys of the versions of the row level security filters and permissions,
+# which change to invalidate their cached values, and the session flags marking
+# changes of them
+RLS_FILTERS_VERSION_KEY = "rls_filters_version"
+RLS_FILTERS_CHANGED = "rls_filters_changed"
+PERMISSIONS_VERSION_KEY = "permissions_version"
+PERMISSIONS_CHANGED = "permissions_changed"
+# the attribute of `g` keeping the permissions of roles during a request
+ROLES_PERMISSIONS = "roles_permissions"
+
+
+class RLSFilter(NamedTuple):
+    """
+    A cached row level security filter.
+    """
+
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
 
@@ -514,6 +536,131 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
+    def _has_view_access(
+        self, user: object, permission_name: str, view_name: str
+    ) -> bool:
+        """
+        Return True if the user has the FAB permission/view, False otherwise.
+
+        Unlike FAB, which queries the metadata database for every check, the
+        permissions of the user's roles are compiled once into a set and cached.
+
+        :param user: The user
+        :param permission_name: The FAB permission name
+        :param view_name: The FAB view-menu name
+        :returns: Whether the user has the FAB permission/view
+        """
+
+        # the pending changes of the session aren't reflected by the cache yet
+        if self.session.info.get(PERMISSIONS_CHANGED):
+            return super()._has_view_access(user, permission_name, view_name)
+
+        roles = self.get_user_roles(user)
+        if any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        ):
+            return True
+
+        db_role_ids = [role.id for role in roles if role.name not in self.builtin_roles]
+        return (permission_name, view_name) in self.get_roles_permissions(db_role_ids)
+
+    def get_roles_permissions(self, role_ids: list[int]) -> frozenset[tuple[str, str]]:
+        """
+        Return the permissions of the roles as (permission name, view-menu name)
+        tuples.
+
+        The permissions are kept for the rest of the request and, if
+        `PERMISSIONS_CACHE_TIMEOUT` is set, cached per role across requests until
+        roles, permissions or view-menus change.
+
+        :param role_ids: The IDs of the roles
+        :returns: The permissions of the roles
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        key = tuple(sorted(set(role_ids)))
+        roles_permissions = g.setdefault(ROLES_PERMISSIONS, {})
+        if (permissions := roles_permissions.get(key)) is not None:
+            return permissions
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        timeout = current_app.config["PERMISSIONS_CACHE_TIMEOUT"]
+        cache_keys: dict[int, str] = {}
+        cached: dict[int, list[tuple[str, str]]] = {}
+        if timeout:
+            version = self._get_cache_version(PERMISSIONS_VERSION_KEY)
+            cache_keys = {
+                role_id: f"permissions_{version}_{role_id}" for role_id in key
+            }
+            values = cache_manager.cache.get_many(*cache_keys.values())
+            cached = {
+                role_id: value
+                for role_id, value in zip(cache_keys, values, strict=True)
+                if value is not None
+            }
+
+        if missing := [role_id for role_id in key if role_id not in cached]:
+            stats_logger.incr("permission_cache.miss")
+            loaded = self._query_roles_permissions(missing)
+            if timeout:
+                cache_manager.cache.set_many(
+                    {cache_keys[role_id]: loaded[role_id] for role_id in missing},
+                    timeout=timeout,
+                )
+            cached.update(loaded)
+        else:
+            stats_logger.incr("permission_cache.hit")
+
+        permissions = frozenset(
+            (permission_name, view_name)
+            for role_permissions in cached.values()
+            for permission_name, view_name in role_permissions
+        )
+        roles_permissions[key] = permissions
+        return permissions
+
+    def _query_roles_permissions(
+        self, role_ids: list[int]
+    ) -> dict[int, list[tuple[str, str]]]:
+        """
+        Query the permissions of the roles from the metadata database.
+
+        :param role_ids: The IDs of the roles
+        :returns: The permissions of each role
+        """
+
+        query = (
+            self.session.query(
+                assoc_permissionview_role.c.role_id,
+                self.permission_model.name,
+                self.viewmenu_model.name,
+            )
+            .join(
+                self.permissionview_model,
+                self.permissionview_model.id
+                == assoc_permissionview_role.c.permission_view_id,
+            )
+            .join(
+                self.permission_model,
+                self.permission_model.id == self.permissionview_model.permission_id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.viewmenu_model.id == self.permissionview_model.view_menu_id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+        )
+
+        permissions: dict[int, list[tuple[str, str]]] = {
+            role_id: [] for role_id in role_ids
+        }
+        for role_id, permission_name, view_name in query.all():
+            permissions[role_id].append((permission_name, view_name))
+        return permissions
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -879,6 +1026,14 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        if not g.user.is_anonymous and not self.session.info.get(PERMISSIONS_CHANGED):
+            role_ids = [role.id for role in self.get_user_roles(g.user)]
+            return {
+                view_name
+                for name, view_name in self.get_roles_permissions(role_ids)
+                if name == permission_name
+            }
+
         base_query = (
             self.session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -2634,6 +2789,58 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = [role.id for role in self.get_user_roles(g.user)]
+        if not (timeout := get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]):
+            return self._query_rls_filters(table, user_roles)
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+        from superset.utils.cache import generate_cache_key
+
+        # the filters only depend on the roles of the user, and not the user itself
+        cache_key = generate_cache_key(
+            {
+                "roles": sorted(user_roles),
+                "table_id": self._get_table_id(table),
+                "version": self._get_cache_version(RLS_FILTERS_VERSION_KEY),
+            },
+            "rls_filters_",
+        )
+        stats_logger = get_conf()["STATS_LOGGER"]
+        if (filters := cache_manager.cache.get(cache_key)) is not None:
+            stats_logger.incr("rls_filters_cache.hit")
+            return list(filters)
+
+        stats_logger.incr("rls_filters_cache.miss")
+        filters = [
+            RLSFilter(row.id, row.group_key, row.clause)
+            for row in self._query_rls_filters(table, user_roles)
+        ]
+        cache_manager.cache.set(cache_key, filters, timeout=timeout)
+        return list(filters)
+
+    @staticmethod
+    def _get_table_id(table: "BaseDatasource | Explorable") -> int:
+        """
+        Get the ID of a table, without building the payload of ``data`` when it has
+        an ``id``, like datasources.
+        """
+        if (table_id := getattr(table, "id", None)) is not None:
+            return table_id
+        return table.data["id"]
+
+    def _query_rls_filters(
+        self,
+        table: "BaseDatasource | Explorable",
+        user_roles: list[int],
+    ) -> list[SqlaQuery]:
+        """
+        Query the row level security filters of roles for the passed table.
+
+        :param table: The table to check against
+        :param user_roles: The IDs of the roles
+        :returns: A list of filters
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2641,7 +2848,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2659,7 +2865,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.data["id"]
+            RLSFilterTables.c.table_id == self._get_table_id(table)
         )
         query = (
             self.session.query(
@@ -2685,6 +2891,91 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    @staticmethod
+    def _get_cache_version(key: str) -> str:
+        """
+        Get the version of cached security values, eg. the row level security
+        filters, which changes when they change to invalidate the cached values.
+
+        :param key: The cache key of the version
+        :returns: The version
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if (version := cache_manager.cache.get(key)) is None:
+            cache_manager.cache.add(key, uuid4().hex, timeout=0)
+            version = cache_manager.cache.get(key)
+        return version or ""
+
+    @staticmethod
+    def invalidate_rls_filters_cache() -> None:
+        """
+        Invalidate the cached row level security filters of all tables and roles.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(RLS_FILTERS_VERSION_KEY, uuid4().hex, timeout=0)
+
+    @staticmethod
+    def invalidate_permissions_cache() -> None:
+        """
+        Invalidate the cached permissions of all roles.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(PERMISSIONS_VERSION_KEY, uuid4().hex, timeout=0)
+        if has_app_context():
+            g.pop(ROLES_PERMISSIONS, None)
+
+    def rls_filters_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Any,
+    ) -> None:
+        """
+        Mark the session of a changed row level security filter, or role, to
+        invalidate the cached filters once it's committed. Triggered by SQLAlchemy
+        after_insert, after_update and after_delete events.
+        """
+        if session := object_session(target):
+            session.info[RLS_FILTERS_CHANGED] = True
+
+    def permissions_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Any,
+    ) -> None:
+        """
+        Mark the session of a changed role, permission or view menu, to invalidate the
+        cached permissions once it's committed. Triggered by SQLAlchemy after_insert,
+        after_update and after_delete events.
+        """
+        if session := object_session(target):
+            session.info[PERMISSIONS_CHANGED] = True
+
+    def security_after_commit(self, session: Session) -> None:
+        """
+        Invalidate the cached row level security filters and permissions after a
+        commit changing them. Triggered by a SQLAlchemy after_commit event.
+        """
+        if session.info.pop(RLS_FILTERS_CHANGED, False):
+            self.invalidate_rls_filters_cache()
+        if session.info.pop(PERMISSIONS_CHANGED, False):
+            self.invalidate_permissions_cache()
+
+    def security_after_rollback(self, session: Session) -> None:
+        """
+        Forget the changes of row level security filters and permissions which were
+        rolled back. Triggered by a SQLAlchemy after_rollback event.
+        """
+        session.info.pop(RLS_FILTERS_CHANGED, None)
+        session.info.pop(PERMISSIONS_CHANGED, None)
+
     def get_rls_sorted(
         self, table: "BaseDatasource | Explorable"
     ) -> list["RowLevelSecurityFilter"]:
@@ -156,11 +156,16 @@ def execute_sql_with_cursor(
         # Fetch results from ALL statements
         description = cursor.description
         if description:
-            rows = database.db_engine_spec.fetch_data(cursor)
+            db_engine_spec = database.db_engine_spec
+            rows = (
+                db_engine_spec.fetch_data_as_arrow(cursor)
+                if db_engine_spec.supports_arrow_fetch
+                else db_engine_spec.fetch_data(cursor)
+            )
             result_set = SupersetResultSet(
                 rows,
                 description,
-                database.db_engine_spec,
+                db_engine_spec,
             )
         else:
             # DML statement - no result set
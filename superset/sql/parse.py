@@ -21,12 +21,15 @@ import copy
 import enum
 import logging
 import re
+import threading
 import urllib.parse
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, Generic, Optional, TYPE_CHECKING, TypeVar
 
 import sqlglot
+from flask import current_app, has_app_context
 from jinja2 import nodes, Template
 from sqlglot import exp
 from sqlglot.dialects.dialect import (
@@ -116,6 +119,81 @@ SQLGLOT_DIALECTS = {
     "yql": Dialects.CLICKHOUSE,
 }
 
+# the number of parsed scripts kept in memory, and the length of the longest script
+# kept, so that large scripts from SQL Lab don't evict the queries of datasets
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_MAX_LENGTH = 100_000
+
+
+class ParseCache:
+    """
+    A bounded, process-local LRU cache of parsed SQL scripts, by script and engine.
+
+    The same SQL is parsed many times, eg. the SQL of a virtual dataset is parsed for
+    every query of every chart using it, to validate it and to apply RLS. The parsed
+    statements are shared between the `SQLStatement` instances of the same script,
+    which copy them before modifying them.
+    """
+
+    def __init__(self, maxsize: int, max_length: int) -> None:
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[tuple[str, str], tuple[exp.Expression, ...]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _incr(key: str) -> None:
+        if has_app_context():
+            current_app.config["STATS_LOGGER"].incr(f"sql_parse_cache.{key}")
+
+    def get(
+        self,
+        script: str,
+        engine: str,
+        parse: Callable[[str, str], list[exp.Expression]],
+    ) -> list[exp.Expression]:
+        """
+        Get the parsed statements of a script, parsing it if it's not cached.
+
+        :param script: The SQL script
+        :param engine: The engine of the script
+        :param parse: Parse the script, when it's not cached
+        :return: The parsed statements, which must not be modified
+        """
+        if len(script) > self.max_length:
+            return parse(script, engine)
+
+        key = (script, engine)
+        with self._lock:
+            if (statements := self._statements.get(key)) is not None:
+                self._statements.move_to_end(key)
+                self.hits += 1
+        if statements is not None:
+            self._incr("hit")
+            return list(statements)
+
+        statements = tuple(parse(script, engine))
+        with self._lock:
+            self.misses += 1
+            self._statements[key] = statements
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+        self._incr("miss")
+        return list(statements)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+parse_cache = ParseCache(PARSE_CACHE_SIZE, PARSE_CACHE_MAX_LENGTH)
+
 
 class LimitMethod(enum.Enum):
     """
@@ -550,10 +628,29 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         ast: exp.Expression | None = None,
     ):
         self._dialect = SQLGLOT_DIALECTS.get(engine)
+        # whether the AST is shared through the parse cache, and must be copied
+        # before being modified
+        self._is_shared = ast is None
         super().__init__(statement, engine, ast)
 
+    def _get_mutable_ast(self) -> exp.Expression:
+        """
+        Get the AST of the statement to modify it, copying it if it's shared.
+        """
+        if self._is_shared:
+            self._parsed = self._parsed.copy()
+            self._is_shared = False
+        return self._parsed
+
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
+        """
+        Parse helper, returning statements shared through the parse cache.
+        """
+        return parse_cache.get(script, engine, cls._parse_uncached)
+
+    @classmethod
+    def _parse_uncached(cls, script: str, engine: str) -> list[exp.Expression]:
         """
         Parse helper.
 
@@ -615,9 +712,12 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         script: str,
         engine: str,
     ) -> list[SQLStatement]:
-        return [
+        statements = [
             cls(ast=ast, engine=engine) for ast in cls._parse(script, engine) if ast
         ]
+        for statement in statements:
+            statement._is_shared = True  # pylint: disable=protected-access
+        return statements
 
     @classmethod
     def _parse_statement(
@@ -745,7 +845,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         if not self._dialect:
             return SQLStatement(ast=self._parsed.copy(), engine=self.engine)
 
-        optimized = pushdown_predicates(self._parsed, dialect=self._dialect)
+        optimized = pushdown_predicates(self._get_mutable_ast(), dialect=self._dialect)
 
         return SQLStatement(ast=optimized, engine=self.engine)
 
@@ -788,7 +888,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         Modify the `LIMIT` or `TOP` value of the SQL statement inplace.
         """
         if method == LimitMethod.FORCE_LIMIT:
-            self._parsed.args["limit"] = exp.Limit(
+            self._get_mutable_ast().args["limit"] = exp.Limit(
                 expression=exp.Literal(this=str(limit), is_string=False)
             )
         elif method == LimitMethod.WRAP_SQL:
@@ -821,10 +921,11 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         :param alias: The alias to use for the CTE.
         :return: A new SQLStatement with the CTE.
         """
-        existing_ctes = self._parsed.args["with"].expressions if self.has_cte() else []
-        self._parsed.args["with"] = None
+        parsed = self._get_mutable_ast()
+        existing_ctes = parsed.args["with"].expressions if self.has_cte() else []
+        parsed.args["with"] = None
         new_cte = exp.CTE(
-            this=self._parsed.copy(),
+            this=parsed.copy(),
             alias=exp.TableAlias(this=exp.Identifier(this=alias)),
         )
         return SQLStatement(
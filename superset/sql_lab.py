@@ -26,6 +26,7 @@ from typing import Any, cast, Optional, TYPE_CHECKING, TypeVar, Union
 
 import backoff
 import msgpack
+import pyarrow as pa
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app, has_app_context
 from flask_babel import gettext as __
@@ -57,7 +58,7 @@ from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import write_ipc_buffer, write_results_payload
 from superset.utils import json
 from superset.utils.core import (
     override_user,
@@ -282,7 +283,10 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                if db_engine_spec.supports_arrow_fetch:
+                    data = db_engine_spec.fetch_data_as_arrow(cursor, increased_limit)
+                else:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -326,6 +330,11 @@ def _serialize_payload(
     payload: dict[Any, Any], use_msgpack: Optional[bool] = False
 ) -> Union[bytes, str]:
     logger.debug("Serializing to msgpack: %r", use_msgpack)
+    if isinstance(payload.get("data"), pa.Table):
+        # the data was left as-is to be stored in a version 2 payload
+        return write_results_payload(
+            payload, app.config["RESULTS_BACKEND_PAYLOAD_BATCH_SIZE"]
+        )
     if use_msgpack:
         return msgpack.dumps(payload, default=json.json_iso_dttm_ser, use_bin_type=True)
 
@@ -337,12 +346,17 @@ def _serialize_and_expand_data(
     db_engine_spec: BaseEngineSpec,
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
-) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
+    payload_version: int = 1,
+) -> tuple[Union[bytes, str, pa.Table], list[Any], list[Any], list[Any]]:
     selected_columns = result_set.columns
     all_columns: list[Any]
     expanded_columns: list[Any]
 
-    if use_msgpack:
+    if use_msgpack and payload_version == 2:
+        # the table is serialized along with the rest of the payload
+        data = result_set.pa_table
+        all_columns, expanded_columns = (selected_columns, [])
+    elif use_msgpack:
         if has_app_context():
             stats_logger = app.config["STATS_LOGGER"]
             with stats_timing(
@@ -526,8 +540,9 @@ def execute_sql_statements(  # noqa: C901
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
+    payload_version = app.config["RESULTS_BACKEND_PAYLOAD_VERSION"]
     data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+        result_set, db_engine_spec, use_arrow_data, expand_data, payload_version
     )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
@@ -577,7 +592,12 @@ def execute_sql_statements(  # noqa: C901
             if cache_timeout is None:
                 cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            # version 2 payloads hold compressed data already
+            compressed = (
+                serialized_payload
+                if isinstance(data, pa.Table)
+                else zlib_compress(serialized_payload)
+            )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -34,6 +34,7 @@ from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.commands.streaming_export.base import StreamingExportFormat
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
 from superset.daos.query import QueryDAO
@@ -63,7 +64,7 @@ from superset.sqllab.sql_json_executer import (
     SynchronousSqlJsonExecutor,
 )
 from superset.sqllab.sqllab_execution_context import SqlJsonExecutionContext
-from superset.sqllab.utils import bootstrap_sqllab_data
+from superset.sqllab.utils import ARROW_STREAM_MIMETYPE, bootstrap_sqllab_data
 from superset.sqllab.validators import CanAccessQueryValidatorImpl
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils, json
@@ -358,13 +359,25 @@ class SqlLabRestApi(BaseSupersetApi):
                     expected_rows:
                       type: integer
                       description: Optional expected row count for progress tracking
+                    format:
+                      type: string
+                      enum: [csv, parquet, arrow]
+                      description: Optional export format, CSV by default
           responses:
             200:
-              description: Streaming CSV export
+              description: Streaming CSV, Parquet or Arrow IPC stream export
               content:
                 text/csv:
                   schema:
                     type: string
+                application/vnd.apache.parquet:
+                  schema:
+                    type: string
+                    format: binary
+                application/vnd.apache.arrow.stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -383,6 +396,11 @@ class SqlLabRestApi(BaseSupersetApi):
         if not client_id:
             return self.response_400(message="client_id is required")
 
+        try:
+            export_format = StreamingExportFormat(request.form.get("format", "csv"))
+        except ValueError:
+            return self.response_400(message="Unsupported export format")
+
         expected_rows = None
         if expected_rows_str := request.form.get("expected_rows"):
             try:
@@ -390,24 +408,31 @@ class SqlLabRestApi(BaseSupersetApi):
             except (ValueError, TypeError):
                 logger.warning("Invalid expected_rows value: %s", expected_rows_str)
 
-        return self._create_streaming_csv_response(client_id, filename, expected_rows)
+        return self._create_streaming_csv_response(
+            client_id, filename, expected_rows, export_format
+        )
 
     def _create_streaming_csv_response(
         self,
         client_id: str,
         filename: str | None = None,
         expected_rows: int | None = None,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
     ) -> Response:
-        """Create a streaming CSV response for large SQL Lab result sets."""
+        """Create a streaming export response for large SQL Lab result sets."""
         # Execute streaming command
         # TODO: Make chunk size configurable via SUPERSET_CONFIG
         chunk_size = 1024
-        command = StreamingSqlResultExportCommand(client_id, chunk_size)
+        command = StreamingSqlResultExportCommand(
+            client_id, chunk_size, export_format=export_format
+        )
         command.validate()
 
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = secure_filename(f"sqllab_{client_id}_{timestamp}.csv")
+            filename = secure_filename(
+                f"sqllab_{client_id}_{timestamp}.{export_format}"
+            )
 
         # Get the callable that returns the generator
         csv_generator_callable = command.run()
@@ -418,7 +443,11 @@ class SqlLabRestApi(BaseSupersetApi):
         # Create response with streaming headers
         response = Response(
             csv_generator_callable(),  # Call the callable to get generator
-            mimetype=f"text/csv; charset={encoding}",
+            mimetype=(
+                f"text/csv; charset={encoding}"
+                if export_format == StreamingExportFormat.CSV
+                else export_format.mimetype
+            ),
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
                 "Cache-Control": "no-cache",
@@ -431,7 +460,8 @@ class SqlLabRestApi(BaseSupersetApi):
         response.implicit_sequence_conversion = False
 
         logger.info(
-            "SQL Lab streaming CSV export started: client_id=%s, filename=%s",
+            "SQL Lab streaming %s export started: client_id=%s, filename=%s",
+            export_format.upper(),
             client_id,
             filename,
         )
@@ -460,11 +490,18 @@ class SqlLabRestApi(BaseSupersetApi):
                   $ref: '#/components/schemas/sql_lab_get_results_schema'
           responses:
             200:
-              description: SQL query execution result
+              description: >-
+                SQL query execution result. Clients accepting
+                application/vnd.apache.arrow.stream get the data as an Arrow IPC
+                stream when the results are stored as Arrow data.
               content:
                 application/json:
                   schema:
                     $ref: '#/components/schemas/QueryExecutionResponseSchema'
+                application/vnd.apache.arrow.stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -481,7 +518,24 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        command = SqlExecutionResultsCommand(
+            key=key,
+            rows=rows,
+            offset=params.get("offset", 0),
+            limit=params.get("limit"),
+        )
+
+        if (
+            request.accept_mimetypes.best_match(
+                ["application/json", ARROW_STREAM_MIMETYPE]
+            )
+            == ARROW_STREAM_MIMETYPE
+        ):
+            stream = command.run_arrow()
+            if stream is not None:
+                return Response(stream, status=200, mimetype=ARROW_STREAM_MIMETYPE)
+
+        result = command.run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -16,6 +16,8 @@
 # under the License.
 from __future__ import annotations
 
+import struct
+from dataclasses import dataclass
 from typing import Any
 
 import pyarrow as pa
@@ -23,7 +25,21 @@ import pyarrow as pa
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
+from superset.exceptions import SerializationError
 from superset.models.sql_lab import TabState
+from superset.utils import json
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+# Version 2 results backend payloads start with a header holding this magic number,
+# the payload version and the length of the JSON metadata of the payload following
+# it. The rest of the payload is the data, as a compressed Arrow IPC stream.
+# Version 1 payloads are zlib compressed JSON or msgpack documents.
+RESULTS_PAYLOAD_MAGIC = b"SSRP"
+RESULTS_PAYLOAD_HEADER = struct.Struct("!4sBI")
+RESULTS_PAYLOAD_VERSION = 2
+# Key of the metadata holding the offsets of the record batches of the data
+RESULTS_PAYLOAD_BATCHES_KEY = "__batches"
 
 DATABASE_KEYS = [
     "allow_file_upload",
@@ -111,3 +127,144 @@ def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
         "active_tab": active_tab.to_dict() if active_tab else None,
         "databases": databases,
     }
+
+
+def write_results_payload(
+    payload: dict[str, Any],
+    batch_size: int = 10_000,
+    compression: str | None = "zstd",
+) -> bytes:
+    """
+    Serialize a results backend payload holding its data as a ``pa.Table``, in the
+    version 2 format.
+
+    The data is written as record batches of ``batch_size`` rows, the metadata
+    holds the row and byte offsets of each batch so that ranges of rows can be read
+    without reading the whole stream, see ``ResultsPayload.read_table``.
+
+    :param payload: The payload to serialize
+    :param batch_size: The number of rows of the record batches
+    :param compression: The compression codec of the Arrow IPC stream
+    :returns: The serialized payload
+    """
+    table: pa.Table = payload["data"]
+
+    stream = pa.BufferOutputStream()
+    batches: list[list[int]] = []
+    row_offset = 0
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(stream, table.schema, options=options) as writer:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            # the schema is written along with the first batch
+            byte_offset = stream.tell()
+            writer.write_batch(batch)
+            batches.append(
+                [row_offset, batch.num_rows, byte_offset, stream.tell() - byte_offset]
+            )
+            row_offset += batch.num_rows
+
+    metadata = {key: value for key, value in payload.items() if key != "data"}
+    metadata[RESULTS_PAYLOAD_BATCHES_KEY] = batches
+    serialized_metadata = json.dumps(
+        metadata,
+        default=json.json_iso_dttm_ser,
+        ignore_nan=True,
+    ).encode("utf-8")
+    header = RESULTS_PAYLOAD_HEADER.pack(
+        RESULTS_PAYLOAD_MAGIC, RESULTS_PAYLOAD_VERSION, len(serialized_metadata)
+    )
+
+    return b"".join([header, serialized_metadata, stream.getvalue()])
+
+
+def is_results_payload_v2(blob: Any) -> bool:
+    """
+    Whether a value read from the results backend is a version 2 payload.
+    """
+    return isinstance(blob, bytes) and blob.startswith(RESULTS_PAYLOAD_MAGIC)
+
+
+@dataclass
+class ResultsPayload:
+    """
+    A version 2 results backend payload.
+    """
+
+    # the payload, without its data
+    metadata: dict[str, Any]
+    # the data, as an Arrow IPC stream
+    stream: memoryview
+    # the row offset, row count, byte offset and byte length of each record batch
+    # of the stream
+    batches: list[list[int]]
+
+    @property
+    def num_rows(self) -> int | None:
+        if not self.batches:
+            return None
+        row_offset, num_rows, _, _ = self.batches[-1]
+        return row_offset + num_rows
+
+    def read_table(self, offset: int = 0, limit: int | None = None) -> pa.Table:
+        """
+        Read a range of rows of the data, only reading the record batches holding
+        them.
+
+        :param offset: The index of the first row to read
+        :param limit: The maximum number of rows to read
+        :returns: The rows
+        :raises pa.ArrowException: If the stream can't be read
+        """
+        reader = pa.ipc.open_stream(pa.py_buffer(self.stream))
+        if not self.batches:
+            return reader.read_all().slice(offset, limit)
+
+        end = None if limit is None else offset + limit
+        selected = [
+            (row_offset, byte_offset, byte_length)
+            for row_offset, num_rows, byte_offset, byte_length in self.batches
+            if row_offset + num_rows > offset and (end is None or row_offset < end)
+        ]
+        record_batches = []
+        for _, byte_offset, byte_length in selected:
+            messages = pa.ipc.MessageReader.open_stream(
+                pa.py_buffer(self.stream[byte_offset : byte_offset + byte_length])
+            )
+            record_batches.extend(
+                pa.ipc.read_record_batch(message, reader.schema)
+                for message in messages
+                if message.type == "record batch"
+            )
+
+        table = pa.Table.from_batches(record_batches, reader.schema)
+        first_row = selected[0][0] if selected else offset
+        return table.slice(offset - first_row, limit)
+
+
+def read_results_payload(blob: bytes) -> ResultsPayload:
+    """
+    Read a version 2 results backend payload.
+
+    :param blob: The payload read from the results backend
+    :returns: The payload
+    :raises SerializationError: If the payload can't be read
+    """
+    try:
+        magic, version, length = RESULTS_PAYLOAD_HEADER.unpack_from(blob)
+    except struct.error as ex:
+        raise SerializationError("Invalid results payload header") from ex
+    if magic != RESULTS_PAYLOAD_MAGIC or version != RESULTS_PAYLOAD_VERSION:
+        raise SerializationError(f"Unsupported results payload version: {version}")
+
+    view = memoryview(blob)
+    start = RESULTS_PAYLOAD_HEADER.size
+    try:
+        metadata = json.loads(bytes(view[start : start + length]))
+    except json.JSONDecodeError as ex:
+        raise SerializationError("Invalid results payload metadata") from ex
+
+    return ResultsPayload(
+        metadata=metadata,
+        stream=view[start + length :],
+        batches=metadata.pop(RESULTS_PAYLOAD_BATCHES_KEY, []),
+    )
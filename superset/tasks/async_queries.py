@@ -124,6 +124,35 @@ def load_chart_data_into_cache(
             raise
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+    refresh_key: str,
+) -> None:
+    """
+    Refresh the stale cached results of a chart data query context, queued by
+    ``QueryContextProcessor.refresh_stale_cache``.
+
+    :param job_metadata: The user the results are refreshed for
+    :param form_data: The query context form, forcing the queries
+    :param refresh_key: The data cache key marking the refresh as queued
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+        try:
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(form_data)
+            ChartDataCommand(query_context).run()
+        except SoftTimeLimitExceeded as ex:
+            logger.warning("A timeout occurred while refreshing chart data: %s", ex)
+            raise
+        finally:
+            cache_manager.data_cache.delete(refresh_key)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
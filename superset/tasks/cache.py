@@ -17,7 +17,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, TypedDict, Union
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, NamedTuple, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
 
@@ -27,25 +32,38 @@ from flask import current_app
 from sqlalchemy import and_, func
 
 from superset import db, security_manager
+from superset.commands.chart.exceptions import WarmUpCacheChartNotFoundError
+from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+from superset.constants import CACHE_DISABLED_TIMEOUT
+from superset.common.utils.concurrency import (
+    get_database_concurrency,
+    run_concurrently,
+)
 from superset.extensions import celery_app
-from superset.models.core import Log
+from superset.models.core import Database, Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.core import error_msg_from_exception, override_user, to_int
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
+from superset.viz import viz_types
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
 
+HOUR = timedelta(hours=1)
+WEEK = timedelta(days=7)
+
 
 class CacheWarmupPayload(TypedDict, total=False):
     chart_id: int
     dashboard_id: int | None
+    extra_filters: str
 
 
 class CacheWarmupTask(TypedDict):
@@ -53,12 +71,18 @@ class CacheWarmupTask(TypedDict):
     username: str | None
 
 
-def get_task(chart: Slice, dashboard: Optional[Dashboard] = None) -> CacheWarmupTask:
+def get_task(
+    chart: Slice,
+    dashboard: Optional[Dashboard] = None,
+    extra_filters: Optional[str] = None,
+) -> CacheWarmupTask:
     """Return task for warming up a given chart/table cache."""
     executors = current_app.config["CACHE_WARMUP_EXECUTORS"]
     payload: CacheWarmupPayload = {"chart_id": chart.id}
     if dashboard:
         payload["dashboard_id"] = dashboard.id
+        if extra_filters:
+            payload["extra_filters"] = extra_filters
 
     username: str | None
     try:
@@ -99,6 +123,10 @@ class Strategy:  # pylint: disable=too-few-public-methods
     def get_tasks(self) -> list[CacheWarmupTask]:
         raise NotImplementedError("Subclasses must implement get_tasks!")
 
+    def get_report(self) -> dict[str, Any]:
+        """Return a report of the last `get_tasks`, added to the result of the task."""
+        return {}
+
 
 class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
     """
@@ -233,7 +261,433 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return tasks
 
 
-strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
+class ChartRequest(NamedTuple):
+    """A logged request of the data of a chart."""
+
+    time: datetime
+    # the chart, dashboard, and state of the native filters of the dashboard
+    key: tuple[int, int | None, str | None]
+    duration_ms: int
+
+
+class PredictiveStrategy(Strategy):  # pylint: disable=too-few-public-methods
+    """
+    Warm up the charts, in dashboards with a state of their filters, predicted to be
+    requested in the next interval, before their cache expires.
+
+    The requests of the data of charts are read from the logs, per dashboard and state
+    of the native filters, and counted per day-of-week and hour-of-day. Requests
+    with native filter values which warm-ups can't reproduce, eg. a time range, and
+    charts whose cache is disabled are ignored. The requests in the next interval
+    are predicted from the requests at the same hours, on the same day of the week
+    and on any day. Charts whose cache, filled by their last request, outlives the
+    interval are skipped. The others are warmed up, most predicted requests per
+    second of query first, until the query time, estimated from the longest past
+    request, would exceed the budget (in seconds). The task should be scheduled
+    shortly before the interval, eg.:
+
+        beat_schedule = {
+            'cache-warmup-hourly': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=50, hour='*'),
+                'kwargs': {
+                    'strategy_name': 'predictive',
+                    'since': '28 days ago',
+                    'interval': 60,
+                    'budget': 600,
+                },
+            },
+        }
+
+    The report of the task includes the hit rate of the cache, without and with the
+    warm-ups, replaying the requests of the same interval a week earlier against a
+    prediction from the logs before it.
+    """
+
+    name = "predictive"
+    action = "ChartDataRestApi.data"
+    # the keys of the extra form data of the native filters reproduced by warm-ups
+    extra_form_data_keys = {"filters"}
+
+    # the weight of the requests on the same day of the week, against the requests on
+    # any day, at the same hours
+    day_of_week_weight = 0.5
+
+    def __init__(
+        self,
+        since: str = "28 days ago",
+        interval: int = 60,
+        budget: int = 600,
+    ) -> None:
+        super().__init__()
+        self.since = parse_human_datetime(since)
+        self.interval = timedelta(minutes=interval)
+        self.budget = budget
+        self.report: dict[str, Any] = {}
+
+    def get_tasks(self) -> list[CacheWarmupTask]:
+        now = datetime.utcnow()
+        requests = self._get_requests()
+        chart_ids = {request.key[0] for request in requests}
+        charts = {
+            chart.id: chart
+            for chart in db.session.query(Slice).filter(Slice.id.in_(chart_ids))
+        }
+        requests = [request for request in requests if request.key[0] in charts]
+        dashboard_ids = {request.key[1] for request in requests}
+        dashboards = {
+            dashboard.id: dashboard
+            for dashboard in db.session.query(Dashboard).filter(
+                Dashboard.id.in_(dashboard_ids - {None})
+            )
+        }
+        timeouts = {
+            chart_id: timeout
+            for chart_id, chart in charts.items()
+            # the results of charts whose cache is disabled can't be warmed up
+            if (timeout := self._get_cache_timeout(chart)) != CACHE_DISABLED_TIMEOUT
+        }
+        requests = [request for request in requests if request.key[0] in timeouts]
+
+        keys, self.report = self._predict(requests, timeouts, now)
+        self.report["backtest"] = self._backtest(requests, timeouts, now - WEEK)
+        return [
+            get_task(charts[chart_id], dashboards.get(dashboard_id), extra_filters)
+            for chart_id, dashboard_id, extra_filters in keys
+        ]
+
+    def get_report(self) -> dict[str, Any]:
+        return self.report
+
+    def _get_requests(self) -> list[ChartRequest]:
+        rows = (
+            db.session.query(
+                Log.dttm, Log.slice_id, Log.dashboard_id, Log.duration_ms, Log.json
+            )
+            .filter(
+                and_(
+                    Log.action == self.action,
+                    Log.slice_id.isnot(None),
+                    Log.dttm >= self.since,
+                )
+            )
+            .order_by(Log.dttm)
+            .yield_per(1000)
+        )
+        requests = []
+        for row in rows:
+            dashboard_id = row.dashboard_id
+            extra_filters = None
+            try:
+                form_data = json.loads(row.json or "{}").get("form_data")
+            except (AttributeError, TypeError, ValueError):
+                form_data = None
+            if isinstance(form_data, dict):
+                dashboard_id = dashboard_id or to_int(form_data.get("dashboardId"))
+                extra_form_data = form_data.get("extra_form_data") or {}
+                # the warm-ups only apply the filters of dashboards, requests with
+                # other native filter values, eg. a time range, can't be reproduced
+                if any(
+                    value
+                    for key, value in extra_form_data.items()
+                    if key not in self.extra_form_data_keys
+                ):
+                    continue
+                if filters := extra_form_data.get("filters"):
+                    if not dashboard_id:
+                        continue
+                    extra_filters = json.dumps(filters, sort_keys=True)
+            requests.append(
+                ChartRequest(
+                    row.dttm,
+                    (row.slice_id, dashboard_id, extra_filters),
+                    row.duration_ms or 0,
+                )
+            )
+        return requests
+
+    @staticmethod
+    def _get_cache_timeout(chart: Slice) -> int:
+        """Get the cache timeout of the data of a chart, as the chart data API."""
+        if chart.cache_timeout is not None:
+            cache_timeout = chart.cache_timeout
+        else:
+            cache_timeout = chart.datasource.cache_timeout if chart.datasource else None
+        if cache_timeout:
+            return cache_timeout
+        if (
+            data_cache_timeout := current_app.config["DATA_CACHE_CONFIG"].get(
+                "CACHE_DEFAULT_TIMEOUT"
+            )
+        ) is not None:
+            return data_cache_timeout
+        return current_app.config["CACHE_DEFAULT_TIMEOUT"]
+
+    def _get_slots(self, start: datetime) -> dict[tuple[int, int], float]:
+        """Get the hours of the week of an interval, and the fractions they cover."""
+        slots: dict[tuple[int, int], float] = defaultdict(float)
+        end = start + self.interval
+        time_ = start
+        while time_ < end:
+            hour = time_.replace(minute=0, second=0, microsecond=0) + HOUR
+            slots[(time_.weekday(), time_.hour)] += (min(hour, end) - time_) / HOUR
+            time_ = hour
+        return slots
+
+    def _predict(
+        self,
+        requests: list[ChartRequest],
+        timeouts: dict[int, int],
+        start: datetime,
+    ) -> tuple[list[tuple[int, int | None, str | None]], dict[str, Any]]:
+        """
+        Select the charts to warm up before an interval, from the requests before it.
+
+        :param requests: The requests, in order
+        :param timeouts: The cache timeouts of the charts
+        :param start: The start of the interval
+        :returns: The keys of the charts to warm up, and a report
+        """
+        counts: dict[Any, Counter[tuple[int, int]]] = defaultdict(Counter)
+        last: dict[Any, datetime] = {}
+        duration_ms: dict[Any, int] = defaultdict(int)
+        for request in requests:
+            if request.time >= start:
+                break
+            counts[request.key][(request.time.weekday(), request.time.hour)] += 1
+            last[request.key] = request.time
+            duration_ms[request.key] = max(
+                duration_ms[request.key], request.duration_ms
+            )
+
+        days = max((start - self.since) / timedelta(days=1), 1)
+        slots = self._get_slots(start)
+        end = start + self.interval
+        candidates = []
+        warm = 0
+        for key, counts_ in counts.items():
+            hours: Counter[int] = Counter()
+            for (_, hour), count in counts_.items():
+                hours[hour] += count
+            predicted = sum(
+                weight
+                * (
+                    self.day_of_week_weight * counts_[slot] * 7 / days
+                    + (1 - self.day_of_week_weight) * hours[slot[1]] / days
+                )
+                for slot, weight in slots.items()
+            )
+            if not predicted:
+                continue
+            if last[key] + timedelta(seconds=timeouts[key[0]]) >= end:
+                warm += 1
+                continue
+            candidates.append((predicted, duration_ms[key], key))
+
+        candidates.sort(key=lambda item: item[0] / max(item[1], 1), reverse=True)
+        keys = []
+        predicted_requests = 0.0
+        total_duration_ms = 0
+        for predicted, duration_ms_, key in candidates:
+            if total_duration_ms + duration_ms_ > self.budget * 1000:
+                continue
+            keys.append(key)
+            predicted_requests += predicted
+            total_duration_ms += duration_ms_
+
+        return keys, {
+            "predicted": len(candidates) + warm,
+            "warm": warm,
+            "warm_ups": len(keys),
+            "predicted_requests": round(predicted_requests, 2),
+            "duration_ms": total_duration_ms,
+        }
+
+    @staticmethod
+    def _get_hits(
+        requests: list[ChartRequest],
+        timeouts: dict[int, int],
+        start: datetime,
+        end: datetime,
+        warm_ups: set[tuple[int, int | None, str | None]],
+    ) -> tuple[int, int]:
+        """
+        Replay the requests until the end of an interval, filling the cache on misses,
+        and with the warm-ups at the start of the interval.
+
+        :returns: The number of cache hits in the interval, and of requests
+        """
+        filled: dict[Any, datetime] = {}
+        hits = count = 0
+        for request in requests:
+            if request.time >= end:
+                break
+            if request.time >= start and warm_ups:
+                filled.update(dict.fromkeys(warm_ups, start))
+                warm_ups = set()
+            hit = (time_ := filled.get(request.key)) is not None and time_ + timedelta(
+                seconds=timeouts[request.key[0]]
+            ) > request.time
+            if request.time >= start:
+                count += 1
+                hits += hit
+            if not hit:
+                filled[request.key] = request.time
+        return hits, count
+
+    def _backtest(
+        self,
+        requests: list[ChartRequest],
+        timeouts: dict[int, int],
+        start: datetime,
+    ) -> dict[str, Any] | None:
+        """Compare the hit rate of the cache in a past interval with the warm-ups."""
+        if start <= self.since:
+            return None
+        end = start + self.interval
+        keys, _ = self._predict(requests, timeouts, start)
+        hits, count = self._get_hits(requests, timeouts, start, end, set())
+        warm_hits, _ = self._get_hits(requests, timeouts, start, end, set(keys))
+        hit_rate = hits / count if count else None
+        warm_hit_rate = warm_hits / count if count else None
+        return {
+            "start": start.isoformat(),
+            "requests": count,
+            "warm_ups": len(keys),
+            "hit_rate": hit_rate,
+            "warm_hit_rate": warm_hit_rate,
+            "uplift": warm_hit_rate - hit_rate if count else None,  # type: ignore
+        }
+
+
+strategies = [
+    DummyStrategy,
+    TopNDashboardsStrategy,
+    DashboardTagsStrategy,
+    PredictiveStrategy,
+]
+
+
+class CacheWarmupResult(TypedDict):
+    chart_id: int
+    dashboard_id: int | None
+    username: str | None
+    duration_ms: int
+    cache_keys: int
+    cache_hits: int
+    error: str | None
+
+
+class CacheWarmupExecutor:
+    """
+    Warm up the cache of charts in the Celery worker, as the executors of the tasks.
+
+    Instead of requesting the web servers to warm up each chart, the query contexts of
+    the charts are built and run in the worker. Charts with the same cache keys as
+    charts already warmed up, eg. a chart in several dashboards without filters, are
+    skipped, and the charts of each database are warmed up with a bounded concurrency.
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        self.concurrency = concurrency
+        self._cache_keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    def run(self, tasks: list[CacheWarmupTask]) -> list[CacheWarmupResult]:
+        """
+        Warm up the charts of the tasks.
+
+        :param tasks: The tasks of a strategy
+        :returns: The results of the tasks, in their order
+        """
+        chart_ids = {task["payload"]["chart_id"] for task in tasks}
+        charts = db.session.query(Slice).filter(Slice.id.in_(chart_ids)).all()
+        databases = {
+            chart.id: chart.datasource.database
+            for chart in charts
+            if chart.datasource and chart.datasource.database
+        }
+
+        groups: dict[int | None, list[int]] = defaultdict(list)
+        for i, task in enumerate(tasks):
+            database = databases.get(task["payload"]["chart_id"])
+            groups[database.id if database else None].append(i)
+
+        def run_group(database: Database | None, indexes: list[int]) -> list[Any]:
+            return run_concurrently(
+                [partial(self._warm_up, tasks[i]) for i in indexes],
+                get_database_concurrency(database, self.concurrency),
+            )
+
+        database_by_id = {database.id: database for database in databases.values()}
+        group_results = run_concurrently(
+            [
+                partial(run_group, database_by_id.get(database_id), indexes)
+                for database_id, indexes in groups.items()
+            ],
+            len(groups),
+        )
+
+        results: dict[int, CacheWarmupResult] = {}
+        for indexes, results_ in zip(groups.values(), group_results, strict=True):
+            results.update(zip(indexes, results_, strict=True))
+        return [results[i] for i in range(len(tasks))]
+
+    def _warm_up(self, task: CacheWarmupTask) -> CacheWarmupResult:
+        result: CacheWarmupResult = {
+            "chart_id": task["payload"]["chart_id"],
+            "dashboard_id": task["payload"].get("dashboard_id"),
+            "username": task["username"],
+            "duration_ms": 0,
+            "cache_keys": 0,
+            "cache_hits": 0,
+            "error": None,
+        }
+        start = time.perf_counter()
+        try:
+            user = security_manager.find_user(username=task["username"])
+            with override_user(user):
+                self._warm_up_chart(result, task["payload"].get("extra_filters"))
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.exception("Error warming up cache of chart %s", result["chart_id"])
+            result["error"] = error_msg_from_exception(ex)
+        result["duration_ms"] = int((time.perf_counter() - start) * 1000)
+        return result
+
+    def _warm_up_chart(
+        self,
+        result: CacheWarmupResult,
+        extra_filters: str | None,
+    ) -> None:
+        chart = db.session.query(Slice).filter_by(id=result["chart_id"]).scalar()
+        if not chart:
+            raise WarmUpCacheChartNotFoundError()
+        command = ChartWarmUpCacheCommand(chart, result["dashboard_id"], extra_filters)
+
+        query_context = None
+        cache_keys: set[str] = set()
+        if chart.viz_type not in viz_types:
+            query_context = command.get_query_context(chart)
+            cache_keys = {
+                cache_key
+                for query in query_context.queries
+                if (cache_key := query_context.query_cache_key(query))
+            }
+            with self._lock:
+                result["cache_keys"] = len(cache_keys)
+                result["cache_hits"] = len(cache_keys & self._cache_keys)
+                if cache_keys and cache_keys <= self._cache_keys:
+                    logger.info("Cache of chart %s is warm", chart.id)
+                    return
+
+        logger.info("Warming up cache of chart %s", chart.id)
+        payload = command.run(query_context)
+        if payload["viz_error"]:
+            result["error"] = str(payload["viz_error"])
+            return
+        # the keys are only warm once the queries succeeded
+        with self._lock:
+            self._cache_keys |= cache_keys
 
 
 @celery_app.task(name="fetch_url")
@@ -281,11 +735,12 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
-) -> Union[dict[str, list[str]], str]:
+) -> Union[dict[str, Any], str]:
     """
     Warm up cache.
 
-    This task periodically hits charts to warm up the cache.
+    This task periodically hits charts to warm up the cache, in the worker when
+    `CACHE_WARMUP_IN_PROCESS` is set, or else by requesting the web servers.
 
     """
     logger.info("Loading strategy")
@@ -307,8 +762,33 @@ def cache_warmup(
         logger.exception(message)
         return message
 
-    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
-    for task in strategy.get_tasks():
+    tasks = strategy.get_tasks()
+    if current_app.config["CACHE_WARMUP_IN_PROCESS"]:
+        executor = CacheWarmupExecutor(current_app.config["CACHE_WARMUP_CONCURRENCY"])
+        report = executor.run(tasks)
+        logger.info(
+            "Warmed up %s charts, %s were warm",
+            len(report),
+            sum(
+                1
+                for result in report
+                if result["cache_keys"] and result["cache_hits"] == result["cache_keys"]
+            ),
+        )
+        results: dict[str, Any] = {
+            "results": report,
+            "errors": [
+                json.dumps({"chart_id": result["chart_id"]})
+                for result in report
+                if result["error"]
+            ],
+        }
+        if strategy_report := strategy.get_report():
+            results["report"] = strategy_report
+        return results
+
+    results = {"scheduled": [], "errors": []}
+    for task in tasks:
         username = task["username"]
         payload = json.dumps(task["payload"])
         if username:
@@ -328,4 +808,6 @@ def cache_warmup(
         else:
             logger.warning("Executor not found for %s", payload)
 
+    if strategy_report := strategy.get_report():
+        results["report"] = strategy_report
     return results
@@ -58,7 +58,15 @@ def set_and_log_cache(
     cache_value: dict[str, Any],
     cache_timeout: int | None = None,
     datasource_uid: str | None = None,
+    stale_timeout: int | None = None,
 ) -> None:
+    """
+    Set a value in a cache, logging the key in the metadata database if enabled.
+
+    With ``stale_timeout``, the value is kept for that many seconds after it expires
+    and marked with the time it expires at, as ``stale_after``, so that it can still
+    be served while it's refreshed, see ``QueryCacheManager.get``.
+    """
     if isinstance(cache_instance.cache, NullCache):
         return
 
@@ -72,8 +80,14 @@ def set_and_log_cache(
     if timeout == CACHE_DISABLED_TIMEOUT:
         return
     try:
-        dttm = datetime.utcnow().isoformat().split(".")[0]
+        now = datetime.utcnow()
+        dttm = now.isoformat().split(".")[0]
         value = {**cache_value, "dttm": dttm}
+        # a timeout of 0 never expires, so there is nothing to revalidate
+        if stale_timeout and timeout:
+            stale_after = now + timedelta(seconds=timeout)
+            value["stale_after"] = stale_after.isoformat().split(".")[0]
+            timeout += stale_timeout
         cache_instance.set(cache_key, value, timeout=timeout)
         stats_logger = app.config["STATS_LOGGER"]
         stats_logger.incr("set_cache_key")
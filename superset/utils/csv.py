@@ -17,11 +17,13 @@
 import logging
 import re
 import urllib.request
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from superset.utils import json
 from superset.utils.core import GenericDataType
@@ -38,6 +40,11 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# The same prefixes, as an RE2 pattern for Arrow. RE2 has no lookahead and its `\s`
+# only matches ASCII whitespace, so the pattern lists the other characters Python
+# considers to be whitespace.
+problematic_chars_pattern = r'^(?:""|[\s\x0b\x1c-\x1f\x85\pZ]+)?[\-@+|=%]'
+
 
 def escape_value(value: str) -> str:
     """
@@ -64,6 +71,76 @@ def escape_value(value: str) -> str:
     return value
 
 
+def escape_column(
+    column: pd.Series,
+    escape: Callable[[str], str],
+    pattern: str,
+) -> pd.Series:
+    """
+    Escape the string values of an object column.
+
+    The values to escape are found with a single regex over the whole column,
+    ``pattern`` is an RE2 pattern matching at least all the values ``escape``
+    changes. Only the values it matches are passed to ``escape``.
+
+    :param column: The column to escape
+    :param escape: The function escaping a string value
+    :param pattern: The RE2 pattern of the string values to escape
+    :return: The escaped column, or ``column`` if no value needs escaping
+    """
+    if column.dtype != np.dtype(object):
+        return column
+
+    values = column.to_numpy()
+    try:
+        array = pa.array(values, type=pa.string(), from_pandas=True)
+        positions = None
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # the column holds values other than strings, only match the strings
+        positions = np.flatnonzero(
+            np.fromiter(
+                (isinstance(value, str) for value in values),
+                dtype=bool,
+                count=len(values),
+            )
+        )
+        array = pa.array(values[positions], type=pa.string())
+
+    mask = (
+        pc.match_substring_regex(array, pattern)
+        .fill_null(False)
+        .to_numpy(zero_copy_only=False)
+    )
+    if not mask.any():
+        return column
+
+    matches = np.flatnonzero(mask) if positions is None else positions[mask]
+    values = values.copy()
+    # bytes values are converted to strings by Arrow, but aren't escaped
+    values[matches] = [
+        escape(value) if isinstance(value, str) else value
+        for value in values[matches]
+    ]
+    return pd.Series(values, index=column.index, name=column.name)
+
+
+def escape_columns(
+    df: pd.DataFrame,
+    escape: Callable[[str], str],
+    pattern: str,
+) -> None:
+    """
+    Escape the string values of the object columns of a dataframe in place, see
+    ``escape_column``.
+    """
+    # columns are accessed by position, as their names may be duplicated
+    for idx in range(len(df.columns)):
+        column = df.iloc[:, idx]
+        escaped = escape_column(column, escape, pattern)
+        if escaped is not column:
+            df.isetitem(idx, escaped)
+
+
 def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
@@ -72,11 +149,7 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    escape_columns(df, escape_value, problematic_chars_pattern)
 
     return df.to_csv(escapechar="\\", **kwargs)
 
@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from flask import current_app, has_app_context
+from sqlalchemy.engine import Engine
+
+
+class EngineRegistry:
+    """
+    A process-wide registry of SQLAlchemy engines, and their connection pools.
+
+    Creating an engine for every query means connecting to the database for every
+    query, which for remote databases is often slower than the query itself. Instead
+    the engines are kept per database and a key of the parameters of the connections,
+    eg. the catalog, schema, or impersonated user. Engines which haven't been used
+    for longer than the idle timeout, and the least recently used engines beyond the
+    maximum number of engines, are disposed, closing their connections.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._engines: OrderedDict[tuple[int, str], tuple[Engine, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _incr(key: str) -> None:
+        if has_app_context():
+            current_app.config["STATS_LOGGER"].incr(f"engine_registry.{key}")
+
+    def get(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int,
+        key: str,
+        create: Callable[[], Engine],
+        max_engines: int,
+        idle_timeout: float,
+    ) -> Engine:
+        """
+        Get the engine of a database for a key, creating it if it's not registered.
+
+        :param database_id: The ID of the database
+        :param key: The key of the parameters of the connections
+        :param create: Create the engine, when it's not registered
+        :param max_engines: The maximum number of engines kept
+        :param idle_timeout: The seconds unused engines are kept
+        :return: The engine
+        """
+        now = time.monotonic()
+        with self._lock:
+            if (item := self._engines.pop((database_id, key), None)) is not None:
+                self.hits += 1
+                engine = item[0]
+            else:
+                self.misses += 1
+                engine = create()
+            self._engines[(database_id, key)] = (engine, now)
+            disposed = self._evict(now - idle_timeout, max_engines)
+
+        self._incr("hit" if item is not None else "miss")
+        for evicted in disposed:
+            evicted.dispose()
+        return engine
+
+    def _evict(self, last_used: float, max_engines: int) -> list[Engine]:
+        """
+        Remove the engines unused since `last_used`, and the least recently used
+        engines beyond `max_engines`. Must be called holding the lock.
+        """
+        disposed = []
+        while self._engines:
+            engine, used = next(iter(self._engines.values()))
+            if used >= last_used and len(self._engines) <= max_engines:
+                break
+            self._engines.popitem(last=False)
+            disposed.append(engine)
+        return disposed
+
+    def invalidate(self, database_id: int) -> None:
+        """
+        Dispose the engines of a database, eg. when its connection is changed.
+
+        :param database_id: The ID of the database
+        """
+        with self._lock:
+            keys = [key for key in self._engines if key[0] == database_id]
+            disposed = [self._engines.pop(key)[0] for key in keys]
+        for engine in disposed:
+            engine.dispose()
+
+    def clear(self) -> None:
+        with self._lock:
+            disposed = [engine for engine, _ in self._engines.values()]
+            self._engines.clear()
+            self.hits = 0
+            self.misses = 0
+        for engine in disposed:
+            engine.dispose()
+
+    def reset_after_fork(self) -> None:
+        """
+        Forget the engines inherited by a forked process, without closing the
+        connections, which belong to the parent process.
+        """
+        self._lock = threading.Lock()
+        for engine, _ in self._engines.values():
+            engine.dispose(close=False)
+        self._engines.clear()
+
+
+engine_registry = EngineRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=engine_registry.reset_after_fork)
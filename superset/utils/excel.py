@@ -20,22 +20,24 @@ from typing import Any
 import pandas as pd
 
 from superset.utils.core import GenericDataType
+from superset.utils.csv import escape_columns
+
+FORMULA_PREFIXES = {"=", "+", "-", "@"}
+FORMULA_PREFIXES_PATTERN = r"^[=+\-@]"
+
+
+def quote_formula(value: str) -> str:
+    """
+    Quote a string value starting with a formula prefix.
+    """
+    return f"'{value}" if value[:1] in FORMULA_PREFIXES else value
 
 
 def quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Make sure to quote any formulas for security reasons.
     """
-    formula_prefixes = {"=", "+", "-", "@"}
-
-    for col in df.select_dtypes(include="object").columns:
-        df[col] = df[col].apply(
-            lambda x: (
-                f"'{x}"
-                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
-                else x
-            )
-        )
+    escape_columns(df, quote_formula, FORMULA_PREFIXES_PATTERN)
 
     return df
 
@@ -17,9 +17,11 @@
 import copy
 import decimal
 import logging
+import re
 import uuid
 from datetime import date, datetime, time, timedelta
-from typing import Any, Callable, Dict, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -31,9 +33,23 @@ from simplejson import JSONDecodeError
 from superset.constants import PASSWORD_MASK
 from superset.utils.dates import datetime_to_epoch, EPOCH
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logging.getLogger("MARKDOWN").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+JSONBackend = Literal["simplejson", "orjson"]
+
+# the library backing ``dumps`` and ``loads``, set from the ``JSON_BACKEND`` config
+_backend: dict[str, JSONBackend] = {"name": "simplejson"}
+
+# runs of digits which may be integers exceeding 64 bits, parsed as floats by orjson
+_LONG_NUMBER_RE = re.compile(r"\d{19}")
+_LONG_NUMBER_BYTES_RE = re.compile(rb"\d{19}")
+
 
 class DashboardEncoder(simplejson.JSONEncoder):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -184,6 +200,72 @@ def validate_json(obj: Union[bytes, bytearray, str]) -> None:
             raise
 
 
+def set_backend(name: JSONBackend) -> None:
+    """
+    Set the library backing ``dumps`` and ``loads``.
+
+    :param name: Either "simplejson" or "orjson"
+    :raises ValueError: If the backend is unknown
+    """
+    if name not in ("simplejson", "orjson"):
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is None:
+        logger.warning("orjson is not installed, using simplejson instead")
+        name = "simplejson"
+    _backend["name"] = name
+
+
+def get_backend() -> JSONBackend:
+    """
+    Return the library backing ``dumps`` and ``loads``.
+    """
+    return _backend["name"]
+
+
+def _orjson_default(
+    default: Optional[Callable[[Any], Any]],
+    encoding: Optional[str],
+    obj: Any,
+) -> Any:
+    """
+    Serialize the objects orjson doesn't handle natively like simplejson would.
+
+    Types simplejson serializes itself (float subclasses such as NumPy floats,
+    decimals, bytes and named tuples) are converted first, everything else,
+    including dates, is passed to ``default``.
+    """
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, decimal.Decimal):
+        return orjson.Fragment(str(obj))
+    if isinstance(obj, bytes) and encoding is not None:
+        return obj.decode(encoding)
+    if callable(asdict := getattr(obj, "_asdict", None)):
+        return asdict()
+    if default is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return default(obj)
+
+
+def _orjson_dumps_option(
+    sort_keys: bool,
+    indent: Union[str, int, None],
+    separators: Union[tuple[str, str], None],
+) -> Optional[int]:
+    """
+    Return the orjson option matching the simplejson formatting arguments, or
+    ``None`` if orjson can't produce the requested formatting.
+    """
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent is None:
+        return option if separators in (None, (",", ":")) else None
+    if indent in (2, "  ") and separators in (None, (",", ": ")):
+        return option | orjson.OPT_INDENT_2
+    return None
+
+
 def dumps(  # pylint: disable=too-many-arguments
     obj: Any,
     default: Optional[Callable[[Any], Any]] = json_iso_dttm_ser,
@@ -198,6 +280,9 @@ def dumps(  # pylint: disable=too-many-arguments
     """
     Dumps object to compatible JSON format
 
+    With the orjson backend, calls it can serve with the same output values are
+    encoded by orjson, the others by simplejson.
+
     :param obj: The serializable object
     :param default: function that should return a serializable version of obj
     :param allow_nan: when set to True NaN values will be serialized
@@ -209,6 +294,19 @@ def dumps(  # pylint: disable=too-many-arguments
     :returns: String object in the JSON compatible form
     """
 
+    if _backend["name"] == "orjson" and ignore_nan and cls is None:
+        option = _orjson_dumps_option(sort_keys, indent, separators)
+        if option is not None:
+            try:
+                return orjson.dumps(
+                    obj,
+                    default=partial(_orjson_default, default, encoding),
+                    option=option,
+                ).decode()
+            except orjson.JSONEncodeError:
+                # let simplejson serialize the object or raise its own error
+                pass
+
     results_string = ""
     dumps_kwargs: Dict[str, Any] = {
         "default": default,
@@ -237,12 +335,32 @@ def loads(
     """
     deserializable instance to a Python object.
 
+    With the orjson backend, documents are parsed by orjson unless options it doesn't
+    support are set, or the document has numbers of 19 digits or more, which orjson
+    would parse as floats when they are integers exceeding 64 bits.
+
     :param obj: The deserializable object
     :param encoding: determines the encoding used to interpret the obj
     :param allow_nan: if True it will allow the parser to accept nan values
     :param object_hook: function that will be called to decode objects values
     :returns: A Python object deserialized from string
     """
+    if (
+        _backend["name"] == "orjson"
+        and isinstance(obj, (str, bytes))
+        and encoding is None
+        and not allow_nan
+        and object_hook is None
+        and not (
+            _LONG_NUMBER_RE if isinstance(obj, str) else _LONG_NUMBER_BYTES_RE
+        ).search(obj)
+    ):
+        try:
+            return orjson.loads(obj)
+        except orjson.JSONDecodeError:
+            # let simplejson parse the document or raise its own error
+            pass
+
     return simplejson.loads(
         obj,
         encoding=encoding,
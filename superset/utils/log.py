@@ -16,17 +16,22 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_app_context, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -371,7 +376,40 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
+    @staticmethod
+    def get_rows(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Get the values of the columns of the logs of the records of an event.
+        """
+        rows = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            rows.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return rows
+
+    def log(  # pylint: disable=too-many-arguments
         self,
         user_id: int | None,
         action: str,
@@ -386,24 +424,16 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
-            )
-            logs.append(log)
+        rows = self.get_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        logs = [Log(**row) for row in rows]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -423,6 +453,176 @@ class DBEventLogger(AbstractEventLogger):
                 )
 
 
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that writes logs to Superset DB in batches, from a background thread
+
+    Requests only add their logs to a bounded queue, instead of committing them with
+    the session of the request. A thread inserts the queued logs with multi-row
+    INSERTs, when `batch_size` logs are queued or every `flush_interval` seconds. When
+    the queue is full, logging waits up to `block_timeout` seconds for it, and then
+    drops the logs, counting them. The queued logs are flushed when the process exits.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000,
+        block_timeout: float = 0.05,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.flushed = 0
+        self._app: Flask | None = None
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if not has_app_context():
+            super().log(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                *args,
+                **kwargs,
+            )
+            return
+
+        # pylint: disable=protected-access
+        self._start(current_app._get_current_object())
+        dttm = datetime.utcnow()
+        rows = self.get_rows(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        for row in rows:
+            row["dttm"] = dttm
+            try:
+                self._queue.put(row, timeout=self.block_timeout)
+            except queue.Full:
+                self._drop(1)
+
+    def _drop(self, count: int) -> None:
+        """
+        Count logs which couldn't be written, from any thread.
+        """
+        with self._dropped_lock:
+            self.dropped += count
+        for _ in range(count):
+            stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def _start(self, app: Flask) -> None:
+        """
+        Start the flusher thread, unless it's running in this process.
+        """
+        if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # the thread, and logs queued by it, belong to the parent process
+                self._queue = queue.Queue(self.max_queue_size)
+                self._thread = None
+                self._pid = os.getpid()
+            if self._thread is None or not self._thread.is_alive():
+                self._app = app
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="AsyncDBEventLogger",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Insert the queued logs in batches, until `None` is queued.
+        """
+        running = True
+        while running:
+            batch: list[dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if row is None:
+                    running = False
+                    break
+                batch.append(row)
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        assert self._app is not None
+        try:
+            with self._app.app_context():
+                with db.engine.begin() as connection:
+                    connection.execute(Log.__table__.insert().values(batch))
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("AsyncDBEventLogger failed to log event(s)")
+            self._drop(len(batch))
+            return
+        self.flushed += len(batch)
+        stats_logger_manager.instance.incr("event_logger.flush")
+        stats_logger_manager.instance.gauge(
+            "event_logger.queue_size", self._queue.qsize()
+        )
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Flush the queued logs and stop the flusher thread, waiting for at most
+        `timeout` seconds. The logs still queued then are dropped.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._pid != os.getpid() or not thread.is_alive():
+                return
+            self._thread = None
+
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning(
+                "AsyncDBEventLogger dropped %s queued event(s) on shutdown",
+                self._queue.qsize(),
+            )
+            return
+        thread.join(max(deadline - time.monotonic(), 0))
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -0,0 +1,160 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Planning and execution of the post processing operations of a query.
+
+The operations are all validated before any is applied, and then applied to a
+working DataFrame which is only copied when needed: operations only changing the
+labels or the order of the rows change it in place, as well as cumulative operations
+following an operation that returned new data.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing
+from superset.utils.dates import now_as_float
+
+# operations only changing the labels or the order of the rows of a DataFrame,
+# applied in place to a shallow copy of the DataFrame
+LABEL_OPERATIONS = {"flatten", "rename", "sort"}
+# operations returning a DataFrame with data of its own
+ALLOCATING_OPERATIONS = {"aggregate", "cum", "pivot"}
+# operations changing the data of a DataFrame in place, when it has data of its own
+DATA_OPERATIONS = {"cum"}
+
+
+class PostProcessingStep(NamedTuple):
+    operation: str
+    options: dict[str, Any]
+
+
+def _can_select_before_sort(
+    sort: PostProcessingStep,
+    select: PostProcessingStep,
+) -> bool:
+    """
+    Whether selecting columns before sorting the rows gives the same DataFrame, ie.
+    when the columns sorted by are selected, and not renamed.
+    """
+    if sort.operation != "sort" or select.operation != "select":
+        return False
+
+    by = sort.options.get("by") or []
+    by = [by] if isinstance(by, str) else by
+    columns = select.options.get("columns")
+    exclude = select.options.get("exclude") or []
+    rename = select.options.get("rename") or {}
+    if columns and len(set(columns)) != len(columns):
+        return False
+    return all(
+        (not columns or column in columns)
+        and column not in exclude
+        and column not in rename
+        for column in by
+    )
+
+
+def plan_post_processing(
+    post_processing: list[dict[str, Any]],
+) -> list[PostProcessingStep]:
+    """
+    Validate post processing operations, and plan their execution.
+
+    Sorting the rows followed by selecting a subset of the columns is planned the
+    other way around, so that less columns are sorted. The ``inplace`` options of the
+    operations are ignored.
+
+    :param post_processing: The post processing operations of a query
+    :return: The steps to execute
+    :raises InvalidPostProcessingError: If a post processing operation is incorrect
+    """
+    steps: list[PostProcessingStep] = []
+    for post_process in post_processing:
+        operation = post_process.get("operation")
+        if not operation:
+            raise InvalidPostProcessingError(
+                _("`operation` property of post processing object undefined")
+            )
+        if not callable(getattr(pandas_postprocessing, operation, None)):
+            raise InvalidPostProcessingError(
+                _(
+                    "Unsupported post processing operation: %(operation)s",
+                    operation=operation,
+                )
+            )
+        options = post_process.get("options") or {}
+        if not isinstance(options, dict):
+            raise InvalidPostProcessingError(
+                _("`options` property of post processing object must be an object")
+            )
+        # whether operations are applied in place is decided by the executor only, so
+        # that the DataFrame being processed, eg. a cached one, is never changed
+        options = {key: value for key, value in options.items() if key != "inplace"}
+        steps.append(PostProcessingStep(operation, options))
+
+    for i in range(len(steps) - 1):
+        if _can_select_before_sort(steps[i], steps[i + 1]):
+            steps[i], steps[i + 1] = steps[i + 1], steps[i]
+
+    return steps
+
+
+def execute_post_processing(
+    df: DataFrame,
+    steps: list[PostProcessingStep],
+) -> tuple[DataFrame, list[dict[str, Any]]]:
+    """
+    Apply planned post processing operations to a DataFrame.
+
+    :param df: The DataFrame to process, left unchanged
+    :param steps: The steps planned by `plan_post_processing`
+    :return: The processed DataFrame, and the duration of each operation in ms
+    """
+    durations: list[dict[str, Any]] = []
+    # whether the working DataFrame is a copy, and has data of its own
+    owned = data_owned = False
+    for step in steps:
+        options = step.options
+        if step.operation in LABEL_OPERATIONS:
+            if not owned:
+                df = df.copy(deep=False)
+                owned = True
+            options = {**options, "inplace": True}
+        elif step.operation in DATA_OPERATIONS and data_owned:
+            options = {**options, "inplace": True}
+
+        start = now_as_float()
+        result = getattr(pandas_postprocessing, step.operation)(df, **options)
+        durations.append(
+            {
+                "operation": step.operation,
+                "duration_ms": round(now_as_float() - start, 3),
+            }
+        )
+
+        if result is not df:
+            owned = True
+            data_owned = step.operation in ALLOCATING_OPERATIONS
+            df = result
+
+    return df, durations
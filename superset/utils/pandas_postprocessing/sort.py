@@ -28,6 +28,7 @@ def sort(
     is_sort_index: bool = False,
     by: Optional[Union[list[str], str]] = None,
     ascending: Union[list[bool], bool] = True,
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Sort a DataFrame.
@@ -36,12 +37,19 @@ def sort(
     :param is_sort_index: Whether by index or value to sort
     :param by: Name or list of names to sort by.
     :param ascending: Sort ascending or descending.
+    :param inplace: Whether to sort the DataFrame instead of returning a new one.
     :return: Sorted DataFrame
     :raises InvalidPostProcessingError: If the request in incorrect
     """
     if not is_sort_index and not by:
         return df
 
+    if inplace:
+        if is_sort_index:
+            df.sort_index(ascending=ascending, inplace=True)
+        else:
+            df.sort_values(by=by, ascending=ascending, inplace=True)
+        return df
     if is_sort_index:
         return df.sort_index(ascending=ascending)
     return df.sort_values(by=by, ascending=ascending)
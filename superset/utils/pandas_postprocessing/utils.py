@@ -182,7 +182,10 @@ def _get_aggregate_funcs(
 
 
 def _append_columns(
-    base_df: DataFrame, append_df: DataFrame, columns: dict[str, str]
+    base_df: DataFrame,
+    append_df: DataFrame,
+    columns: dict[str, str],
+    inplace: bool = False,
 ) -> DataFrame:
     """
     Function for adding columns from one DataFrame to another DataFrame. Calls the
@@ -199,11 +202,13 @@ def _append_columns(
            while `{'y': 'y2'}` will add a column `y2` to `base_df` based
            on values in column `y` in `append_df`, leaving the original column `y`
            in `base_df` unchanged.
+    :param inplace: Whether to replace the values of `base_df` instead of returning
+           a new DataFrame, when the columns are only replaced.
     :return: new DataFrame with combined data from `base_df` and `append_df`
     """
     if all(key == value for key, value in columns.items()):
         # make sure to return a new DataFrame instead of changing the `base_df`.
-        _base_df = base_df.copy()
+        _base_df = base_df if inplace else base_df.copy()
         _base_df.loc[:, columns.keys()] = append_df
         return _base_df
     append_df = append_df.rename(columns=columns)
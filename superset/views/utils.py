@@ -18,7 +18,7 @@ import contextlib
 import logging
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Optional, Union
+from typing import Any, Callable, cast, DefaultDict, Optional, Union
 from urllib import parse
 
 import msgpack
@@ -45,6 +45,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import is_results_payload_v2, read_results_payload
 from superset.superset_typing import (
     ExplorableData,
     FlaskResponse,
@@ -541,8 +542,27 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize a results backend payload, keeping the ``limit`` rows of its data
+    starting at ``offset``. Only the record batches holding them are read from
+    version 2 payloads.
+    """
+    if is_results_payload_v2(payload):
+        with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
+            results_payload = read_results_payload(cast(bytes, payload))
+            try:
+                pa_table = results_payload.read_table(offset, limit)
+            except pa.ArrowException as ex:
+                raise SerializationError("Unable to deserialize table") from ex
+
+        return _expand_results_payload(results_payload.metadata, pa_table, query)
+
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -557,25 +577,42 @@ def _deserialize_results_payload(
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+        return _expand_results_payload(
+            ds_payload, pa_table.slice(offset, limit), query
+        )
 
-        for column in ds_payload["selected_columns"]:
-            if "name" in column:
-                column["column_name"] = column.get("name")
+    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
+        ds_payload = json.loads(payload)
 
-        db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
-        ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
-        )
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
 
-        return ds_payload
+    return ds_payload
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+
+def _expand_results_payload(
+    ds_payload: dict[str, Any], pa_table: pa.Table, query: Query
+) -> dict[str, Any]:
+    """
+    Convert the Arrow data of a results backend payload to records, and expand them.
+    """
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+    ds_payload["data"] = dataframe.df_to_records(df) or []
+
+    for column in ds_payload["selected_columns"]:
+        if "name" in column:
+            column["column_name"] = column.get("name")
+
+    db_engine_spec = query.database.db_engine_spec
+    all_columns, data, expanded_columns = db_engine_spec.expand_data(
+        ds_payload["selected_columns"], ds_payload["data"]
+    )
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
 
 
 def get_cta_schema_name(
@@ -249,6 +249,25 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         # check that global logs decorator is capturing from form_data
         assert isinstance(mock_g.logs_context.get("dataset_id"), int)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_config({"CHART_DATA_STREAMING_BATCH_SIZE": 3})
+    def test_with_stream__data_is_streamed(self):
+        """
+        Chart data API: Test streaming the JSON response matches the regular one
+        """
+        expected = self.post_assert_metric(
+            CHART_DATA_URI, self.query_context_payload, "data"
+        ).json
+
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}?stream=true", self.query_context_payload, "data"
+        )
+
+        assert rv.status_code == 200
+        result = json.loads(rv.get_data(as_text=True))
+        assert result["result"][0]["data"] == expected["result"][0]["data"]
+        assert result["result"][0]["rowcount"] == expected["result"][0]["rowcount"]
+
     @staticmethod
     def assert_row_count(rv: Response, expected_row_count: int):
         assert rv.json["result"][0]["rowcount"] == expected_row_count
@@ -0,0 +1,84 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.utils import json
+from tests.conftest import with_config
+
+
+@with_config({"CHART_DATA_STREAMING_BATCH_SIZE": 2})
+def test_streaming_json_response(mocker: MockerFixture) -> None:
+    """
+    Test that the streamed JSON payload matches the regular JSON response.
+    """
+    from superset.charts.data.api import ChartDataRestApi
+    from superset.common.chart_data import ChartDataResultFormat
+    from superset.common.query_context_processor import QueryContextProcessor
+
+    df = pd.DataFrame(
+        {
+            "ts": [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)],
+            "name": ["a", "b", None],
+            "value": [1.5, np.nan, 3.0],
+            "big": [2**60, 1, 2],
+        }
+    )
+
+    def get_queries(stream_data: bool) -> list[dict[str, Any]]:
+        query_context = mocker.MagicMock(
+            result_format=ChartDataResultFormat.JSON,
+            stream_data=stream_data,
+        )
+        processor = QueryContextProcessor(query_context)
+        return [
+            {
+                "cache_key": "abc",
+                "rowcount": 3,
+                "data": processor.get_data(df.copy(), []),
+            },
+            {
+                "cache_key": "def",
+                "rowcount": 0,
+                "data": processor.get_data(df.iloc[0:0], []),
+            },
+            {"cache_key": "ghi", "error": "failed"},
+        ]
+
+    # the regular JSON response, as encoded by `ChartDataRestApi._send_chart_response`
+    regular = json.dumps(
+        {"result": get_queries(stream_data=False)},
+        default=json.json_int_dttm_ser,
+        ignore_nan=True,
+    )
+    with current_app.test_request_context():
+        response = ChartDataRestApi._create_streaming_json_response(
+            mocker.MagicMock(), get_queries(stream_data=True)
+        )
+        streamed = "".join(response.response)
+
+    assert response.mimetype == "application/json"
+    payload = json.loads(streamed)
+    assert payload == json.loads(regular)
+    assert payload["result"][0]["data"][0]["big"] == 2**60
+    assert payload["result"][0]["data"][1]["value"] is None
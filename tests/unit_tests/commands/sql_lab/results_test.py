@@ -0,0 +1,185 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Unit tests for the SQL Lab results command."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import msgpack
+import pyarrow as pa
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.commands.sql_lab.results import SqlExecutionResultsCommand
+from superset.common.db_query_status import QueryStatus
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.errors import SupersetErrorType
+from superset.exceptions import SupersetErrorException
+from superset.sqllab.utils import write_ipc_buffer, write_results_payload
+from superset.utils import json
+from superset.utils.core import zlib_compress
+
+TABLE = pa.table({"id": [1, 2, 3], "name": ["a", "b", None]})
+
+
+def _payload(data: Any) -> dict[str, Any]:
+    columns = [
+        {"column_name": "id", "name": "id", "type": "INT", "is_dttm": False},
+        {"column_name": "name", "name": "name", "type": "STRING", "is_dttm": False},
+    ]
+    return {
+        "status": QueryStatus.SUCCESS,
+        "data": data,
+        "columns": columns,
+        "selected_columns": columns,
+        "expanded_columns": [],
+        "query": {"rows": 3},
+    }
+
+
+PAYLOADS = {
+    "v1_json": lambda: zlib_compress(json.dumps(_payload(TABLE.to_pylist()))),
+    "v1_msgpack": lambda: zlib_compress(
+        msgpack.dumps(
+            _payload(write_ipc_buffer(TABLE).to_pybytes()), use_bin_type=True
+        )
+    ),
+    "v2": lambda: write_results_payload(_payload(TABLE)),
+}
+
+
+@pytest.fixture
+def mock_results(mocker: MockerFixture) -> Any:
+    """Mock the query and the results backend, returning a stored payload."""
+    mock_db = mocker.patch("superset.commands.sql_lab.results.db")
+    query = mock_db.session.query.return_value.filter_by.return_value.one_or_none()
+    query.database.db_engine_spec = BaseEngineSpec
+    mocker.patch("superset.commands.sql_lab.results.app")
+
+    def set_payload(name: str) -> None:
+        results_backend = mocker.patch(
+            "superset.commands.sql_lab.results.results_backend", new=MagicMock()
+        )
+        results_backend.get.return_value = PAYLOADS[name]()
+        mocker.patch(
+            "superset.commands.sql_lab.results.results_backend_use_msgpack",
+            name != "v1_json",
+        )
+
+    return set_payload
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+def test_run(mock_results: Any, name: str) -> None:
+    """
+    Test that results stored in all the payload formats are returned as records.
+    """
+    mock_results(name)
+
+    result = SqlExecutionResultsCommand("key").run()
+
+    assert result["data"] == TABLE.to_pylist()
+    assert result["query"] == {"rows": 3}
+
+
+@pytest.mark.parametrize("name", ["v1_msgpack", "v2"])
+@pytest.mark.parametrize("rows,expected", [(None, 3), (10, 3), (2, 2)])
+def test_run_arrow(
+    mock_results: Any,
+    name: str,
+    rows: int | None,
+    expected: int,
+) -> None:
+    """
+    Test that results stored as Arrow data are returned as an Arrow IPC stream.
+    """
+    mock_results(name)
+
+    stream = SqlExecutionResultsCommand("key", rows=rows).run_arrow()
+
+    assert isinstance(stream, bytes)
+    assert pa.ipc.open_stream(stream).read_all() == TABLE.slice(0, expected)
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+@pytest.mark.parametrize(
+    "rows,offset,limit,expected",
+    [
+        (None, 1, None, [2, 3]),
+        (None, 1, 1, [2]),
+        (2, 1, None, [2]),
+        (2, 1, 5, [2]),
+        (None, 5, None, []),
+    ],
+)
+def test_run_range(
+    mock_results: Any,
+    name: str,
+    rows: int | None,
+    offset: int,
+    limit: int | None,
+    expected: list[int],
+) -> None:
+    """
+    Test that a range of the results can be requested for all the payload formats.
+    """
+    mock_results(name)
+
+    result = SqlExecutionResultsCommand(
+        "key", rows=rows, offset=offset, limit=limit
+    ).run()
+
+    assert [row["id"] for row in result["data"]] == expected
+
+
+@pytest.mark.parametrize("name", ["v1_msgpack", "v2"])
+def test_run_arrow_range(mock_results: Any, name: str) -> None:
+    """
+    Test that a range of the results can be requested as an Arrow IPC stream.
+    """
+    mock_results(name)
+
+    stream = SqlExecutionResultsCommand("key", offset=1, limit=1).run_arrow()
+
+    assert isinstance(stream, bytes)
+    assert pa.ipc.open_stream(stream).read_all() == TABLE.slice(1, 1)
+
+
+def test_run_arrow_json_payload(mock_results: Any) -> None:
+    """
+    Test that results stored as JSON aren't returned as an Arrow IPC stream.
+    """
+    mock_results("v1_json")
+
+    assert SqlExecutionResultsCommand("key").run_arrow() is None
+
+
+def test_run_arrow_invalid_payload(mock_results: Any, mocker: MockerFixture) -> None:
+    """
+    Test that unreadable payloads raise the deserialization error.
+    """
+    mock_results("v2")
+    results_backend = mocker.patch(
+        "superset.commands.sql_lab.results.results_backend", new=MagicMock()
+    )
+    results_backend.get.return_value = b"SSRP\x03\x00\x00\x00\x00"
+
+    with pytest.raises(SupersetErrorException) as excinfo:
+        SqlExecutionResultsCommand("key").run_arrow()
+
+    assert excinfo.value.error.error_type == SupersetErrorType.RESULTS_BACKEND_ERROR
+    assert excinfo.value.status == 404
@@ -16,14 +16,20 @@
 # under the License.
 """Unit tests for SQL Lab Streaming CSV Export Command."""
 
+import io
+from datetime import date, datetime
+from decimal import Decimal
 from unittest.mock import MagicMock, Mock, patch
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pytest_mock import MockerFixture
 
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.commands.streaming_export.base import StreamingExportFormat
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.sqllab.limiting_factor import LimitingFactor
@@ -497,7 +503,8 @@ def test_completion_logging(mock_logger, mocker, mock_query, mock_result_proxy):
     list(generator)
 
     assert mock_logger.info.called
-    log_message = str(mock_logger.info.call_args)
+    log_format, *log_args = mock_logger.info.call_args.args
+    log_message = log_format % tuple(log_args)
     assert "Streaming CSV completed" in log_message
     assert "rows" in log_message
 
@@ -538,3 +545,220 @@ def test_null_values_handling(mocker, mock_query):
     assert "1,,100" in csv_data
     assert "2,test," in csv_data
     assert ",," in csv_data
+
+
+def _setup_result(mock_query: MagicMock, mock_result: MagicMock) -> None:
+    """Return the mock result proxy when executing the query."""
+    mock_connection = MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    mock_query.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+
+def test_csv_generation_escapes_formulas(mocker, mock_query):
+    """Test CSV generation escapes values like the non-streaming export."""
+    mock_query.select_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["=header", "text", "mixed", "number"]
+    mock_result.fetchmany.side_effect = [
+        [("a", "=SUM(A1)", 1, -1), ("b", "-1.5", "+cmd|' /C calc'!A0", 2)],
+        [("c", "safe", None, 3)],
+        [],
+    ]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+
+    command = StreamingSqlResultExportCommand("test_client_123", chunk_size=2)
+    command.validate()
+
+    csv_data = "".join(command.run()())
+
+    assert csv_data.splitlines() == [
+        "'=header,text,mixed,number",
+        "a,'=SUM(A1),1,-1",
+        "b,-1.5,'+cmd\\|' /C calc'!A0,2",
+        "c,safe,,3",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [2, 1000])
+def test_parquet_generation(mocker, mock_query, chunk_size):
+    """Test Parquet generation across fetched batches and row groups."""
+    mock_query.select_sql = "SELECT * FROM test"
+    mocker.patch("superset.commands.streaming_export.base.PARQUET_ROW_GROUP_SIZE", 4)
+
+    rows = [
+        (i, f"name_{i}" if i % 3 else None, Decimal(i) / 10, "=A1")
+        for i in range(10)
+    ]
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id", "name", "amount", "formula"]
+    mock_result.fetchmany.side_effect = [
+        rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)
+    ] + [[]]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123",
+        chunk_size=chunk_size,
+        export_format=StreamingExportFormat.PARQUET,
+    )
+    command.validate()
+
+    chunks = list(command.run()())
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.schema.field("amount").type == pa.decimal128(38, 1)
+    # values are kept as-is in binary formats
+    assert table.to_pylist() == [
+        {"id": id_, "name": name, "amount": amount, "formula": formula}
+        for id_, name, amount, formula in rows
+    ]
+
+
+def test_arrow_generation(mocker, mock_query):
+    """Test Arrow IPC stream generation with types inferred from the first batch."""
+    mock_query.select_sql = "SELECT * FROM test"
+    mock_query.executed_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id", "empty", "mixed", "big"]
+    mock_result.fetchmany.side_effect = [
+        [(1, None, "a", 2**64), (2, None, 1, 1)],
+        [(3, "b", {"c": 1}, 2)],
+        [(4, None, None, 3)],
+        [],
+    ]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+    mocker.patch.object(
+        StreamingSqlResultExportCommand, "_get_row_limit", return_value=3
+    )
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123",
+        chunk_size=2,
+        export_format=StreamingExportFormat.ARROW,
+    )
+    command.validate()
+
+    chunks = list(command.run()())
+    table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+
+    assert table.schema == pa.schema(
+        [
+            ("id", pa.int64()),
+            ("empty", pa.string()),
+            ("mixed", pa.string()),
+            ("big", pa.string()),
+        ]
+    )
+    assert table.to_pylist() == [
+        {"id": 1, "empty": None, "mixed": "a", "big": str(2**64)},
+        {"id": 2, "empty": None, "mixed": "1", "big": "1"},
+        {"id": 3, "empty": "b", "mixed": "{'c': 1}", "big": "2"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "export_format", [StreamingExportFormat.PARQUET, StreamingExportFormat.ARROW]
+)
+def test_binary_generation_casts_batches(mocker, mock_query, export_format):
+    """Test that later batches are cast to the types of the first batch."""
+    mock_query.select_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["amount", "ts"]
+    mock_result.fetchmany.side_effect = [
+        [(1.5, datetime(2024, 1, 1, 12))],
+        [(Decimal("2.5"), date(2024, 1, 2))],
+        [],
+    ]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123", chunk_size=1, export_format=export_format
+    )
+    command.validate()
+
+    data = b"".join(command.run()())
+
+    if export_format == StreamingExportFormat.PARQUET:
+        table = pq.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    assert table.to_pylist() == [
+        {"amount": 1.5, "ts": datetime(2024, 1, 1, 12)},
+        {"amount": 2.5, "ts": datetime(2024, 1, 2)},
+    ]
+
+
+@pytest.mark.parametrize(
+    "export_format", [StreamingExportFormat.PARQUET, StreamingExportFormat.ARROW]
+)
+def test_binary_generation_error_aborts(mocker, mock_query, export_format):
+    """Test that errors abort binary streams, instead of yielding the error marker."""
+    mock_query.select_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id"]
+    mock_result.fetchmany.side_effect = [[(1,)], [("a",)], []]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123", chunk_size=1, export_format=export_format
+    )
+    command.validate()
+
+    chunks = []
+    with pytest.raises(pa.ArrowInvalid):
+        for chunk in command.run()():
+            chunks.append(chunk)
+    assert all(b"__STREAM_ERROR__" not in chunk for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "export_format", [StreamingExportFormat.PARQUET, StreamingExportFormat.ARROW]
+)
+def test_binary_generation_empty_result(mocker, mock_query, export_format):
+    """Test binary formats produce a valid file when the query returns no rows."""
+    mock_query.select_sql = "SELECT * FROM test"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id", "name"]
+    mock_result.fetchmany.side_effect = [[]]
+
+    _setup_sqllab_mocks(mocker, mock_query)
+    _setup_result(mock_query, mock_result)
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123", export_format=export_format
+    )
+    command.validate()
+
+    data = b"".join(command.run()())
+
+    if export_format == StreamingExportFormat.PARQUET:
+        table = pq.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name"]
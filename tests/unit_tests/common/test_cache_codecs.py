@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.utils.cache_codecs import (
+    ArrowQueryCacheCodec,
+    get_df_loader,
+    ParquetQueryCacheCodec,
+    PickleQueryCacheCodec,
+    QueryCacheCodec,
+)
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from tests.conftest import with_config
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "int_with_nulls": pd.Series([1, None, 3], dtype=object),
+            "float": [1.5, np.nan, 3.0],
+            "str": ["a", None, "c"],
+            "ts": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "ts_tz": pd.to_datetime(["2024-01-01", None, None]).tz_localize("UTC"),
+            "decimal": [Decimal("1.5"), None, Decimal("2.5")],
+            "date": [date(2024, 1, 1), None, None],
+            "bool": [True, False, None],
+            "int_as_object": pd.Series([1, 2, 3], dtype=object),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [PickleQueryCacheCodec(), ArrowQueryCacheCodec(), ParquetQueryCacheCodec()],
+)
+def test_round_trip(codec: QueryCacheCodec, df: pd.DataFrame) -> None:
+    """
+    Test that the dataframe and its dtypes survive a round trip through the codecs.
+    """
+    value = codec.encode({"df": df, "query": "SELECT 1"})
+
+    assert value["query"] == "SELECT 1"
+    loaded = get_df_loader(value)()
+    pd.testing.assert_frame_equal(loaded, df)
+
+
+@pytest.mark.parametrize("codec", [ArrowQueryCacheCodec(), ParquetQueryCacheCodec()])
+def test_binary_codec_metadata(codec: QueryCacheCodec, df: pd.DataFrame) -> None:
+    """
+    Test that binary codecs replace the dataframe and keep its shape as metadata.
+    """
+    value = codec.encode({"df": df, "query": "SELECT 1"})
+
+    assert "df" not in value
+    assert isinstance(value["df_payload"], bytes)
+    assert value["rowcount"] == 3
+    assert value["colnames"] == list(df.columns)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({0: [1, 2]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"mixed": ["a", 1]}),
+    ],
+)
+def test_binary_codec_fallback(df: pd.DataFrame) -> None:
+    """
+    Test that dataframes that can't be round-tripped through Arrow are kept as-is.
+    """
+    value = ArrowQueryCacheCodec().encode({"df": df})
+
+    assert value["df"] is df
+    assert get_df_loader(value)() is df
+
+
+def test_get_df_loader_missing_df() -> None:
+    """
+    Test that incomplete cache values are rejected when loading them.
+    """
+    with pytest.raises(KeyError):
+        get_df_loader({"query": "SELECT 1"})
+    with pytest.raises(KeyError):
+        get_df_loader({"query": "SELECT 1", "df_codec": "arrow"})
+
+
+@with_config({"QUERY_CACHE_CODECS": {"data": ArrowQueryCacheCodec()}})
+def test_query_cache_manager_lazy_df(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that the dataframe of a cache hit is only deserialized when accessed.
+    """
+    cache = mocker.MagicMock()
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    decode_df = mocker.spy(ArrowQueryCacheCodec, "decode_df")
+
+    query_result = mocker.MagicMock(df=df, status="success")
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=query_result,
+        region=CacheRegion.DATA,
+    )
+    stored = cache.set.call_args[0][1]
+    assert stored["df_codec"] == "arrow"
+
+    cache.get.return_value = stored
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.rowcount == 3
+    assert query_cache.colnames == list(df.columns)
+    decode_df.assert_not_called()
+
+    pd.testing.assert_frame_equal(query_cache.df, df)
+    decode_df.assert_called_once()
+
+
+def test_query_cache_manager_pickled_value(mocker: MockerFixture) -> None:
+    """
+    Test that values stored before codecs were introduced can still be read.
+    """
+    df = pd.DataFrame({"a": [1, 2]})
+    cache = mocker.MagicMock()
+    cache.get.return_value = {"df": df, "query": "SELECT 1", "dttm": "2024-01-01"}
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.df is df
+    assert query_cache.rowcount == 2
+    assert query_cache.cache_dttm == "2024-01-01"
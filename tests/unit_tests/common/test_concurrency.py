@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from typing import Any
+
+import pytest
+from flask import current_app, g, request
+from pytest_mock import MockerFixture
+
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.utils.concurrency import run_concurrently
+
+
+def test_run_concurrently(app: Any) -> None:
+    """
+    Test that functions run at the same time, within the request context.
+    """
+    barrier = threading.Barrier(3, timeout=5)
+
+    def func(i: int) -> tuple[int, Any, Any]:
+        barrier.wait()
+        return i, g.user, request.args.get("a")
+
+    with app.test_request_context("/?a=b"):
+        g.user = "admin"
+        results = run_concurrently([lambda i=i: func(i) for i in range(3)], 3)
+
+    assert results == [(0, "admin", "b"), (1, "admin", "b"), (2, "admin", "b")]
+
+
+def test_run_concurrently_errors(app_context: None) -> None:
+    """
+    Test that all functions run when some fail, and the first error is raised.
+    """
+    done: list[int] = []
+
+    def func(i: int) -> int:
+        if i in {1, 2}:
+            raise ValueError(i)
+        done.append(i)
+        return i
+
+    with pytest.raises(ValueError, match="1"):
+        run_concurrently([lambda i=i: func(i) for i in range(4)], 2)
+
+    assert sorted(done) == [0, 3]
+
+
+def test_run_concurrently_sequential() -> None:
+    """
+    Test that functions run in the current thread without concurrency.
+    """
+    thread = threading.current_thread()
+
+    assert run_concurrently(
+        [lambda: threading.current_thread(), lambda: threading.current_thread()], 1
+    ) == [thread, thread]
+
+
+@pytest.mark.parametrize(
+    "concurrency,queries,engine_params,expected",
+    [
+        (1, 3, {}, 1),
+        (4, 1, {}, 1),
+        (4, 3, {}, 4),
+        (4, 3, {"pool_size": 1}, 4),
+        (4, 3, {"pool_size": 1, "max_overflow": 0}, 1),
+        (4, 3, {"pool_size": 2, "max_overflow": -1}, 2),
+    ],
+)
+def test_get_query_concurrency(
+    app_context: None,
+    mocker: MockerFixture,
+    concurrency: int,
+    queries: int,
+    engine_params: dict[str, Any],
+    expected: int,
+) -> None:
+    """
+    Test that query concurrency is bounded by the connection pool of the database.
+    """
+    query_context = mocker.MagicMock()
+    query_context.queries = [mocker.MagicMock()] * queries
+    query_context.datasource.database.get_extra.return_value = {
+        "engine_params": engine_params
+    }
+    processor = QueryContextProcessor(query_context)
+
+    mocker.patch.dict(
+        current_app.config, {"CHART_DATA_QUERY_CONCURRENCY": concurrency}
+    )
+
+    assert processor.get_query_concurrency() == expected
@@ -0,0 +1,298 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
+from superset.common.utils.incremental_cache import (
+    get_time_label,
+    plan_refresh,
+    splice,
+    with_time_range,
+)
+from superset.models.helpers import QueryResult
+from superset.utils.core import DTTM_ALIAS
+
+X_AXIS = {
+    "label": "ds",
+    "sqlExpression": "ds",
+    "columnType": "BASE_AXIS",
+    "timeGrain": "P1D",
+}
+
+
+def make_query_object(**kwargs: Any) -> QueryObject:
+    return QueryObject(
+        **{
+            "datasource": None,
+            "columns": [X_AXIS, "country"],
+            "metrics": ["count"],
+            "filters": [
+                {"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last week"},
+            ],
+            "from_dttm": datetime(2024, 1, 1),
+            "to_dttm": datetime(2024, 1, 8),
+            **kwargs,
+        }
+    )
+
+
+def make_df(days: list[int], values: list[int]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ds": [datetime(2024, 1, day) for day in days],
+            "count": values,
+        }
+    )
+
+
+@pytest.fixture
+def datasource(mocker: MockerFixture) -> Any:
+    datasource = mocker.MagicMock()
+    datasource.incremental_cache = True
+    datasource.main_dttm_col = "ds"
+    datasource.offset = 0
+    return datasource
+
+
+@pytest.mark.parametrize(
+    "kwargs,changes,expected",
+    [
+        ({}, {}, "ds"),
+        ({}, {"incremental_cache": False}, None),
+        ({}, {"main_dttm_col": "other"}, None),
+        ({}, {"offset": 1}, None),
+        ({"time_offsets": ["1 week ago"]}, {}, None),
+        ({"series_limit": 10}, {}, None),
+        ({"row_offset": 10}, {}, None),
+        ({"filters": [{"col": "other", "op": "TEMPORAL_RANGE", "val": "x"}]}, {}, None),
+        ({"columns": [{**X_AXIS, "timeGrain": "P1W/1970-01-03T00:00:00Z"}]}, {}, None),
+        ({"columns": [{**X_AXIS, "timeGrain": "1969-12-29T00:00:00Z/P1W"}]}, {}, "ds"),
+        (
+            {"columns": ["country"], "is_timeseries": True, "granularity": "ds"},
+            {},
+            DTTM_ALIAS,
+        ),
+        ({"columns": ["country"]}, {}, None),
+    ],
+)
+def test_get_time_label(
+    app_context: None,
+    datasource: Any,
+    kwargs: dict[str, Any],
+    changes: dict[str, Any],
+    expected: str | None,
+) -> None:
+    """
+    Test which query objects can be refreshed incrementally.
+    """
+    for key, value in changes.items():
+        setattr(datasource, key, value)
+
+    assert get_time_label(make_query_object(**kwargs), datasource) == expected
+
+
+def test_plan_refresh() -> None:
+    """
+    Test that time buckets are reused up to the last one, and from the start of the
+    new time range, re-fetching the bucket straddling it.
+    """
+    df = make_df([1, 2, 3, 4], [1, 2, 3, 4])
+
+    refresh = plan_refresh(
+        df,
+        "ds",
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 5),
+        datetime(2024, 1, 2, 12),
+        datetime(2024, 1, 6),
+    )
+
+    assert refresh is not None
+    assert refresh.reused["count"].tolist() == [3]
+    assert refresh.windows == [
+        (datetime(2024, 1, 2, 12), datetime(2024, 1, 3)),
+        (datetime(2024, 1, 4), datetime(2024, 1, 6)),
+    ]
+
+    refresh = plan_refresh(
+        df,
+        "ds",
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 5),
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 6),
+    )
+
+    assert refresh is not None
+    assert refresh.reused["count"].tolist() == [1, 2, 3]
+    assert refresh.windows == [(datetime(2024, 1, 4), datetime(2024, 1, 6))]
+
+
+@pytest.mark.parametrize(
+    "from_dttm,to_dttm",
+    [
+        # the time range was extended to the past
+        (datetime(2023, 12, 31), datetime(2024, 1, 6)),
+        # the time range was reduced
+        (datetime(2024, 1, 1), datetime(2024, 1, 4)),
+        # nothing can be reused
+        (datetime(2024, 1, 4), datetime(2024, 1, 10)),
+    ],
+)
+def test_plan_refresh_full(from_dttm: datetime, to_dttm: datetime) -> None:
+    """
+    Test that results are queried again as a whole when no refresh is possible.
+    """
+    assert (
+        plan_refresh(
+            make_df([1, 2, 3, 4], [1, 2, 3, 4]),
+            "ds",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 5),
+            from_dttm,
+            to_dttm,
+        )
+        is None
+    )
+
+
+def test_with_time_range() -> None:
+    """
+    Test that the time filters of the query object are restricted to a time range.
+    """
+    query_obj = make_query_object(
+        post_processing=[{"operation": "sort", "options": {"by": "ds"}}]
+    )
+
+    refresh_query_obj = with_time_range(
+        query_obj, datetime(2024, 1, 4), datetime(2024, 1, 8)
+    )
+
+    assert refresh_query_obj.filter == [
+        {
+            "col": "ds",
+            "op": "TEMPORAL_RANGE",
+            "val": "2024-01-04 00:00:00 : 2024-01-08 00:00:00",
+        }
+    ]
+    assert refresh_query_obj.from_dttm == datetime(2024, 1, 4)
+    assert refresh_query_obj.to_dttm == datetime(2024, 1, 8)
+    assert refresh_query_obj.post_processing == []
+    assert query_obj.filter[0]["val"] == "Last week"
+    assert query_obj.from_dttm == datetime(2024, 1, 1)
+
+
+def test_splice() -> None:
+    """
+    Test that rows are spliced in the order of the time buckets, or of the query.
+    """
+    reused = make_df([2, 3], [2, 3])
+    dfs = [make_df([1], [5]), make_df([4, 5], [4, 1])]
+
+    assert splice(reused, dfs, "ds", [])["count"].tolist() == [5, 2, 3, 4, 1]
+    assert splice(reused, dfs, "ds", [("count", False)])["count"].tolist() == [
+        5,
+        4,
+        3,
+        2,
+        1,
+    ]
+    assert splice(reused, dfs, "ds", [("missing", False)]) is None
+
+
+def test_load_query_result_incremental(
+    app_context: None,
+    mocker: MockerFixture,
+    datasource: Any,
+) -> None:
+    """
+    Test that refreshing a time series query only queries the last time buckets.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    data_cache = mocker.MagicMock()
+    data_cache.cache = SimpleCache()
+    data_cache.get.side_effect = data_cache.cache.get
+    data_cache.set.side_effect = data_cache.cache.set
+    mocker.patch(
+        "superset.common.query_context_processor.cache_manager",
+        new=mocker.MagicMock(data_cache=data_cache),
+    )
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+
+    query_context = mocker.MagicMock()
+    query_context.datasource = datasource
+    datasource.column_names = ["ds", "count"]
+    processor = QueryContextProcessor(query_context)
+    mocker.patch.object(processor, "query_cache_key", return_value="key")
+    mocker.patch.object(processor, "get_annotation_data", return_value={})
+    mocker.patch.object(processor, "get_cache_timeout", return_value=0)
+
+    table = {day: day * 10 for day in range(1, 10)}
+
+    def get_query_result(query_obj: QueryObject) -> QueryResult:
+        days = [
+            day
+            for day in table
+            if query_obj.from_dttm <= datetime(2024, 1, day) < query_obj.to_dttm
+        ]
+        return QueryResult(
+            df=make_df(days, [table[day] for day in days]),
+            query=f"SELECT {query_obj.from_dttm}",
+            duration=timedelta(seconds=1),
+        )
+
+    get_query_result = mocker.patch.object(
+        processor, "get_query_result", side_effect=get_query_result
+    )
+
+    query_obj = make_query_object(
+        columns=[X_AXIS],
+        post_processing=[{"operation": "sort", "options": {"by": "ds"}}],
+    )
+    cache = processor._load_query_result(query_obj, QueryCacheManager(), "k1", True)
+    assert cache.df["count"].tolist() == [10, 20, 30, 40, 50, 60, 70]
+
+    # the time range moved by 2 days, and the last day was partial
+    table[7] = 75
+    query_obj = make_query_object(
+        columns=[X_AXIS],
+        post_processing=[{"operation": "sort", "options": {"by": "ds"}}],
+        from_dttm=datetime(2024, 1, 3),
+        to_dttm=datetime(2024, 1, 10),
+    )
+    cache = processor._load_query_result(query_obj, QueryCacheManager(), "k2", True)
+    assert cache.df["count"].tolist() == [30, 40, 50, 60, 75, 80, 90]
+
+    assert [
+        (call[0][0].from_dttm, call[0][0].to_dttm)
+        for call in get_query_result.call_args_list
+    ] == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 8)),
+        (datetime(2024, 1, 7), datetime(2024, 1, 10)),
+    ]
+    stats_logger.gauge.assert_any_call("incremental_cache.rows_reused", 4)
+    stats_logger.gauge.assert_any_call("incremental_cache.rows_refetched", 3)
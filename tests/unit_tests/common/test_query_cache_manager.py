@@ -0,0 +1,196 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pandas as pd
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.utils.cache import set_and_log_cache
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture) -> Any:
+    cache = mocker.MagicMock()
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    return cache
+
+
+@pytest.mark.parametrize(
+    "timeout,stale_timeout,expected_timeout,stale_after",
+    [
+        (60, None, 60, None),
+        (60, 0, 60, None),
+        (60, 300, 360, "2024-01-01T00:01:00"),
+        (0, 300, 0, None),
+    ],
+)
+@freeze_time("2024-01-01")
+def test_set_and_log_cache_stale_timeout(
+    app_context: None,
+    cache: Any,
+    timeout: int,
+    stale_timeout: int | None,
+    expected_timeout: int,
+    stale_after: str | None,
+) -> None:
+    """
+    Test that values are kept past their timeout, and marked, with a stale timeout.
+    """
+    set_and_log_cache(cache, "key", {"a": 1}, timeout, stale_timeout=stale_timeout)
+
+    key, value = cache.set.call_args[0]
+    assert key == "key"
+    assert cache.set.call_args[1] == {"timeout": expected_timeout}
+    assert value.get("stale_after") == stale_after
+
+
+@pytest.mark.parametrize(
+    "now,is_stale",
+    [("2024-01-01T00:00:59", False), ("2024-01-01T00:01:00", True)],
+)
+def test_query_cache_manager_get_stale(
+    app_context: None,
+    cache: Any,
+    now: str,
+    is_stale: bool,
+) -> None:
+    """
+    Test that values read past their timeout are marked as stale.
+    """
+    cache.get.return_value = {
+        "df": pd.DataFrame({"a": [1]}),
+        "query": "SELECT 1",
+        "dttm": "2024-01-01T00:00:00",
+        "stale_after": "2024-01-01T00:01:00",
+    }
+
+    with freeze_time(now):
+        query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.is_stale == is_stale
+
+
+def test_refresh_stale_cache(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that a refresh of the query context is only queued once at a time.
+    """
+    query_context = mocker.MagicMock()
+    query_context.form_data = {"slice_id": 1}
+    query_context.cache_values = {"datasource": {"id": 1, "type": "table"}}
+    data_cache = mocker.patch(
+        "superset.common.query_context_processor.cache_manager",
+        new=mocker.MagicMock(),
+    ).data_cache
+    data_cache.add.side_effect = [True, False]
+    mocker.patch("superset.common.query_context_processor.get_user_id", return_value=1)
+    security_manager = mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        new=mocker.MagicMock(),
+    )
+    security_manager.get_current_guest_user_if_guest.return_value = None
+    refresh_chart_data_cache = mocker.patch(
+        "superset.tasks.async_queries.refresh_chart_data_cache"
+    )
+
+    processor = QueryContextProcessor(query_context)
+    processor.refresh_stale_cache()
+    processor.refresh_stale_cache()
+
+    refresh_key = data_cache.add.call_args[0][0]
+    refresh_chart_data_cache.delay.assert_called_once_with(
+        {"user_id": 1},
+        {
+            "form_data": {"slice_id": 1},
+            "datasource": {"id": 1, "type": "table"},
+            "force": True,
+        },
+        refresh_key,
+    )
+
+
+def test_load_query_result_raw_cache(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that query objects only differing by their post processing share the
+    result of their query, cached before post processing.
+    """
+    from datetime import timedelta
+
+    from flask import current_app
+    from flask_caching.backends import SimpleCache
+
+    from superset.common.query_object import QueryObject
+    from superset.models.helpers import QueryResult
+
+    mocker.patch.dict(current_app.config, {"CHART_DATA_CACHE_RAW_RESULTS": True})
+    data_cache = mocker.MagicMock()
+    data_cache.cache = SimpleCache()
+    data_cache.get.side_effect = data_cache.cache.get
+    data_cache.set.side_effect = data_cache.cache.set
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: data_cache},
+    )
+    query_context = mocker.MagicMock()
+    query_context.datasource.column_names = ["a"]
+    processor = QueryContextProcessor(query_context)
+    mocker.patch.object(
+        processor,
+        "query_cache_key",
+        side_effect=lambda query_obj: str(query_obj.post_processing),
+    )
+    mocker.patch.object(processor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(processor, "get_stale_cache_timeout", return_value=0)
+    mocker.patch.object(processor, "get_annotation_data", return_value={})
+    get_query_result = mocker.patch.object(
+        processor,
+        "get_query_result",
+        side_effect=lambda query_obj: QueryResult(
+            df=pd.DataFrame({"a": [3, 1, 2]}),
+            query="SELECT a FROM t",
+            duration=timedelta(seconds=1),
+        ),
+    )
+
+    dfs = []
+    for ascending in [True, False]:
+        query_obj = QueryObject(
+            datasource=mocker.MagicMock(),
+            columns=["a"],
+            metrics=[],
+            post_processing=[
+                {"operation": "sort", "options": {"by": "a", "ascending": ascending}}
+            ],
+        )
+        cache = processor._load_query_result(
+            query_obj, QueryCacheManager(), str(ascending), False
+        )
+        assert cache.is_loaded
+        assert cache.query == "SELECT a FROM t"
+        dfs.append(cache.df["a"].tolist())
+
+    assert dfs == [[1, 2, 3], [3, 2, 1]]
+    get_query_result.assert_called_once()
+    assert get_query_result.call_args[0][0].post_processing == []
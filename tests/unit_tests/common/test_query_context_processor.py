@@ -40,6 +40,7 @@ def mock_query_context():
 def processor(mock_query_context):
     from superset.models.helpers import ExploreMixin
 
+    mock_query_context.stream_data = False
     mock_query_context.datasource.data = MagicMock()
     mock_query_context.datasource.data.get.return_value = {
         "col1": "Column 1",
@@ -928,6 +929,7 @@ def test_get_df_payload_validates_before_cache_key_generation():
                 mock_cache.query = "SELECT * FROM table"
                 mock_cache.error_message = None
                 mock_cache.status = "success"
+                mock_cache.is_stale = False
                 mock_cache_manager.get.return_value = mock_cache
 
                 # Call get_df_payload
@@ -1301,6 +1303,7 @@ def test_force_cached_normalizes_totals_query_row_limit():
                 cache.rejected_filter_columns = []
                 cache.annotation_data = {}
                 cache.is_cached = True
+                cache.is_stale = False
                 cache.sql_rowcount = len(df)
                 cache.cache_dttm = "2024-01-01T00:00:00"
                 return cache
@@ -1311,3 +1314,55 @@ def test_force_cached_normalizes_totals_query_row_limit():
 
     assert captured_limits == [None], "Totals query should be normalized before caching"
     mock_query_context.get_query_result.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "cache_type,timeout,coalesced",
+    [
+        ("SimpleCache", 600, True),
+        ("NullCache", 600, False),
+        ("SimpleCache", -1, False),
+    ],
+)
+def test_get_df_payload_coalescing(
+    app_context: None,
+    cache_type: str,
+    timeout: int,
+    coalesced: bool,
+) -> None:
+    """
+    Test that queries are only coalesced when their results are cached.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.extensions import cache_manager
+
+    data_cache = Cache()
+    data_cache.init_app(current_app, {"CACHE_TYPE": cache_type})
+
+    mock_query_context = MagicMock()
+    mock_query_context.force = False
+    processor = QueryContextProcessor(mock_query_context)
+    query_obj = MagicMock(metrics=[])
+    cache = MagicMock(is_loaded=False, is_stale=False, df=pd.DataFrame())
+
+    with (
+        patch.dict(current_app.config, {"CHART_DATA_COALESCING_TIMEOUT": 30}),
+        patch.object(cache_manager, "_data_cache", data_cache),
+        patch.object(processor, "query_cache_key", return_value="key"),
+        patch.object(processor, "get_cache_timeout", return_value=timeout),
+        patch.object(processor, "_load_query_result", return_value=cache) as load,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as query_cache_manager,
+        patch(
+            "superset.common.query_context_processor.single_flight",
+            return_value=cache,
+        ) as single_flight,
+    ):
+        query_cache_manager.get.return_value = cache
+        processor.get_df_payload(query_obj)
+
+    assert single_flight.called == coalesced
+    assert load.called != coalesced
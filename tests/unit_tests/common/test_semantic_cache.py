@@ -0,0 +1,253 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.common.utils.semantic_cache import get_derived_df, set_df
+
+X_AXIS = {
+    "label": "ds",
+    "sqlExpression": "ds",
+    "columnType": "BASE_AXIS",
+    "timeGrain": "P1D",
+}
+SUM_METRIC = {
+    "expressionType": "SIMPLE",
+    "column": {"column_name": "num"},
+    "aggregate": "SUM",
+    "label": "sum__num",
+}
+
+
+def make_query(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "columns": [X_AXIS, "country", "gender"],
+        "metrics": [SUM_METRIC, "count"],
+        "filter": [{"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last week"}],
+        "extras": {"where": ""},
+        "from_dttm": datetime(2024, 1, 1),
+        "to_dttm": datetime(2024, 1, 8),
+        "is_timeseries": False,
+        "row_limit": 1000,
+        **kwargs,
+    }
+
+
+def labels(query: dict[str, Any]) -> list[str]:
+    names = [
+        column if isinstance(column, str) else column["label"]
+        for column in query["columns"]
+    ]
+    return names + [
+        metric if isinstance(metric, str) else metric["label"]
+        for metric in query["metrics"]
+    ]
+
+
+WIDE_DF = pd.DataFrame(
+    {
+        "ds": pd.to_datetime(
+            ["2024-01-01", "2024-01-01", "2024-01-02", "2024-01-02", "2024-01-09"]
+        ),
+        "country": ["us", "fr", "us", "fr", "fr"],
+        "gender": ["boy", "girl", "girl", "boy", None],
+        "sum__num": [1.0, 2.0, 3.0, None, 5.0],
+        "count": [10, 20, 30, 40, 50],
+    }
+)
+
+
+@pytest.fixture
+def datasource(mocker: MockerFixture) -> Any:
+    datasource = mocker.MagicMock()
+    datasource.type = "table"
+    datasource.uid = "1__table"
+    datasource.changed_on = datetime(2024, 1, 1)
+    datasource.sql = None
+    datasource.columns = []
+    count = mocker.MagicMock(metric_name="count", expression="COUNT(*)")
+    distinct = mocker.MagicMock(
+        metric_name="count_distinct", expression="COUNT(DISTINCT name)"
+    )
+    datasource.metrics = [count, distinct]
+    datasource.database.impersonate_user = False
+    datasource.database.get_extra.return_value = {}
+    return datasource
+
+
+@pytest.fixture
+def data_cache(app_context: None, mocker: MockerFixture) -> Any:
+    data_cache = mocker.MagicMock()
+    data_cache.cache = SimpleCache()
+    data_cache.get.side_effect = data_cache.cache.get
+    data_cache.set.side_effect = data_cache.cache.set
+    cache_manager = mocker.patch(
+        "superset.common.utils.semantic_cache.cache_manager", new=mocker.MagicMock()
+    )
+    cache_manager.data_cache = data_cache
+    security_manager = mocker.patch(
+        "superset.common.utils.semantic_cache.security_manager",
+        new=mocker.MagicMock(),
+    )
+    security_manager.get_rls_cache_key.return_value = []
+    return data_cache
+
+
+def derive(datasource: Any, query: dict[str, Any]) -> pd.DataFrame | None:
+    set_df(datasource, make_query(), WIDE_DF)
+    return get_derived_df(datasource, query, labels(query))
+
+
+def test_derive_same_query(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that the result of a query is reused for the same query.
+    """
+    query = make_query()
+    pd.testing.assert_frame_equal(derive(datasource, query), WIDE_DF)
+
+
+def test_derive_filter(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that filters on group by columns are applied to the cached result.
+    """
+    query = make_query(
+        filter=[
+            *make_query()["filter"],
+            {"col": "country", "op": "==", "val": "fr"},
+            {"col": "gender", "op": "NOT IN", "val": ["boy"]},
+        ]
+    )
+
+    df = derive(datasource, query)
+
+    # NULL values never match a NOT IN filter in SQL
+    assert df["count"].tolist() == [20]
+
+
+def test_derive_drop_column(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that additive metrics are aggregated again when dropping a column.
+    """
+    query = make_query(
+        columns=[X_AXIS, "country"],
+        orderby=[("country", True), ("ds", True)],
+    )
+
+    df = derive(datasource, query)
+
+    assert df.columns.tolist() == ["ds", "country", "sum__num", "count"]
+    assert df["country"].tolist() == ["fr", "fr", "fr", "us", "us"]
+    assert df["count"].tolist() == [20, 40, 50, 10, 30]
+    assert df["sum__num"].isna().tolist() == [False, True, False, False, False]
+
+
+def test_derive_coarser_time_grain(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that time buckets are merged for a coarser time grain.
+    """
+    query = make_query(
+        columns=[{**X_AXIS, "timeGrain": "P1M"}],
+        metrics=["count"],
+    )
+
+    df = derive(datasource, query)
+
+    assert df.to_dict(orient="list") == {
+        "ds": [pd.Timestamp("2024-01-01")],
+        "count": [150],
+    }
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        # a metric that isn't cached
+        {"metrics": ["max__num"]},
+        # a column that isn't cached
+        {"columns": [X_AXIS, "name"]},
+        # a finer time grain
+        {"columns": [{**X_AXIS, "timeGrain": "PT1H"}]},
+        # a filter on a column that isn't grouped by
+        {
+            "filter": [
+                *make_query()["filter"],
+                {"col": "name", "op": "==", "val": "a"},
+            ]
+        },
+        # a filter depending on the collation of the database
+        {
+            "filter": [
+                *make_query()["filter"],
+                {"col": "country", "op": "LIKE", "val": "f%"},
+            ]
+        },
+        # a different time range
+        {"from_dttm": datetime(2023, 1, 1)},
+        # a different where clause
+        {"extras": {"where": "num > 1"}},
+        # a HAVING clause
+        {"extras": {"where": "", "having": "SUM(num) > 1"}},
+        # a Jinja template
+        {"extras": {"where": "{{ filter_values('country') }}"}},
+    ],
+)
+def test_derive_not_possible(
+    datasource: Any,
+    data_cache: Any,
+    changes: dict[str, Any],
+) -> None:
+    """
+    Test that queries that can't be derived from the cached result are run.
+    """
+    query = make_query(**changes)
+    assert derive(datasource, query) is None
+
+
+def test_derive_not_additive(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that metrics that can't be aggregated again are only filtered.
+    """
+    wide_query = make_query(metrics=["count_distinct"])
+    set_df(
+        datasource,
+        wide_query,
+        WIDE_DF[["ds", "country", "gender"]].assign(count_distinct=1),
+    )
+
+    query = make_query(
+        metrics=["count_distinct"],
+        filter=[*make_query()["filter"], {"col": "country", "op": "==", "val": "us"}],
+    )
+    assert len(get_derived_df(datasource, query, labels(query))) == 2
+
+    query = make_query(metrics=["count_distinct"], columns=[X_AXIS, "country"])
+    assert get_derived_df(datasource, query, labels(query)) is None
+
+
+def test_set_df_truncated(datasource: Any, data_cache: Any) -> None:
+    """
+    Test that truncated results are not cached, since they are incomplete.
+    """
+    set_df(datasource, make_query(row_limit=5), WIDE_DF)
+
+    query = make_query(columns=[X_AXIS, "country"], row_limit=5)
+    assert get_derived_df(datasource, query, labels(query)) is None
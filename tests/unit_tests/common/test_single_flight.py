@@ -0,0 +1,154 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from collections import Counter
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.utils import single_flight as single_flight_module
+from superset.common.utils.single_flight import LOCK_NAMESPACE, single_flight
+from superset.distributed_lock import KeyValueDistributedLock
+
+
+@pytest.fixture
+def stats(mocker: MockerFixture) -> Counter[str]:
+    counter: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def incr(key: str) -> None:
+        with lock:
+            counter[key] += 1
+
+    mocker.patch.object(single_flight_module, "_incr", side_effect=incr)
+    return counter
+
+
+def test_single_flight_coalesces_concurrent_callers(stats: Counter[str]) -> None:
+    """
+    Test that concurrent callers of the same key only compute the value once.
+    """
+    cache: dict[str, Any] = {}
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute() -> str:
+        started.set()
+        release.wait(5)
+        cache["key"] = "value"
+        return "value"
+
+    results: list[str] = []
+
+    def call() -> None:
+        results.append(single_flight("key", lambda: cache.get("key"), compute, 5))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    while stats["waiting"] < 5:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert results == ["value"] * 6
+    assert stats == {"leader": 1, "waiting": 5, "coalesced": 5}
+    assert not single_flight_module._flights
+
+
+def test_single_flight_not_cached(stats: Counter[str]) -> None:
+    """
+    Test that callers compute the value when the leader didn't cache it.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    compute = MagicMock(return_value="value")
+
+    def compute_leader() -> str:
+        started.set()
+        release.wait(5)
+        raise ValueError("failed")
+
+    errors: list[Exception] = []
+
+    def call_leader() -> None:
+        try:
+            single_flight("key", lambda: None, compute_leader, 5)
+        except ValueError as ex:
+            errors.append(ex)
+
+    leader = threading.Thread(target=call_leader)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(
+        target=lambda: single_flight("key", lambda: None, compute, 5)
+    )
+    follower.start()
+    while stats["waiting"] < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert len(errors) == 1
+    compute.assert_called_once()
+    assert stats == {"leader": 1, "waiting": 1, "fallback": 1}
+
+
+def test_single_flight_distributed_leader(stats: Counter[str]) -> None:
+    """
+    Test that the process acquiring the lock computes the value, and releases it.
+    """
+    assert single_flight("key", lambda: None, lambda: "value", 5, True) == "value"
+    assert stats == {"leader": 1}
+
+    # the lock was released
+    with KeyValueDistributedLock(LOCK_NAMESPACE, key="key"):
+        pass
+
+
+def test_single_flight_distributed_follower(stats: Counter[str]) -> None:
+    """
+    Test that processes not acquiring the lock poll the cache for the value.
+    """
+    load = MagicMock(side_effect=[None, None, "value"])
+    compute = MagicMock()
+
+    with KeyValueDistributedLock(LOCK_NAMESPACE, key="key"):
+        assert single_flight("key", load, compute, 5, True) == "value"
+
+    compute.assert_not_called()
+    assert stats == {"waiting": 1, "coalesced": 1}
+
+
+def test_single_flight_distributed_timeout(stats: Counter[str]) -> None:
+    """
+    Test that processes waiting for the lock compute the value after the timeout.
+    """
+    with KeyValueDistributedLock(LOCK_NAMESPACE, key="key"):
+        assert single_flight("key", lambda: None, lambda: "value", 0.2, True) == (
+            "value"
+        )
+
+    assert stats == {"waiting": 1, "fallback": 1}
@@ -203,3 +203,35 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_js_max_int_vectorized() -> None:
+    """
+    Test that big integers are converted in integer and object columns, and that
+    other large numbers are left as-is.
+    """
+    import pandas as pd
+
+    from superset.dataframe import df_to_records
+
+    big = 1239162456494753670
+    df = pd.DataFrame(
+        {
+            "int": [1, big, -big],
+            "nullable": pd.Series([big, None, 1], dtype="Int64"),
+            "object": pd.Series([big, "9007199254740993", 2**70], dtype=object),
+            "float": [1e20, 1.0, None],
+        }
+    )
+
+    records = df_to_records(df)
+
+    assert [record["int"] for record in records] == [1, str(big), str(-big)]
+    assert records[0]["nullable"] == str(big)
+    assert records[2]["nullable"] == 1
+    assert [record["object"] for record in records] == [
+        str(big),
+        "9007199254740993",
+        str(2**70),
+    ]
+    assert records[0]["float"] == 1e20
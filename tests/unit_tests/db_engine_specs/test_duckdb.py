@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
@@ -163,3 +164,41 @@ def test_column_type_recognition() -> None:
     col_spec = DuckDBEngineSpec.get_column_spec("TINYINT")
     # TINYINT matches the pattern "^int" so it should be recognized
     assert col_spec is None, "TINYINT doesn't match any patterns"
+
+
+def test_fetch_data_as_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as an Arrow table, and that the cursor description
+    cleared by duckdb-engine is restored.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    description = [("a", "INTEGER", None, None, None, None, None)]
+    cursor = mocker.MagicMock()
+    cursor.description = description
+
+    batches = [pa.record_batch({"a": [1, 2]}), pa.record_batch({"a": [3, 4]})]
+    consumed = []
+
+    def read_batches() -> Iterator[pa.RecordBatch]:
+        for batch in batches:
+            consumed.append(batch)
+            yield batch
+
+    def fetch_record_batch(rows_per_batch: int) -> pa.RecordBatchReader:
+        cursor.description = None
+        return pa.RecordBatchReader.from_batches(batches[0].schema, read_batches())
+
+    cursor.fetch_record_batch.side_effect = fetch_record_batch
+
+    assert DuckDBEngineSpec.supports_arrow_fetch
+    table = DuckDBEngineSpec.fetch_data_as_arrow(cursor, 3)
+    assert table.to_pydict() == {"a": [1, 2, 3]}
+    assert cursor.description == description
+    assert DuckDBEngineSpec.fetch_data_as_arrow(cursor, 2).to_pydict() == {
+        "a": [1, 2]
+    }
+    # the batches after the limit aren't read
+    assert len(consumed) == 3
@@ -1560,7 +1560,7 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise UndefinedError
     with patch.object(
@@ -1593,7 +1593,7 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise SecurityError
     with patch.object(
@@ -1624,7 +1624,7 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise MemoryError (server error)
     with patch.object(
@@ -1639,3 +1639,43 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
         assert "Internal Jinja2 template error" in str(exception)
         assert "MemoryError" in str(exception)
         assert "Out of memory" in str(exception)
+
+
+def test_template_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that processors share their environment, and the templates compiled by it.
+    """
+    from jinja2 import Environment
+
+    from superset.jinja_context import (
+        JinjaTemplateProcessor,
+        PrestoTemplateProcessor,
+    )
+
+    database = mocker.MagicMock()
+    database.get_dialect.return_value = mysql.dialect()
+    processor = JinjaTemplateProcessor(database=database)
+    processor.env.clear()
+    compile_ = mocker.spy(Environment, "compile")
+
+    sql = "SELECT * FROM t WHERE a IN {{ values|where_in }}"
+    assert (
+        processor.process_template(sql, values=[1, 2])
+        == "SELECT * FROM t WHERE a IN (1, 2)"
+    )
+    other_processor = JinjaTemplateProcessor(database=database)
+    assert other_processor.env is processor.env
+    assert (
+        other_processor.process_template(sql, values=["a"])
+        == "SELECT * FROM t WHERE a IN ('a')"
+    )
+    assert compile_.call_count == 1
+
+    # processors of other classes or dialects have other environments
+    assert PrestoTemplateProcessor(database=database).env is not processor.env
+    database.get_dialect.return_value = dialect()
+    assert JinjaTemplateProcessor(database=database).env is not processor.env
+
+    # SQL without Jinja syntax isn't compiled
+    assert processor.process_template("SELECT '{ 1 }'\n") == "SELECT '{ 1 }'"
+    assert compile_.call_count == 1
@@ -17,6 +17,7 @@
 
 # pylint: disable=import-outside-toplevel
 from datetime import datetime
+from typing import Any
 
 import pytest
 from flask import current_app
@@ -31,6 +32,7 @@ from sqlalchemy import (
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import Select
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
@@ -39,6 +41,7 @@ from superset.exceptions import OAuth2Error, OAuth2RedirectError
 from superset.models.core import Database
 from superset.sql.parse import LimitMethod, Table
 from superset.utils import json
+from superset.utils.core import QuerySource
 from tests.unit_tests.conftest import with_feature_flags
 
 # sample config for OAuth2 tests
@@ -464,6 +467,91 @@ def test_get_sqla_engine_user_impersonation(mocker: MockerFixture) -> None:
     )
 
 
+def test_get_sqla_engine_pooled(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that `_get_sqla_engine` reuses pooled engines, when configured.
+    """
+    from superset.models.core import Database, invalidate_engines
+    from superset.utils.core import QuerySource
+    from superset.utils.engine_registry import engine_registry
+
+    mocker.patch.dict(
+        current_app.config,
+        {"DATABASE_ENGINE_POOL": {"pool_size": 2, "pool_pre_ping": True}},
+    )
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    create_engine = mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+    engine_registry.clear()
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="trino://")
+    engine = database._get_sqla_engine()
+    assert database._get_sqla_engine() is engine
+    create_engine.assert_called_once_with(
+        make_url("trino:///"),
+        connect_args={"source": "Apache Superset"},
+        pool_size=2,
+        pool_pre_ping=True,
+    )
+
+    # other schemas and SQL Lab queries use other engines
+    assert database._get_sqla_engine(schema="other") is not engine
+    database._get_sqla_engine(source=QuerySource.SQL_LAB)
+    assert create_engine.call_args.kwargs["poolclass"] is NullPool
+    assert create_engine.call_count == 3
+
+    # changes of the database dispose its engines
+    invalidate_engines(None, None, database)
+    engine.dispose.assert_called_once()
+    assert database._get_sqla_engine() is not engine
+    engine_registry.clear()
+
+
+@pytest.mark.parametrize(
+    "pool_config,source",
+    [
+        (None, None),
+        ({"pool_size": 2}, QuerySource.SQL_LAB),
+    ],
+)
+def test_get_sqla_engine_nullpool_pool_arguments(
+    mocker: MockerFixture,
+    app_context: None,
+    pool_config: dict[str, Any] | None,
+    source: QuerySource | None,
+) -> None:
+    """
+    Test that the pool arguments of a database are ignored when a NullPool is used.
+    """
+    from superset.models.core import Database
+    from superset.utils.engine_registry import engine_registry
+
+    mocker.patch.dict(current_app.config, {"DATABASE_ENGINE_POOL": pool_config})
+    engine_registry.clear()
+    database = Database(
+        id=1,
+        database_name="my_db",
+        sqlalchemy_uri="sqlite://",
+        extra=json.dumps(
+            {
+                "engine_params": {
+                    "pool_size": 5,
+                    "max_overflow": 2,
+                    "pool_recycle": 3600,
+                    "pool_pre_ping": True,
+                    "pool_timeout": 10,
+                }
+            }
+        ),
+    )
+
+    assert isinstance(database._get_sqla_engine(source=source).pool, NullPool)
+    assert isinstance(database.get_dialect_engine().pool, NullPool)
+    engine_registry.clear()
+
+
 def test_add_database_to_signature():
     args = ["param1", "param2"]
 
@@ -1703,3 +1703,98 @@ def test_adhoc_column_with_spaces_in_full_query(database: Database) -> None:
     # Verify SELECT and FROM clauses are present
     assert "SELECT" in sql
     assert "FROM" in sql
+
+
+@pytest.mark.parametrize("mode", ["sequential", "concurrent", "fused"])
+def test_query_time_offsets(
+    database: Database,
+    mocker: MockerFixture,
+    mode: str,
+) -> None:
+    """
+    Test that the queries of time offsets return the same results in all modes.
+    """
+    from flask import current_app
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    mocker.patch.dict(
+        current_app.config,
+        {"TIME_OFFSETS_EXECUTION_MODE": mode, "CHART_DATA_QUERY_CONCURRENCY": 2},
+    )
+    get_df = mocker.spy(database, "get_df")
+
+    results = table.query_time_offsets(
+        [
+            {
+                "columns": ["b"],
+                "metrics": [],
+                "filter": [{"col": "b", "op": "==", "val": name}],
+                "is_timeseries": False,
+                "row_limit": 10,
+            }
+            for name in ["Bob", "Carol", "Alice"]
+        ]
+    )
+
+    assert [result.df.to_dict(orient="list") for result in results] == [
+        {"b": ["Bob"]},
+        {"b": []},
+        {"b": ["Alice"]},
+    ]
+    assert get_df.call_count == (1 if mode == "fused" else 3)
+    if mode == "fused":
+        assert "UNION ALL" in results[0].query
+        assert len({result.query for result in results}) == 1
+
+
+def test_query_time_offsets_fused_fallback(
+    database: Database,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the queries of time offsets are run one by one when they can't be
+    fused.
+    """
+    from flask import current_app
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    mocker.patch.dict(
+        current_app.config,
+        {"TIME_OFFSETS_EXECUTION_MODE": "fused", "CHART_DATA_QUERY_CONCURRENCY": 1},
+    )
+    mocker.patch.object(table.db_engine_spec, "allows_subqueries", new=False)
+    get_df = mocker.spy(database, "get_df")
+
+    results = table.query_time_offsets(
+        [
+            {
+                "columns": ["b"],
+                "metrics": [],
+                "filter": [{"col": "b", "op": "==", "val": name}],
+                "is_timeseries": False,
+                "row_limit": 10,
+            }
+            for name in ["Bob", "Alice"]
+        ]
+    )
+
+    assert [result.df.to_dict(orient="list") for result in results] == [
+        {"b": ["Bob"]},
+        {"b": ["Alice"]},
+    ]
+    assert get_df.call_count == 2
+    assert "UNION ALL" not in results[0].query
@@ -0,0 +1,315 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing as pp
+from superset.utils.pandas_postprocessing.planner import (
+    execute_post_processing,
+    plan_post_processing,
+    PostProcessingStep,
+)
+from tests.unit_tests.fixtures.dataframes import (
+    categories_df,
+    multiple_metrics_df,
+    single_metric_df,
+    timeseries_df,
+    timeseries_with_gap_df,
+)
+
+PIVOT = {
+    "operation": "pivot",
+    "options": {
+        "index": ["dttm"],
+        "columns": ["country"],
+        "aggregates": {
+            "sum_metric": {"operator": "mean"},
+            "count_metric": {"operator": "sum"},
+        },
+    },
+}
+
+
+def apply_eagerly(df: pd.DataFrame, post_processing: list[dict[str, Any]]) -> Any:
+    """
+    Apply post processing operations one after another, on a copy of the DataFrame.
+    """
+    df = df.copy()
+    for post_process in post_processing:
+        df = getattr(pp, post_process["operation"])(df, **post_process["options"])
+    return df
+
+
+@pytest.mark.parametrize(
+    "df,post_processing",
+    [
+        (
+            multiple_metrics_df,
+            [
+                PIVOT,
+                {
+                    "operation": "cum",
+                    "options": {
+                        "operator": "sum",
+                        "columns": {"sum_metric": "sum_metric"},
+                    },
+                },
+                {"operation": "flatten", "options": {}},
+            ],
+        ),
+        (
+            multiple_metrics_df,
+            [
+                PIVOT,
+                {
+                    "operation": "rename",
+                    "options": {"columns": {"sum_metric": "sum"}, "level": 0},
+                },
+                {"operation": "flatten", "options": {}},
+                {
+                    "operation": "sort",
+                    "options": {"by": "dttm", "ascending": False},
+                },
+            ],
+        ),
+        (
+            single_metric_df,
+            [
+                {
+                    "operation": "pivot",
+                    "options": {
+                        "index": ["dttm"],
+                        "aggregates": {"sum_metric": {"operator": "sum"}},
+                    },
+                },
+                {
+                    "operation": "cum",
+                    "options": {
+                        "operator": "max",
+                        "columns": {"sum_metric": "max_metric"},
+                    },
+                },
+                {"operation": "flatten", "options": {"reset_index": False}},
+            ],
+        ),
+        (
+            categories_df,
+            [
+                {
+                    "operation": "sort",
+                    "options": {"by": ["category", "asc_idx"], "ascending": False},
+                },
+                {
+                    "operation": "select",
+                    "options": {
+                        "columns": ["name", "asc_idx", "category"],
+                        "rename": {"name": "person"},
+                    },
+                },
+            ],
+        ),
+        (
+            categories_df,
+            [
+                {"operation": "sort", "options": {"by": "desc_idx"}},
+                {"operation": "select", "options": {"columns": ["name"]}},
+            ],
+        ),
+        (
+            categories_df,
+            [
+                {
+                    "operation": "aggregate",
+                    "options": {
+                        "groupby": ["dept"],
+                        "aggregates": {"idx_nulls": {"operator": "sum"}},
+                    },
+                },
+                {"operation": "sort", "options": {"by": "idx_nulls"}},
+                {
+                    "operation": "rename",
+                    "options": {"columns": {"idx_nulls": "total"}},
+                },
+            ],
+        ),
+        (
+            timeseries_df,
+            [
+                {
+                    "operation": "rolling",
+                    "options": {
+                        "columns": {"y": "y"},
+                        "rolling_type": "sum",
+                        "window": 2,
+                        "min_periods": 0,
+                    },
+                },
+                {"operation": "sort", "options": {"is_sort_index": True}},
+                {"operation": "select", "options": {"columns": ["y"]}},
+                {"operation": "flatten", "options": {}},
+            ],
+        ),
+        (
+            timeseries_with_gap_df,
+            [
+                {
+                    "operation": "resample",
+                    "options": {"rule": "1D", "method": "asfreq"},
+                },
+                {
+                    "operation": "cum",
+                    "options": {"operator": "sum", "columns": {"y": "y"}},
+                },
+                {"operation": "flatten", "options": {}},
+            ],
+        ),
+        (
+            multiple_metrics_df,
+            [
+                PIVOT,
+                {
+                    "operation": "contribution",
+                    "options": {"orientation": "row"},
+                },
+                {"operation": "flatten", "options": {"drop_levels": [0]}},
+            ],
+        ),
+    ],
+)
+def test_execute_post_processing(
+    df: pd.DataFrame,
+    post_processing: list[dict[str, Any]],
+) -> None:
+    """
+    Test that planned post processing operations give the same DataFrame as the
+    operations applied one after another, leaving the original one unchanged.
+    """
+    original = df.copy()
+
+    result, durations = execute_post_processing(
+        df, plan_post_processing(post_processing)
+    )
+
+    assert_frame_equal(result, apply_eagerly(df, post_processing))
+    assert_frame_equal(df, original)
+    assert sorted(duration["operation"] for duration in durations) == sorted(
+        post_process["operation"] for post_process in post_processing
+    )
+
+
+def test_plan_post_processing_select_before_sort() -> None:
+    """
+    Test that columns are selected before sorting the rows, when they're sorted by
+    selected columns only.
+    """
+    sort = {"operation": "sort", "options": {"by": ["a"]}}
+
+    assert plan_post_processing(
+        [sort, {"operation": "select", "options": {"columns": ["a", "b"]}}]
+    ) == [
+        PostProcessingStep("select", {"columns": ["a", "b"]}),
+        PostProcessingStep("sort", {"by": ["a"]}),
+    ]
+    for options in [
+        {"columns": ["b"]},
+        {"exclude": ["a"]},
+        {"rename": {"a": "c"}},
+        {"columns": ["a", "a"]},
+    ]:
+        assert plan_post_processing(
+            [sort, {"operation": "select", "options": options}]
+        ) == [
+            PostProcessingStep("sort", {"by": ["a"]}),
+            PostProcessingStep("select", options),
+        ]
+
+
+def test_plan_post_processing_inplace() -> None:
+    """
+    Test that the ``inplace`` options of the operations are ignored, so that the
+    DataFrame being processed is left unchanged.
+    """
+    df = timeseries_df.copy()
+    original = df.copy()
+    post_processing = [
+        {
+            "operation": "cum",
+            "options": {"operator": "sum", "columns": {"y": "y"}, "inplace": True},
+        },
+        {"operation": "sort", "options": {"by": "y", "inplace": False}},
+    ]
+
+    steps = plan_post_processing(post_processing)
+    assert steps == [
+        PostProcessingStep("cum", {"operator": "sum", "columns": {"y": "y"}}),
+        PostProcessingStep("sort", {"by": "y"}),
+    ]
+    execute_post_processing(df, steps)
+    assert_frame_equal(df, original)
+
+
+@pytest.mark.parametrize(
+    "post_processing",
+    [
+        [{"options": {}}],
+        [{"operation": "foo"}],
+        [{"operation": "utils"}],
+        [{"operation": "sort", "options": ["a"]}],
+    ],
+)
+def test_plan_post_processing_invalid(post_processing: list[dict[str, Any]]) -> None:
+    """
+    Test that all the post processing operations are validated before any runs.
+    """
+    with pytest.raises(InvalidPostProcessingError):
+        plan_post_processing(
+            [{"operation": "sort", "options": {"by": "a"}}, *post_processing]
+        )
+
+
+def test_exec_post_processing(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the duration of each post processing operation of a query object is
+    logged.
+    """
+    from superset.common.query_object import QueryObject
+
+    event_logger = mocker.patch(
+        "superset.common.query_object.event_logger", new=mocker.MagicMock()
+    )
+    log = event_logger.log_context.return_value.__enter__.return_value
+    query_object = QueryObject(
+        datasource=mocker.MagicMock(),
+        columns=["name"],
+        metrics=[],
+        post_processing=[
+            {"operation": "sort", "options": {"by": "asc_idx"}},
+            {"operation": "select", "options": {"columns": ["asc_idx"]}},
+        ],
+    )
+
+    df = query_object.exec_post_processing(categories_df)
+
+    assert df.columns.tolist() == ["asc_idx"]
+    event_logger.log_context.assert_called_once_with("QueryObject.post_processing")
+    durations = log.call_args[1]["post_processing"]
+    assert [duration["operation"] for duration in durations] == ["select", "sort"]
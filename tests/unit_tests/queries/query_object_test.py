@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from unittest.mock import call, patch
+from unittest.mock import call, MagicMock, patch
 
 from flask_appbuilder.security.sqla.models import User
 
@@ -386,3 +386,61 @@ def test_cache_key_cache_impersonation_on_with_different_user_and_db_impersonati
         ],
         any_order=True,
     )
+
+
+def test_memoized_cache_key() -> None:
+    """
+    The memoized cache key is the cache key, and the values about the datasource
+    are only computed again when the query object is mutated
+    """
+    query_object = QueryObject(row_limit=1, filters=[])
+    get_extra = MagicMock(return_value={"rls": ["a"]})
+
+    cache_key1 = query_object.memoized_cache_key(get_extra, time_offset="1 day ago")
+    assert cache_key1 == query_object.cache_key(rls=["a"], time_offset="1 day ago")
+    assert query_object.memoized_cache_key(get_extra, time_offset="1 day ago") == (
+        cache_key1
+    )
+    assert get_extra.call_count == 1
+
+    # other values added to the cache key
+    cache_key2 = query_object.memoized_cache_key(get_extra)
+    assert cache_key2 != cache_key1
+    assert get_extra.call_count == 2
+
+    # mutations in place
+    query_object.filter.append({"col": "a", "op": "==", "val": "b"})
+    cache_key3 = query_object.memoized_cache_key(get_extra)
+    assert cache_key3 not in {cache_key1, cache_key2}
+    assert cache_key3 == query_object.cache_key(rls=["a"])
+    assert get_extra.call_count == 3
+
+    query_object.filter.pop()
+    assert query_object.memoized_cache_key(get_extra) == cache_key2
+    assert get_extra.call_count == 3
+
+
+@patch("superset.common.query_object.feature_flag_manager")
+def test_memoized_cache_key_cache_query_by_user(feature_flag_mock):
+    """
+    The memoized cache key depends on the user when caching queries by user
+    """
+    feature_flag_mock.is_feature_enabled.side_effect = (
+        cache_query_by_user_flag_side_effect
+    )
+    datasource = SqlaTable(
+        table_name="test_table",
+        columns=[],
+        metrics=[],
+        main_dttm_col=None,
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+    )
+    query_object = QueryObject(row_limit=1, datasource=datasource)
+
+    with override_user(User(username="test_user1")):
+        cache_key1 = query_object.memoized_cache_key(dict)
+
+    with override_user(User(username="test_user2")):
+        cache_key2 = query_object.memoized_cache_key(dict)
+
+    assert cache_key1 != cache_key2
@@ -21,6 +21,8 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -185,3 +187,74 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_columnar_construction_matches_row_values() -> None:
+    """
+    Test that rows are transposed into one typed Arrow array per column, and that
+    only the columns Arrow can't infer are stringified.
+    """
+    data = [
+        (1, "a", 1.5, {"k": "v"}, [1, 2]),
+        (2, None, None, {"k": "w"}, [3]),
+    ]
+    description = [
+        ("int", None, None, None, None, None, True),
+        ("str", None, None, None, None, None, True),
+        ("float", None, None, None, None, None, True),
+        ("dict", None, None, None, None, None, True),
+        ("list", None, None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert [field.type for field in result_set.table.schema] == [
+        pa.int64(),
+        pa.string(),
+        pa.float64(),
+        pa.string(),
+        pa.string(),
+    ]
+    assert result_set.table.to_pydict() == {
+        "int": [1, 2],
+        "str": ["a", None],
+        "float": [1.5, None],
+        "dict": ["{'k': 'v'}", "{'k': 'w'}"],
+        "list": ["[1, 2]", "[3]"],
+    }
+
+
+def test_rows_not_matching_description() -> None:
+    """
+    Test that rows with a different width than the cursor description are rejected.
+    """
+    description = [
+        ("a", None, None, None, None, None, True),
+        ("b", None, None, None, None, None, True),
+    ]
+    with pytest.raises(ValueError):
+        SupersetResultSet([(1, 2), (3,)], description, BaseEngineSpec)  # type: ignore
+
+
+def test_arrow_table_is_used_as_is() -> None:
+    """
+    Test that a table fetched natively as Arrow keeps its buffers, with the column
+    names from the cursor description and nested columns stringified.
+    """
+    table = pa.table(
+        {
+            "a": pa.array([1, 2], type=pa.int32()),
+            "b": pa.array([[1], [2, 3]]),
+        }
+    )
+    description = [
+        ("a", "INTEGER", None, None, None, None, True),
+        ("a", "INTEGER[]", None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.column_names == ["a", "a__1"]
+    assert result_set.table.column(0).chunks[0].buffers() == (
+        table.column(0).chunks[0].buffers()
+    )
+    assert result_set.table.to_pydict() == {"a": [1, 2], "a__1": ["[1]", "[2, 3]"]}
+    assert result_set.columns[0]["type"] == "INTEGER"
@@ -22,6 +22,7 @@ import json  # noqa: TID251
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
@@ -1186,3 +1187,143 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_cache(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that RLS filters are cached by roles, and invalidated when they change.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.extensions import cache_manager, security_manager
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    mocker.patch.dict(current_app.config, {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_cache", cache)
+    query_rls_filters = mocker.spy(security_manager, "_query_rls_filters")
+    # building the payload of the table is too slow for a cache lookup
+    data = mocker.patch.object(SqlaTable, "data", new_callable=mocker.PropertyMock)
+
+    role = Role(name="sales")
+    table = SqlaTable(
+        table_name="orders",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="region",
+        filter_type="Regular",
+        group_key="region",
+        clause="region = 'EMEA'",
+        roles=[role],
+        tables=[table],
+    )
+    session.add_all([role, table, rls_filter])
+    session.commit()
+
+    users = [
+        User(
+            username=f"user_{i}",
+            first_name="user",
+            last_name=str(i),
+            email=f"user_{i}@example.com",
+            roles=[role],
+        )
+        for i in range(2)
+    ]
+    for user in users:
+        with override_user(user):
+            assert [
+                (rls.group_key, rls.clause)
+                for rls in security_manager.get_rls_filters(table)
+            ] == [("region", "region = 'EMEA'")]
+    assert query_rls_filters.call_count == 1
+
+    # changes of filters invalidate the cache once they are committed
+    rls_filter.clause = "region = 'APAC'"
+    session.flush()
+    with override_user(users[0]):
+        assert security_manager.get_rls_filters(table)[0].clause == "region = 'EMEA'"
+    session.commit()
+    with override_user(users[0]):
+        assert security_manager.get_rls_filters(table)[0].clause == "region = 'APAC'"
+    assert query_rls_filters.call_count == 2
+
+    # changes of role memberships change the key
+    with override_user(User(username="user_2", roles=[])):
+        assert security_manager.get_rls_filters(table) == []
+    assert query_rls_filters.call_count == 3
+    data.assert_not_called()
+
+
+def test_has_view_access_cache(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the permissions of roles are cached, and invalidated when they change.
+    """
+    from flask import current_app, g
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+    from flask_caching import Cache
+
+    from superset.extensions import cache_manager, security_manager
+    from superset.security.manager import ROLES_PERMISSIONS
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    mocker.patch.object(SupersetSecurityManager, "session", session)
+    mocker.patch.dict(current_app.config, {"PERMISSIONS_CACHE_TIMEOUT": 60})
+    cache = Cache()
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_cache", cache)
+    query_roles_permissions = mocker.spy(security_manager, "_query_roles_permissions")
+
+    can_read, can_write = Permission(name="can_read"), Permission(name="can_write")
+    chart = ViewMenu(name="Chart")
+    role = Role(
+        name="viewer",
+        permissions=[PermissionView(permission=can_read, view_menu=chart)],
+    )
+    users = [
+        User(
+            username=f"user_{i}",
+            first_name="user",
+            last_name=str(i),
+            email=f"user_{i}@example.com",
+            roles=[role],
+        )
+        for i in range(2)
+    ]
+    session.add_all([role, *users])
+    session.commit()
+
+    for user in users:
+        # each request compiles the permissions again from the cache
+        g.pop(ROLES_PERMISSIONS, None)
+        assert security_manager._has_view_access(user, "can_read", "Chart")
+        assert not security_manager._has_view_access(user, "can_write", "Chart")
+    assert query_roles_permissions.call_count == 1
+    with override_user(users[0]):
+        assert security_manager.user_view_menu_names("can_read") == {"Chart"}
+
+    # pending changes are checked against the database, and invalidate the cache once
+    # they are committed
+    role.permissions.append(PermissionView(permission=can_write, view_menu=chart))
+    session.flush()
+    assert security_manager._has_view_access(users[0], "can_write", "Chart")
+    session.commit()
+    assert ROLES_PERMISSIONS not in g
+    assert security_manager._has_view_access(users[0], "can_write", "Chart")
+    assert query_roles_permissions.call_count == 2
@@ -30,6 +30,8 @@ from superset.sql.parse import (
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    parse_cache,
+    ParseCache,
     process_jinja_sql,
     remove_quotes,
     RLSMethod,
@@ -3070,3 +3072,50 @@ def test_backtick_invalid_sql_still_fails() -> None:
     sql = "SELECT * FROM `table` WHERE"
     with pytest.raises(SupersetParseError):
         SQLScript(sql, "base")
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that scripts are parsed once, and that the least recently used are evicted.
+    """
+    cache = ParseCache(maxsize=2, max_length=100)
+    parse = mocker.MagicMock(side_effect=SQLStatement._parse_uncached)
+
+    for sql in ["SELECT 1", "SELECT 2", "SELECT 1", "SELECT 3", "SELECT 2"]:
+        assert cache.get(sql, "postgresql", parse) == SQLStatement._parse_uncached(
+            sql, "postgresql"
+        )
+
+    assert [call.args[0] for call in parse.call_args_list] == [
+        "SELECT 1",
+        "SELECT 2",
+        "SELECT 3",
+        "SELECT 2",
+    ]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    # long scripts are not cached
+    sql = f"SELECT {'1 + ' * 50}1"
+    cache.get(sql, "postgresql", parse)
+    cache.get(sql, "postgresql", parse)
+    assert parse.call_count == 6
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_parse_cache_copy_on_write() -> None:
+    """
+    Test that modifying a statement doesn't modify the cached statements.
+    """
+    parse_cache.clear()
+    sql = "WITH t AS (SELECT a FROM some_table) SELECT a FROM t WHERE a > 1"
+
+    statement = SQLStatement(sql, "postgresql")
+    statement.set_limit_value(10)
+    statement.as_cte()
+    SQLScript(sql, "postgresql").optimize()
+
+    assert parse_cache.hits == 1
+    assert SQLStatement(sql, "postgresql").format() == SQLStatement(
+        ast=parse_one(sql, dialect="postgres"), engine="postgresql"
+    ).format()
+    assert SQLScript(sql, "postgresql").statements[0].get_limit_value() is None
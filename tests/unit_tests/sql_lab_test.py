@@ -17,24 +17,44 @@
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
 import json  # noqa: TID251
+import zlib
 from unittest.mock import MagicMock
 from uuid import UUID
 
+import pyarrow as pa
 import pytest
 from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
 from superset.common.db_query_status import QueryStatus
+from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.postgres import PostgresEngineSpec
 from superset.errors import ErrorLevel, SupersetErrorType
-from superset.exceptions import OAuth2Error, SupersetErrorException
+from superset.exceptions import (
+    OAuth2Error,
+    SerializationError,
+    SupersetErrorException,
+)
 from superset.models.core import Database
 from superset.sql.parse import SQLStatement, Table
+from superset.result_set import SupersetResultSet
 from superset.sql_lab import (
+    _serialize_and_expand_data,
+    _serialize_payload,
     execute_query,
     execute_sql_statements,
     get_sql_results,
 )
+from superset.sqllab.utils import (
+    is_results_payload_v2,
+    read_results_payload,
+    RESULTS_PAYLOAD_HEADER,
+    RESULTS_PAYLOAD_MAGIC,
+    RESULTS_PAYLOAD_VERSION,
+    write_results_payload,
+)
+from superset.utils.core import zlib_compress
+from superset.views.utils import _deserialize_results_payload
 from superset.utils.rls import apply_rls, get_predicates_for_table
 from tests.conftest import with_config
 from tests.unit_tests.models.core_test import oauth2_client_info
@@ -51,6 +71,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = False
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -66,6 +87,34 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_query_arrow_fetch(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that engines supporting it fetch results as Arrow, and that the extra row
+    used to detect limiting is sliced off the table.
+    """
+    import pyarrow as pa
+
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT 42 AS answer"
+
+    query.limit = 1
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.supports_arrow_fetch = True
+    db_engine_spec.fetch_data_as_arrow.return_value = pa.table({"answer": [42, 43]})
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor, log_params={})
+
+    db_engine_spec.fetch_data_as_arrow.assert_called_with(cursor, 2)
+    db_engine_spec.fetch_data.assert_not_called()
+    data = SupersetResultSet.call_args[0][0]
+    assert data.to_pydict() == {"answer": [42]}
+
+
 @with_config(
     {
         "SQLLAB_PAYLOAD_MAX_MB": 50,
@@ -301,3 +350,111 @@ def test_get_predicates_for_table(mocker: MockerFixture) -> None:
 
     table = Table("t1", "public", "examples")
     assert get_predicates_for_table(table, database, "examples") == ["c1 = 1"]
+
+
+@pytest.mark.parametrize("payload_version", [1, 2])
+def test_results_payload_round_trip(
+    mocker: MockerFixture, app: None, payload_version: int
+) -> None:
+    """
+    Test that results stored in both payload formats are read back identically.
+    """
+    result_set = SupersetResultSet(
+        [(1, "a", 1.5, None), (2, None, 2.5, True)],
+        [
+            ("id", "INTEGER"),
+            ("name", "VARCHAR"),
+            ("value", "FLOAT"),
+            ("flag", "BOOLEAN"),
+        ],
+        BaseEngineSpec,
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = BaseEngineSpec
+
+    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
+        result_set, BaseEngineSpec, True, False, payload_version
+    )
+    payload = {
+        "status": QueryStatus.SUCCESS,
+        "data": data,
+        "columns": all_columns,
+        "selected_columns": selected_columns,
+        "expanded_columns": expanded_columns,
+        "query": {"rows": 2},
+    }
+    serialized = _serialize_payload(payload, True)
+    stored = serialized if payload_version == 2 else zlib_compress(serialized)
+    assert is_results_payload_v2(stored) == (payload_version == 2)
+
+    if payload_version == 1:
+        serialized = zlib.decompress(stored)
+    results = _deserialize_results_payload(serialized, query, True)
+
+    assert results["status"] == QueryStatus.SUCCESS
+    assert results["query"] == {"rows": 2}
+    assert [column["column_name"] for column in results["columns"]] == [
+        "id",
+        "name",
+        "value",
+        "flag",
+    ]
+    assert results["data"] == [
+        {"id": 1, "name": "a", "value": 1.5, "flag": None},
+        {"id": 2, "name": None, "value": 2.5, "flag": True},
+    ]
+
+
+def test_read_results_payload_invalid() -> None:
+    """
+    Test that unknown payload versions and truncated payloads can't be read.
+    """
+    with pytest.raises(SerializationError):
+        read_results_payload(b"SSRP")
+    with pytest.raises(SerializationError, match="Unsupported"):
+        read_results_payload(b"SSRP\x03\x00\x00\x00\x00")
+
+
+@pytest.mark.parametrize(
+    "offset,limit",
+    [(0, None), (0, 3), (2, 5), (3, 3), (4, 10), (9, None), (10, 1), (20, 5)],
+)
+def test_read_results_payload_range(offset: int, limit: int | None) -> None:
+    """
+    Test reading ranges of rows spanning one or more record batches.
+    """
+    table = pa.table({"id": list(range(10)), "name": [str(i) for i in range(10)]})
+    results_payload = read_results_payload(
+        write_results_payload({"data": table}, batch_size=3)
+    )
+
+    assert results_payload.num_rows == 10
+    assert [batch[:2] for batch in results_payload.batches] == [
+        [0, 3],
+        [3, 3],
+        [6, 3],
+        [9, 1],
+    ]
+    assert results_payload.read_table(offset, limit) == table.slice(offset, limit)
+
+
+def test_read_results_payload_range_without_index() -> None:
+    """
+    Test that ranges of payloads stored without a batch index are still read.
+    """
+    table = pa.table({"id": list(range(10))})
+    blob = write_results_payload({"data": table}, batch_size=3)
+    results_payload = read_results_payload(blob)
+    serialized_metadata = json.dumps(results_payload.metadata).encode("utf-8")
+    blob = (
+        RESULTS_PAYLOAD_HEADER.pack(
+            RESULTS_PAYLOAD_MAGIC, RESULTS_PAYLOAD_VERSION, len(serialized_metadata)
+        )
+        + serialized_metadata
+        + results_payload.stream.tobytes()
+    )
+
+    results_payload = read_results_payload(blob)
+
+    assert results_payload.num_rows is None
+    assert results_payload.read_table(4, 3) == table.slice(4, 3)
@@ -149,3 +149,21 @@ def test_load_chart_data_into_cache_with_superset_errors_exception(
     assert errors[1]["message"] == "Table not found"
     assert errors[1]["error_type"] == SupersetErrorType.TABLE_DOES_NOT_EXIST_ERROR
     assert errors[1]["level"] == ErrorLevel.WARNING
+
+
+@mock.patch("superset.tasks.async_queries.cache_manager")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_refresh_chart_data_cache_with_error(
+    mock_query_context_schema_cls, mock_security_manager, mock_cache_manager
+):
+    """Test that the refresh is marked as done even if it fails"""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    err = ChartDataQueryFailedError(_("Something went wrong"))
+    mock_query_context_schema_cls.return_value.load.side_effect = err
+
+    with pytest.raises(ChartDataQueryFailedError):
+        refresh_chart_data_cache({"user_id": 1}, {}, "refresh-key")
+
+    mock_cache_manager.data_cache.delete.assert_called_once_with("refresh-key")
@@ -0,0 +1,224 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+from datetime import datetime
+
+import pytest
+from flask_appbuilder.security.sqla.models import User
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+
+def test_cache_warmup_executor(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the executor warms up charts once per cache keys, as their executors.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+    from superset.models.slice import Slice
+    from superset.tasks.cache import CacheWarmupExecutor
+    from superset.utils.core import get_username
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    table = SqlaTable(
+        table_name="orders",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    session.add(table)
+    session.flush()
+    charts = [
+        Slice(
+            slice_name=f"chart_{i}",
+            viz_type="echarts_timeseries_bar",
+            datasource_type="table",
+            datasource_id=table.id,
+        )
+        for i in range(2)
+    ]
+    session.add_all(charts)
+    session.commit()
+    # the in-memory database can't be shared with other threads
+    mocker.patch(
+        "superset.tasks.cache.run_concurrently",
+        side_effect=lambda funcs, max_workers: [func() for func in funcs],
+    )
+    mocker.patch(
+        "superset.tasks.cache.security_manager.find_user",
+        side_effect=lambda username: User(username=username),
+    )
+
+    usernames = []
+
+    def get_query_context(chart: Slice) -> mocker.MagicMock:
+        usernames.append(get_username())
+        query_context = mocker.MagicMock(queries=[1, 2])
+        query_context.query_cache_key.side_effect = lambda query: (
+            f"{chart.id}_{query}"
+        )
+        return query_context
+
+    command = mocker.patch("superset.tasks.cache.ChartWarmUpCacheCommand")
+    command.return_value.get_query_context.side_effect = get_query_context
+    command.return_value.run.side_effect = [
+        {"chart_id": charts[0].id, "viz_error": None},
+        {"chart_id": charts[1].id, "viz_error": "Table not found"},
+        {"chart_id": charts[1].id, "viz_error": None},
+    ]
+
+    tasks = [
+        {"payload": {"chart_id": charts[0].id, "dashboard_id": 1}, "username": "a"},
+        {"payload": {"chart_id": charts[0].id, "dashboard_id": 2}, "username": "a"},
+        {"payload": {"chart_id": charts[1].id}, "username": "b"},
+        # the keys of failed charts aren't warm
+        {"payload": {"chart_id": charts[1].id}, "username": "b"},
+        {"payload": {"chart_id": 0}, "username": "b"},
+    ]
+    report = CacheWarmupExecutor(concurrency=2).run(tasks)  # type: ignore
+
+    assert command.return_value.run.call_count == 3
+    assert usernames == ["a", "a", "b", "b"]
+    assert [
+        (result["chart_id"], result["cache_keys"], result["cache_hits"])
+        for result in report
+    ] == [
+        (charts[0].id, 2, 0),
+        (charts[0].id, 2, 2),
+        (charts[1].id, 2, 0),
+        (charts[1].id, 2, 0),
+        (0, 0, 0),
+    ]
+    assert [result["error"] for result in report] == [
+        None,
+        None,
+        "Table not found",
+        None,
+        "Chart not found",
+    ]
+
+
+@freeze_time("2024-01-29 08:50:00")
+def test_predictive_strategy(
+    mocker: MockerFixture,
+    app_context: None,
+    session: Session,
+) -> None:
+    """
+    Test that the predictive strategy warms up the charts requested at the same hours
+    on previous weeks, whose cache expires, within the budget, ignoring the requests
+    it can't reproduce and the charts whose cache is disabled.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database, Log
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.tasks.cache import PredictiveStrategy
+    from superset.utils import json
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    table = SqlaTable(
+        table_name="orders",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    dashboard = Dashboard(dashboard_title="orders")
+    session.add_all([table, dashboard])
+    session.flush()
+    charts = {
+        name: Slice(
+            slice_name=name,
+            viz_type="echarts_timeseries_bar",
+            datasource_type="table",
+            datasource_id=table.id,
+            cache_timeout=cache_timeout,
+        )
+        for name, cache_timeout in (
+            ("morning", 3600),
+            ("afternoon", 3600),
+            ("cached", 86400 * 30),
+            ("slow", 3600),
+            ("disabled", -1),
+        )
+    }
+    session.add_all(charts.values())
+    session.flush()
+
+    filters = [{"col": "country", "op": "IN", "val": ["FR"]}]
+    form_data = {"dashboardId": dashboard.id, "extra_form_data": {"filters": filters}}
+    for day in (8, 15, 22):
+        for name, time_, duration_ms in (
+            ("morning", "09:10", 5000),
+            ("afternoon", "15:00", 5000),
+            ("cached", "09:05", 5000),
+            ("slow", "09:20", 3600_000),
+            ("disabled", "09:10", 5000),
+        ):
+            session.add(
+                Log(
+                    action="ChartDataRestApi.data",
+                    dttm=datetime.fromisoformat(f"2024-01-{day:02d} {time_}"),
+                    slice_id=charts[name].id,
+                    duration_ms=duration_ms,
+                    json=json.dumps({"form_data": form_data}),
+                )
+            )
+        # the time range of native filters can't be reproduced by warm-ups
+        session.add(
+            Log(
+                action="ChartDataRestApi.data",
+                dttm=datetime.fromisoformat(f"2024-01-{day:02d} 09:15"),
+                slice_id=charts["morning"].id,
+                duration_ms=5000,
+                json=json.dumps(
+                    {
+                        "form_data": {
+                            **form_data,
+                            "extra_form_data": {
+                                "filters": filters,
+                                "time_range": "Last week",
+                            },
+                        }
+                    }
+                ),
+            )
+        )
+    session.commit()
+    mocker.patch("superset.tasks.cache.get_executor", return_value=("owner", "admin"))
+
+    strategy = PredictiveStrategy(since="28 days ago", interval=60, budget=600)
+    assert strategy.get_tasks() == [
+        {
+            "payload": {
+                "chart_id": charts["morning"].id,
+                "dashboard_id": dashboard.id,
+                "extra_filters": json.dumps(filters, sort_keys=True),
+            },
+            "username": "admin",
+        }
+    ]
+    report = strategy.get_report()
+    assert report["predicted"] == 3
+    assert report["warm"] == 1
+    assert report["warm_ups"] == 1
+    assert report["duration_ms"] == 5000
+    assert report["backtest"]["requests"] == 3
+    assert report["backtest"]["hit_rate"] == pytest.approx(1 / 3)
+    assert report["backtest"]["warm_hit_rate"] == pytest.approx(2 / 3)
+    assert report["backtest"]["uplift"] == pytest.approx(1 / 3)
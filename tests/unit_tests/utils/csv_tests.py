@@ -16,15 +16,19 @@
 # under the License.
 
 
+from typing import Any
+
+import numpy as np
 import pandas as pd
 import pyarrow as pa
-import pytest  # noqa: F401
+import pytest
 from pandas.api.types import is_datetime64_any_dtype
 
 from superset.utils import csv, json
 from superset.utils.core import GenericDataType
 from superset.utils.csv import (
     df_to_escaped_csv,
+    escape_value,
     get_chart_dataframe,
 )
 
@@ -182,6 +186,82 @@ def test_df_to_escaped_csv():
     assert df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
 
 
+ESCAPING_VALUES = [
+    "a",
+    "",
+    "=func()",
+    "-10",
+    "-1.5e3",
+    "--1",
+    "@user",
+    "+1",
+    "|pipe",
+    "%p",
+    "=cmd|' /C calc'!A0",
+    '""=b',
+    '"""=b',
+    '"=b',
+    " =a",
+    "\t\n=a",
+    "\x0b=a",
+    "\x1c=a",
+    "\x85=a",
+    "\u00a0=a",
+    "\u2003-a",
+    "\u3000@a",
+    "a=b",
+    "\x00",
+    "é=",
+]
+
+
+def legacy_df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    """The cell by cell implementation of ``df_to_escaped_csv``."""
+
+    def escape_values(v: Any) -> Any:
+        return escape_value(v) if isinstance(v, str) else v
+
+    df = df.rename(columns=escape_values)
+    for name, column in df.items():
+        if column.dtype == np.dtype(object):
+            for idx, value in enumerate(column.values):
+                if isinstance(value, str):
+                    df.at[idx, name] = escape_value(value)
+
+    return df.to_csv(escapechar="\\", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"value": ESCAPING_VALUES}),
+        pd.DataFrame({"value": ESCAPING_VALUES + [None, np.nan]}),
+        pd.DataFrame({"value": ESCAPING_VALUES + [1, 2.5, b"=bytes", ["=list"]]}),
+        pd.DataFrame({"=header": ["a", "=b"], "-1": [1, 2], "number": [1.5, None]}),
+        pd.DataFrame({"empty": pd.Series([], dtype=object)}),
+        pd.DataFrame({"string": pd.Series(["=a", None], dtype="string")}),
+    ],
+)
+def test_df_to_escaped_csv_matches_legacy(df: pd.DataFrame) -> None:
+    """
+    Test that escaping whole columns produces the same output as escaping each value.
+    """
+    expected = legacy_df_to_escaped_csv(df.copy(), index=False)
+
+    assert df_to_escaped_csv(df, index=False) == expected
+
+
+def test_df_to_escaped_csv_index() -> None:
+    """
+    Test that values are escaped regardless of the index of the dataframe.
+    """
+    df = pd.DataFrame({"value": ["=a", "b", "@c"]}, index=[2, 0, 10])
+
+    assert df_to_escaped_csv(df, header=False) == "2,'=a\n0,b\n10,'@c\n"
+    # the dataframe itself isn't modified
+    assert df["value"].tolist() == ["=a", "b", "@c"]
+
+
 def test_get_chart_dataframe_returns_none_when_no_content(
     monkeypatch: pytest.MonkeyPatch,
 ):
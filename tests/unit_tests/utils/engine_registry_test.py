@@ -0,0 +1,43 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest_mock import MockerFixture
+
+from superset.utils.engine_registry import EngineRegistry
+
+
+def test_engine_registry_eviction(mocker: MockerFixture) -> None:
+    """
+    Test that the engine registry disposes idle and least recently used engines.
+    """
+    monotonic = mocker.patch("superset.utils.engine_registry.time.monotonic")
+    monotonic.return_value = 0
+    registry = EngineRegistry()
+    engines = [mocker.MagicMock() for _ in range(3)]
+
+    assert registry.get(1, "a", lambda: engines[0], 2, 60) is engines[0]
+    assert registry.get(1, "b", lambda: engines[1], 2, 60) is engines[1]
+    assert registry.get(1, "a", mocker.MagicMock(), 2, 60) is engines[0]
+    assert registry.get(2, "a", lambda: engines[2], 2, 60) is engines[2]
+    engines[1].dispose.assert_called_once()
+    assert (registry.hits, registry.misses) == (1, 3)
+
+    monotonic.return_value = 30
+    registry.get(2, "a", mocker.MagicMock(), 2, 60)
+    monotonic.return_value = 70
+    registry.get(2, "a", mocker.MagicMock(), 2, 60)
+    engines[0].dispose.assert_called_once()
+    engines[2].dispose.assert_not_called()
@@ -16,12 +16,15 @@
 # under the License.
 
 from datetime import datetime, timezone
+from typing import Any
 
+import numpy as np
 import pandas as pd
+import pytest
 from pandas.api.types import is_numeric_dtype
 
 from superset.utils.core import GenericDataType
-from superset.utils.excel import apply_column_types, df_to_excel
+from superset.utils.excel import apply_column_types, df_to_excel, quote_formulas
 
 
 def test_timezone_conversion() -> None:
@@ -47,6 +50,42 @@ def test_quote_formulas() -> None:
     ]
 
 
+def legacy_quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
+    """The value by value implementation of ``quote_formulas``."""
+    formula_prefixes = {"=", "+", "-", "@"}
+    for col in df.select_dtypes(include="object").columns:
+        df[col] = df[col].apply(
+            lambda x: (
+                f"'{x}"
+                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
+                else x
+            )
+        )
+    return df
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["=SUM(A1:A2)", "normal", "@SUM(A1:A2)", "+1", "-1", "", " =a", "a=", "|a"],
+        ["=a", None, np.nan, 1, 2.5, b"=bytes", ["=list"]],
+        [None, None],
+        [1, 2],
+    ],
+)
+def test_quote_formulas_matches_legacy(values: list[Any]) -> None:
+    """
+    Test that quoting whole columns produces the same values as quoting each value.
+    """
+    df = pd.DataFrame(
+        {"a": values, "b": list(reversed(values))},
+        index=range(0, 2 * len(values), 2),
+    )
+    expected = legacy_quote_formulas(df.copy())
+
+    pd.testing.assert_frame_equal(quote_formulas(df), expected)
+
+
 def test_column_data_types_with_one_numeric_column():
     df = pd.DataFrame(
         {
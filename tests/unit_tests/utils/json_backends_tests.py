@@ -0,0 +1,279 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Conformance tests checking that the orjson backend of ``superset.utils.json``
+produces the same values as the simplejson one.
+"""
+
+import math
+import uuid
+from collections import namedtuple
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+import simplejson
+from flask_babel.speaklater import LazyString
+
+from superset.utils import json
+
+pytest.importorskip("orjson")
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+@dataclass
+class Config:
+    name: str
+
+
+PAYLOADS: dict[str, Any] = {
+    "scalars": [None, True, False, 0, -1, 2**63 - 1, 1.5, 1e16, 1e-7, "", "a"],
+    "nested": {"b": [1, {"d": [], "c": {}}], "a": {"z": None, "y": [[]]}},
+    "unicode": {"emoji": "\U0001f600", "accents": "àéî", "escapes": '"\\\n\t/'},
+    "nan": [float("nan"), float("inf"), float("-inf"), np.nan, np.float64("nan")],
+    "datetimes": {
+        "naive": datetime(2021, 1, 1, 12, 30, 15, 123456),
+        "aware": datetime(2021, 1, 1, tzinfo=timezone(timedelta(hours=5, seconds=7))),
+        "date": date(1970, 1, 1),
+        "time": time(1, 2, 3),
+        "timestamp": pd.Timestamp("2021-01-01 00:00:00.000000001"),
+        "timestamp_tz": pd.Timestamp("2021-01-01", tz="US/Pacific"),
+        "nat": pd.NaT,
+    },
+    "decimals": [Decimal("1.10"), Decimal("-0.000001"), Decimal("1e+30")],
+    "numpy": {
+        "int64": np.int64(2**62),
+        "float64": np.float64(0.1),
+        "bool": np.bool_(True),
+        "array": np.array([1, 2, 3]),
+    },
+    "python": {
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "set": {1},
+        "timedelta": timedelta(days=-1, hours=5),
+        "offset": pd.DateOffset(days=1),
+        "lazy": LazyString(lambda: "lazy"),
+        "namedtuple": Point(1, 2),
+        "tuple": (1, 2),
+    },
+    "bytes": {"utf8": b"Hello", "utf16": "Hello".encode("utf-16"), "bad": b"\xff"},
+    "unsortable_order": {"b": 1, "a": 2, "B": 3, "é": 4, "_": 5},
+}
+
+
+@pytest.fixture
+def orjson_backend() -> Iterator[None]:
+    json.set_backend("orjson")
+    yield
+    json.set_backend("simplejson")
+
+
+def dumps_with(backend: str, obj: Any, **kwargs: Any) -> str:
+    json.set_backend(backend)  # type: ignore
+    try:
+        return json.dumps(obj, **kwargs)
+    finally:
+        json.set_backend("simplejson")
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+@pytest.mark.parametrize(
+    "default",
+    [
+        json.json_iso_dttm_ser,
+        json.pessimistic_json_iso_dttm_ser,
+        json.json_int_dttm_ser,
+        json.base_json_conv,
+    ],
+)
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_dumps_conformance(
+    name: str,
+    default: Callable[[Any], Any],
+    sort_keys: bool,
+) -> None:
+    """
+    Test that both backends encode the same values, or both fail.
+    """
+    payload = PAYLOADS[name]
+    kwargs = {"default": default, "sort_keys": sort_keys}
+
+    try:
+        expected = dumps_with("simplejson", payload, **kwargs)
+    except (TypeError, ValueError) as ex:
+        with pytest.raises(type(ex)):
+            dumps_with("orjson", payload, **kwargs)
+        return
+
+    result = dumps_with("orjson", payload, **kwargs)
+    assert simplejson.loads(result) == simplejson.loads(expected)
+    assert list(simplejson.loads(result, object_pairs_hook=list)) == list(
+        simplejson.loads(expected, object_pairs_hook=list)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"separators": (",", ":")},
+        {"separators": (",", ":"), "sort_keys": True},
+        {"indent": 2},
+        {"indent": 2, "sort_keys": True},
+    ],
+)
+def test_dumps_formatting(kwargs: dict[str, Any]) -> None:
+    """
+    Test that the formatting orjson supports is byte-identical to simplejson.
+    """
+    payload = {"b": [1, {"d": [], "c": {}}], "a": "text", "c": [None, 1.5]}
+
+    assert dumps_with("orjson", payload, **kwargs) == dumps_with(
+        "simplejson", payload, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "payload,kwargs",
+    [
+        ({"big": 2**64}, {}),
+        ({1: "int key"}, {}),
+        ({"nan": math.nan}, {"ignore_nan": False, "allow_nan": True}),
+        ({"a": 1}, {"indent": 4}),
+        ({"a": 1}, {"separators": (", ", ": ")}),
+        ({"a": 1}, {"cls": json.DashboardEncoder}),
+    ],
+)
+def test_dumps_fallback(payload: Any, kwargs: dict[str, Any]) -> None:
+    """
+    Test that calls orjson can't serve identically are left to simplejson.
+    """
+    assert dumps_with("orjson", payload, **kwargs) == dumps_with(
+        "simplejson", payload, **kwargs
+    )
+
+
+def test_dumps_errors(orjson_backend: None) -> None:
+    """
+    Test that errors are the ones raised by simplejson.
+    """
+    with pytest.raises(ValueError, match="Out of range float values"):
+        json.dumps({"nan": math.nan}, ignore_nan=False)
+    with pytest.raises(TypeError, match="is not JSON serializable"):
+        json.dumps({"obj": object()}, default=None)
+    with pytest.raises(TypeError, match="Unserializable object"):
+        json.dumps({"dt64": np.datetime64()})
+
+
+def test_dumps_compact(orjson_backend: None) -> None:
+    """
+    Test that orjson output is compact and leaves non-ASCII characters unescaped.
+    """
+    assert json.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+
+
+def test_dumps_dataclass(orjson_backend: None) -> None:
+    """
+    Test that dataclasses are passed to the default handler like with simplejson.
+    """
+    assert json.dumps(Config("a"), default=lambda obj: obj.name) == '"a"'
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": [1, 2.5, "x", null, true, false], "b": {}}',
+        b'{"a": "\\u00e9\\ud83d\\ude00"}',
+        "[-9223372036854775808, 18446744073709551615, 0.1234567890123456789]",
+        '"\\ud800"',
+        "1e400",
+    ],
+)
+def test_loads_conformance(orjson_backend: None, document: Any) -> None:
+    """
+    Test that both backends parse documents to the same values.
+    """
+    assert json.loads(document) == simplejson.loads(document)
+
+
+@pytest.mark.parametrize(
+    "document",
+    ['{"a": NaN}', "{'a': 1}", "", "[1,]", b"[1] 2"],
+)
+def test_loads_errors(orjson_backend: None, document: Any) -> None:
+    """
+    Test that invalid documents raise the simplejson error.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(document)
+
+
+def test_loads_options(orjson_backend: None) -> None:
+    """
+    Test that options only supported by simplejson are honored.
+    """
+    assert math.isnan(json.loads('{"a": NaN}', allow_nan=True)["a"])
+    assert json.loads('{"a": 1}', object_hook=lambda obj: list(obj)) == ["a"]
+
+
+@pytest.mark.parametrize(
+    "document,expected",
+    [
+        ("[18446744073709551616]", [2**64]),
+        ('{"a": [-9223372036854775809]}', {"a": [-(2**63) - 1]}),
+        (b"[123456789012345678901234567890]", [123456789012345678901234567890]),
+    ],
+)
+def test_loads_long_integers(
+    orjson_backend: None,
+    document: Any,
+    expected: Any,
+) -> None:
+    """
+    Test that integers exceeding 64 bits are parsed as integers, like simplejson.
+    """
+    assert json.loads(document) == expected
+    assert repr(json.loads(document)) == repr(expected)
+
+
+def test_set_backend() -> None:
+    """
+    Test selecting the backend.
+    """
+    json.set_backend("orjson")
+    assert json.get_backend() == "orjson"
+    json.set_backend("simplejson")
+    assert json.get_backend() == "simplejson"
+
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        json.set_backend("ujson")  # type: ignore
+
+
+def test_set_backend_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that simplejson is used when orjson isn't installed.
+    """
+    monkeypatch.setattr(json, "orjson", None)
+
+    json.set_backend("orjson")
+
+    assert json.get_backend() == "simplejson"
@@ -14,9 +14,17 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
+from flask import current_app
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, select
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import AsyncDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +43,93 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_async_db_event_logger(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that `AsyncDBEventLogger` writes logs in batches, and flushes on shutdown.
+    """
+    batches: list[list[dict[str, Any]]] = []
+    mocker.patch.object(AsyncDBEventLogger, "_flush", side_effect=batches.append)
+    event_logger = AsyncDBEventLogger(batch_size=2, flush_interval=60)
+
+    event_logger.log(1, "view", None, 10, None, None, records=[{"path": "/a"}] * 3)
+    event_logger.shutdown()
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0]["action"] == "view"
+    assert batches[0][0]["json"] == '{"path": "/a"}'
+    assert isinstance(batches[0][0]["dttm"], datetime)
+
+
+def test_async_db_event_logger_full_queue(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that `AsyncDBEventLogger` drops logs when its queue is full.
+    """
+    mocker.patch.object(AsyncDBEventLogger, "_start")
+    event_logger = AsyncDBEventLogger(max_queue_size=2, block_timeout=0)
+
+    event_logger.log(1, "view", None, 10, None, None, records=[{}] * 3)
+
+    assert event_logger.dropped == 1
+
+
+def test_async_db_event_logger_shutdown_full_queue(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that `AsyncDBEventLogger` doesn't hang on shutdown when its queue is full.
+    """
+    flushing = threading.Event()
+    mocker.patch.object(
+        AsyncDBEventLogger, "_flush", side_effect=lambda batch: flushing.wait()
+    )
+    event_logger = AsyncDBEventLogger(batch_size=1, max_queue_size=1, block_timeout=0)
+
+    event_logger.log(1, "view", None, 10, None, None, records=[{}] * 3)
+    start = time.monotonic()
+    event_logger.shutdown(timeout=0.1)
+    assert time.monotonic() - start < 5
+    assert event_logger.dropped >= 1
+    flushing.set()
+
+
+def test_async_db_event_logger_flush(
+    mocker: MockerFixture,
+    app_context: None,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that `AsyncDBEventLogger` inserts the batches of logs.
+    """
+    from superset.models.core import Log
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'logs.db'}")
+    Log.__table__.create(engine)
+    mocker.patch("superset.db", mocker.MagicMock(engine=engine))
+    event_logger = AsyncDBEventLogger()
+    event_logger._app = current_app
+
+    dttm = datetime(2024, 1, 1)
+    event_logger._flush(
+        [
+            {**row, "dttm": dttm}
+            for row in event_logger.get_rows(
+                1, "view", 2, 10, None, None, [{"slice_id": 3}, {}]
+            )
+        ]
+    )
+
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select([Log.action, Log.dashboard_id, Log.slice_id, Log.dttm])
+        ).fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("view", 2, 3, dttm),
+        ("view", 2, None, dttm),
+    ]
+    assert event_logger.flushed == 2